@@ -3,7 +3,7 @@ import os
 from logging.config import fileConfig
 from alembic import context
 from app.db.database import Base  # Import your Base metadata
-from app.models import user # Import your models
+from app import models  # Import all models so their tables are in the metadata
 from dotenv import load_dotenv
 
 # Add the alembic folder to the Python path
@@ -0,0 +1,26 @@
+"""added role_id permission_id index to role_permissions
+
+Revision ID: 02902dfef581
+Revises: d2ffd3a4aa35
+Create Date: 2026-10-18 10:12:41.503117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '02902dfef581'
+down_revision: Union[str, None] = 'd2ffd3a4aa35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_role_permissions_role_id_permission_id', 'role_permissions', ['role_id', 'permission_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_role_permissions_role_id_permission_id', table_name='role_permissions')
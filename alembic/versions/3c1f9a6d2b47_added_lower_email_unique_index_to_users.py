@@ -0,0 +1,27 @@
+"""added lower email unique index to users
+
+Revision ID: 3c1f9a6d2b47
+Revises: ef6d9c5e8e53
+Create Date: 2026-10-18 21:12:05.407318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3c1f9a6d2b47'
+down_revision: Union[str, None] = 'ef6d9c5e8e53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Fails if existing emails differ only in letter case; those accounts must be merged first
+    op.create_index('ux_users_email_lower', 'users', [sa.text('lower(email)')], unique=True)
+
+
+def downgrade() -> None:
+    op.drop_index('ux_users_email_lower', table_name='users')
@@ -0,0 +1,62 @@
+"""added updated_at indexes and server timestamp defaults
+
+Revision ID: 7052590b1a70
+Revises: c007dd83fc8e
+Create Date: 2026-10-18 19:44:54.746230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7052590b1a70'
+down_revision: Union[str, None] = 'c007dd83fc8e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('permissions', 'roles', 'users', 'job_histories', 'role_permissions', 'tokens', 'products', 'services')
+UTC_NOW = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+
+
+def upgrade() -> None:
+    # The products and services tables were never part of the migration history;
+    # create them where they do not exist yet.
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    if 'products' not in existing:
+        op.create_table('products',
+        sa.Column('product_id', sa.Integer(), nullable=False),
+        sa.Column('product_name', sa.String(), nullable=False),
+        sa.Column('product_amount', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('product_id'),
+        sa.UniqueConstraint('product_name')
+        )
+        op.create_index(op.f('ix_products_product_id'), 'products', ['product_id'], unique=False)
+    if 'services' not in existing:
+        op.create_table('services',
+        sa.Column('service_id', sa.Integer(), nullable=False),
+        sa.Column('service_name', sa.String(), nullable=False),
+        sa.Column('total_amount', sa.Float(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint('service_id'),
+        sa.UniqueConstraint('service_name')
+        )
+        op.create_index(op.f('ix_services_service_id'), 'services', ['service_id'], unique=False)
+
+    for table in TABLES:
+        op.alter_column(table, 'created_at', server_default=UTC_NOW)
+        op.alter_column(table, 'updated_at', server_default=UTC_NOW)
+        op.create_index(op.f(f'ix_{table}_updated_at'), table, ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    # products and services are left in place: they may have existed before this revision.
+    for table in reversed(TABLES):
+        op.drop_index(op.f(f'ix_{table}_updated_at'), table_name=table)
+        op.alter_column(table, 'updated_at', server_default=None)
+        op.alter_column(table, 'created_at', server_default=None)
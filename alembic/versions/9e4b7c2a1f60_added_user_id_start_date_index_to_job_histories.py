@@ -0,0 +1,31 @@
+"""added user_id start_date index to job_histories
+
+Revision ID: 9e4b7c2a1f60
+Revises: 3c1f9a6d2b47
+Create Date: 2026-10-18 21:48:33.120947
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e4b7c2a1f60'
+down_revision: Union[str, None] = '3c1f9a6d2b47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_job_histories_user_id_start_date',
+        'job_histories',
+        ['user_id', sa.text('start_date DESC'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_job_histories_user_id_start_date', table_name='job_histories')
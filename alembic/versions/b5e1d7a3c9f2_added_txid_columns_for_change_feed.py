@@ -0,0 +1,38 @@
+"""added txid columns for change feed
+
+Revision ID: b5e1d7a3c9f2
+Revises: 9e4b7c2a1f60
+Create Date: 2026-10-18 23:12:40.517382
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5e1d7a3c9f2'
+down_revision: Union[str, None] = '9e4b7c2a1f60'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('products', 'services', 'job_histories')
+CURRENT_TXID = sa.text('txid_current()')
+
+
+def upgrade() -> None:
+    # Existing rows get the ID of this migration's transaction
+    for table in TABLES:
+        op.add_column(table, sa.Column('txid', sa.BigInteger(), server_default=CURRENT_TXID, nullable=False))
+        op.create_index(op.f(f'ix_{table}_txid'), table, ['txid'], unique=False)
+    op.add_column('tombstones', sa.Column('txid', sa.BigInteger(), server_default=CURRENT_TXID, nullable=False))
+    op.create_index('ix_tombstones_entity_txid_id', 'tombstones', ['entity', 'txid', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tombstones_entity_txid_id', table_name='tombstones')
+    op.drop_column('tombstones', 'txid')
+    for table in TABLES:
+        op.drop_index(op.f(f'ix_{table}_txid'), table_name=table)
+        op.drop_column(table, 'txid')
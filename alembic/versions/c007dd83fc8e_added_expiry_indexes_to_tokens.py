@@ -0,0 +1,28 @@
+"""added expiry indexes to tokens
+
+Revision ID: c007dd83fc8e
+Revises: 02902dfef581
+Create Date: 2026-10-18 11:04:27.318920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c007dd83fc8e'
+down_revision: Union[str, None] = '02902dfef581'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_tokens_expires_at'), 'tokens', ['expires_at'], unique=False)
+    op.create_index(op.f('ix_tokens_refresh_expires_at'), 'tokens', ['refresh_expires_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_tokens_refresh_expires_at'), table_name='tokens')
+    op.drop_index(op.f('ix_tokens_expires_at'), table_name='tokens')
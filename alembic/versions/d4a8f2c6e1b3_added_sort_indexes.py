@@ -0,0 +1,37 @@
+"""added sort indexes
+
+Revision ID: d4a8f2c6e1b3
+Revises: b5e1d7a3c9f2
+Create Date: 2026-10-18 23:58:06.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a8f2c6e1b3'
+down_revision: Union[str, None] = 'b5e1d7a3c9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, primary key, sort fields without a unique index)
+SORT_INDEXES = (
+    ('products', 'product_id', ('product_amount', 'created_at', 'updated_at')),
+    ('services', 'service_id', ('total_amount', 'created_at', 'updated_at')),
+    ('users', 'id', ('last_name', 'created_at', 'updated_at')),
+)
+
+
+def upgrade() -> None:
+    for table, pk, fields in SORT_INDEXES:
+        for field in fields:
+            op.create_index(f'ix_{table}_{field}_{pk}', table, [field, pk], unique=False)
+
+
+def downgrade() -> None:
+    for table, pk, fields in reversed(SORT_INDEXES):
+        for field in reversed(fields):
+            op.drop_index(f'ix_{table}_{field}_{pk}', table_name=table)
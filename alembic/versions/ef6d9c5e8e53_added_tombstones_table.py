@@ -0,0 +1,37 @@
+"""added tombstones table
+
+Revision ID: ef6d9c5e8e53
+Revises: 7052590b1a70
+Create Date: 2026-10-18 19:46:31.823044
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ef6d9c5e8e53'
+down_revision: Union[str, None] = '7052590b1a70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(length=50), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)"), nullable=False),
+    sa.Column('updated_at', sa.DateTime(), server_default=sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)"), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstones_entity_updated_at_id', 'tombstones', ['entity', 'updated_at', 'id'], unique=False)
+    op.create_index(op.f('ix_tombstones_updated_at'), 'tombstones', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_tombstones_updated_at'), table_name='tombstones')
+    op.drop_index('ix_tombstones_entity_updated_at_id', table_name='tombstones')
+    op.drop_table('tombstones')
@@ -2,10 +2,16 @@ from app.api.endpoints.users import router as users_router
 from app.api.endpoints.products import router as products_router
 from app.api.endpoints.services import router as services_router
 from app.api.endpoints.auth import router as auth_router
+from app.api.endpoints.internal import router as internal_router
+from app.api.endpoints.changes import router as changes_router
+from app.api.endpoints.job_history import router as job_history_router
 # Combine all routers in a list for easier imports
 routers = [
     {"router": users_router, "prefix": "/api/v1", "tags": ["users"]},
     {"router": products_router, "prefix": "/api/v1", "tags": ["products"]},
     {"router": services_router, "prefix": "/api/v1", "tags": ["services"]},
     {"router": auth_router, "prefix": "/api/v1", "tags": ["auth"]},
+    {"router": internal_router, "prefix": "/api/v1", "tags": ["internal"]},
+    {"router": changes_router, "prefix": "/api/v1", "tags": ["changes"]},
+    {"router": job_history_router, "prefix": "/api/v1", "tags": ["job-history"]},
 ]
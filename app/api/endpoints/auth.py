@@ -10,21 +10,21 @@ from app.db.database import get_db
 router = APIRouter()
 
 @router.post("/register", response_model=RegisterResponse, status_code=201)
-def register_user(user_data: RegisterRequest, db: Session = Depends(get_db)):
+async def register_user(user_data: RegisterRequest, db: Session = Depends(get_db)):
     """
     Endpoint to register a new user.
     """
     user_service = UserService(db)  # Instantiate UserService
-    return user_service.register_user(user_data)
+    return await user_service.register_user(user_data)
 
 
 @router.post("/login", response_model=RegisterResponse)
-def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login_user(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
     """
     Endpoint to authenticate a user.
     """
     user_service = UserService(db)  # Instantiate UserService
-    return user_service.login_user(form_data.username, form_data.password)
+    return await user_service.login_user(form_data.username, form_data.password)
 
 
 @router.post("/logout")
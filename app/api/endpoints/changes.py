@@ -0,0 +1,32 @@
+from fastapi import APIRouter, Depends, Path, Query
+from sqlalchemy.orm import Session
+from typing import Optional
+from app.core.config import config
+from app.db.database import get_db
+from app.db.dependency import ensure_admin, get_current_user
+from app.schemas.change import ChangeFeedResponse
+from app.schemas.principal import Principal
+from app.services.change_feed_service import ADMIN_FEED_ENTITIES, ChangeFeedService
+from app.utils.serialization_utils import json_response
+
+router = APIRouter()
+
+
+@router.get("/changes/{entity}", response_model=ChangeFeedResponse)
+def get_changes(
+    entity: str = Path(..., pattern="^(products|services|job_histories)$"),
+    since: Optional[str] = Query(None, description="Watermark returned by the previous call. Omit to start from the beginning."),
+    limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    Get the rows of an entity created, updated or deleted since a watermark.
+
+    Keep calling with the returned watermark while `has_more` is true, then poll with it later.
+    The job_histories feed covers every user and is only available to admins.
+    """
+    if entity in ADMIN_FEED_ENTITIES:
+        ensure_admin(current_user)
+    change_feed_service = ChangeFeedService(db)
+    return json_response(change_feed_service.get_changes(entity, since, limit))
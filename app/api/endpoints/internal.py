@@ -0,0 +1,36 @@
+from fastapi import APIRouter, Depends
+from app.db.database import get_pool_stats
+from app.db.dependency import get_current_admin, principal_cache
+from app.schemas.principal import Principal
+from app.services.catalog_cache import catalog_cache
+from app.services.permission_cache import permission_cache
+from app.services.token_service import token_purge_stats
+
+router = APIRouter()
+
+@router.get("/internal/pool-stats")
+def get_database_pool_stats(current_user: Principal = Depends(get_current_admin)):
+    """
+    Get connection pool occupancy and checkout wait times for this worker. Admins only.
+    """
+    return get_pool_stats()
+
+
+@router.get("/internal/cache-stats")
+def get_cache_stats(current_user: Principal = Depends(get_current_admin)):
+    """
+    Get size and hit/miss counters of the in-process caches of this worker. Admins only.
+    """
+    return {
+        "permissions": permission_cache.stats(),
+        "principals": principal_cache.stats(),
+        "catalog": catalog_cache.stats(),
+    }
+
+
+@router.get("/internal/token-purge-stats")
+def get_token_purge_stats(current_user: Principal = Depends(get_current_admin)):
+    """
+    Get the number of expired tokens purged by this worker and the time spent doing so. Admins only.
+    """
+    return token_purge_stats.snapshot()
@@ -1,62 +1,99 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from app.core.config import config
 from app.db.database import get_db
-from app.db.dependency import get_current_user
+from app.db.dependency import can_access_user, ensure_user_access, get_current_user
 from app.services.job_history_service import JobHistoryService
-from app.schemas.job_history import JobHistoryCreate, JobHistoryUpdate, JobHistoryResponse
-from app.models.user import User
+from app.schemas.job_history import (
+    JobHistoryCreate, JobHistoryUpdate, JobHistoryResponse, JobHistoryListResponse, JobHistoryBatchResponse
+)
+from app.schemas.principal import Principal
+from app.utils.serialization_utils import dump_rows, json_response
 
 router = APIRouter()
 
 
-@router.get("/job-history", response_model=List[JobHistoryResponse])
-async def get_user_jobs(
+@router.get("/job-history", response_model=JobHistoryListResponse)
+def get_user_jobs(
     user_id: int,
-    db: Session = Depends(get_db)
+    limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page."),
+    is_active: Optional[bool] = Query(None, description="Only return active (true) or past (false) jobs."),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
-    Get all job history entries for a specific user.
+    Get a page of a user's job history entries, most recent start date first. Pass the
+    returned `next_cursor` to fetch the following page. Only admins may list other users.
+    """
+    ensure_user_access(current_user, user_id)
+    job_history_service = JobHistoryService(db)
+    job_histories, next_cursor = job_history_service.get_user_jobs(user_id, limit, cursor, is_active)
+    return json_response({"job_histories": dump_rows(JobHistoryResponse, job_histories), "next_cursor": next_cursor})
+
+
+@router.get("/job-history/batch", response_model=JobHistoryBatchResponse)
+def get_jobs_for_users(
+    user_ids: List[int] = Query(
+        ..., min_length=1, max_length=config.JOB_HISTORY_BATCH_MAX_USERS,
+        description="Users to fetch job histories for, e.g. `?user_ids=1&user_ids=2`."
+    ),
+    is_active: Optional[bool] = Query(None, description="Only return active (true) or past (false) jobs."),
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user),
+):
+    """
+    Get the job histories of several users in one request, grouped by user id.
+
+    Replaces one `/job-history` call per user when building dashboards; all users are
+    loaded with a single query. Users the caller may not access (anyone but themselves,
+    unless they are an admin) are left out of the result.
     """
+    visible_ids = [user_id for user_id in user_ids if can_access_user(current_user, user_id)]
     job_history_service = JobHistoryService(db)
-    return job_history_service.get_user_jobs(user_id)
+    grouped = job_history_service.get_jobs_for_users(visible_ids, is_active)
+    return json_response({
+        "job_histories": {user_id: dump_rows(JobHistoryResponse, jobs) for user_id, jobs in grouped.items()}
+    })
 
 
 @router.post("/create-job-history", response_model=JobHistoryResponse, status_code=201)
-async def create_job_history(
+def create_job_history(
     job_history_data: JobHistoryCreate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
-    Create a new job history entry for the user.
+    Create a new job history entry for the user. Only admins may create entries for other users.
     """
+    ensure_user_access(current_user, job_history_data.user_id)
     job_history_service = JobHistoryService(db)
     return job_history_service.create_job_history(job_history_data)
 
 
 @router.put("/edit-job-history/{job_history_id}", response_model=JobHistoryResponse)
-async def edit_job_history(
+def edit_job_history(
     job_history_id: int,
     job_data: JobHistoryUpdate,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Update a job history entry by ID.
     """
     job_history_service = JobHistoryService(db)
-    return job_history_service.edit_job_history(job_history_id, job_data)
+    return job_history_service.edit_job_history(job_history_id, job_data, current_user)
 
 
 @router.delete("/delete-job-history/{job_history_id}")
-async def delete_job_history(
+def delete_job_history(
     job_history_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """
     Delete a job history entry by ID.
     """
     job_history_service = JobHistoryService(db)
-    return job_history_service.delete_job_history(job_history_id)
+    return job_history_service.delete_job_history(job_history_id, current_user)
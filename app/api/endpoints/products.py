@@ -1,50 +1,158 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from starlette.background import BackgroundTask
+from typing import Optional
+from app.core.config import config
+from app.utils.batch_utils import decode_batch
+from app.utils.conditional_utils import conditional_response, make_etag
+from app.utils.export_utils import EXPORT_MEDIA_TYPES, encode_export
+from app.utils.serialization_utils import dump_row, dump_rows, json_response
 from app.db.database import get_db
 from app.db.dependency import get_current_user
-from app.schemas.product import ProductCreate, ProductUpdate, ProductResponse, ProductListResponse
-from app.models.user import User
+from app.schemas.product import ProductCreate, ProductUpdate, ProductUpsert, ProductResponse, ProductListResponse
+from app.schemas.batch import BatchCreateResponse, BatchUpdateResponse, BatchUpsertResponse
+from app.schemas.principal import Principal
 from app.services.product_service import ProductService
 
 router = APIRouter()
 
 @router.get("/products", response_model=ProductListResponse)
-async def get_products(
+def get_products(
+    request: Request,
+    limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page."),
+    sort: Optional[str] = Query(None, description="Field to sort by, prefixed with '-' for descending order."),
     db: Session = Depends(get_db)):
     """
-    Get all products.
+    Get a page of products. Pass the returned `next_cursor` to fetch the following page.
+
+    Responds 304 Not Modified when no product changed since the client's copy, based on
+    the latest write and deletion of the table (see `DatabaseUtils.get_version`).
+    """
+    product_service = ProductService(db)
+    last_modified, version = product_service.get_products_version()
+    etag = make_etag("products", version, limit, cursor, sort)
+
+    def render(headers):
+        products, next_cursor = product_service.get_products_page(limit, cursor, sort)
+        return json_response({"products": dump_rows(ProductResponse, products), "next_cursor": next_cursor}, headers=headers)
+
+    return conditional_response(request, etag, last_modified, render)
+
+@router.get("/products/export")
+def export_products(
+    format: str = Query("ndjson", pattern="^(ndjson|json)$", description="Export format: ndjson or json."),
+    db: Session = Depends(get_db)):
+    """
+    Stream every product as NDJSON or as a JSON array.
+
+    Rows are read in batches from a server-side cursor and written as they arrive, so the
+    export runs in constant memory. The session is closed once the response has been sent.
     """
     product_service = ProductService(db)
-    products = product_service.get_all_products()
-    return {"products": products}
+    rows = product_service.stream_products()
+    return StreamingResponse(
+        encode_export(rows, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        background=BackgroundTask(db.close),
+    )
 
 @router.get("/products/{product_id}", response_model=ProductResponse)
-async def get_product_by_id(
+def get_product_by_id(
+    request: Request,
     product_id: int, 
     db: Session = Depends(get_db)):
     """
-    Get a product by its ID.
+    Get a product by its ID. Responds 304 Not Modified when the client's copy is current.
     """
     product_service = ProductService(db)
-    return product_service.get_product_by_id(product_id)
+    product = product_service.get_product_by_id(product_id)
+    return conditional_response(
+        request,
+        make_etag("product", product_id, product["updated_at"]),
+        product["updated_at"],
+        lambda headers: json_response(dump_row(ProductResponse, product), headers=headers),
+    )
 
 @router.post("/products", response_model=ProductResponse, status_code=201)
-async def create_product(
+def create_product(
     product_data: ProductCreate, 
     db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)):
+    current_user: Principal = Depends(get_current_user)):
     """
     Create a new product.
     """
     product_service = ProductService(db)
     return product_service.create_product(product_data)
 
+@router.post("/products/batch", response_model=BatchCreateResponse)
+async def create_products(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    """
+    Create many products from a JSON array, or NDJSON with `Content-Type: application/x-ndjson`.
+
+    Items are validated individually and inserted in chunks within one transaction.
+    Invalid and already existing items are skipped and reported in `results`.
+    """
+    items = decode_batch(await request.body(), request.headers.get("content-type"), config.BATCH_MAX_ITEMS)
+    product_service = ProductService(db)
+    return json_response(await run_in_threadpool(product_service.create_products, items))
+
+@router.patch("/products/batch", response_model=BatchUpdateResponse)
+async def update_products(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    """
+    Update many products by `product_id` from a JSON array, or NDJSON with
+    `Content-Type: application/x-ndjson`, e.g. to reprice part of the catalog.
+
+    Items setting the same fields are written together with one UPDATE per chunk, in one
+    transaction. Invalid and unknown items are skipped and reported in `results`.
+    """
+    items = decode_batch(await request.body(), request.headers.get("content-type"), config.BATCH_MAX_ITEMS)
+    product_service = ProductService(db)
+    return json_response(await run_in_threadpool(product_service.update_products, items))
+
+@router.put("/products/by-name", response_model=BatchUpsertResponse)
+async def upsert_products(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    """
+    Create or update many products by name from a JSON array, or NDJSON with
+    `Content-Type: application/x-ndjson`.
+
+    Each chunk of items is written with a single INSERT ... ON CONFLICT DO UPDATE.
+    Invalid items are skipped and reported in `results`.
+    """
+    items = decode_batch(await request.body(), request.headers.get("content-type"), config.BATCH_MAX_ITEMS)
+    product_service = ProductService(db)
+    return json_response(await run_in_threadpool(product_service.upsert_products, items))
+
+@router.put("/products/by-name/{product_name}", response_model=ProductResponse, responses={201: {"model": ProductResponse}})
+def upsert_product(
+    product_name: str,
+    data: ProductUpsert,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    """
+    Create the product with this name, or update it if it exists. Responds 201 when created.
+    """
+    product_service = ProductService(db)
+    product, created = product_service.upsert_product(product_name, data)
+    return json_response(dump_row(ProductResponse, product), status_code=201 if created else 200)
+
 @router.put("/products/{product_id}", response_model=ProductResponse)
-async def update_product(
+def update_product(
     product_id: int, 
     updated_data: ProductUpdate, 
     db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)):
+    current_user: Principal = Depends(get_current_user)):
     """
     Update an existing product by ID.
     """
@@ -52,10 +160,10 @@ async def update_product(
     return product_service.update_product(product_id, updated_data)
 
 @router.delete("/products/{product_id}")
-async def delete_product(
+def delete_product(
     product_id: int, 
     db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)):
+    current_user: Principal = Depends(get_current_user)):
     """
     Delete a product by ID.
     """
@@ -1,48 +1,155 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Request
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from starlette.concurrency import run_in_threadpool
+from starlette.background import BackgroundTask
+from typing import List, Optional
+from app.core.config import config
+from app.utils.batch_utils import decode_batch
+from app.utils.conditional_utils import conditional_response, make_etag
+from app.utils.export_utils import EXPORT_MEDIA_TYPES, encode_export
+from app.utils.serialization_utils import dump_row, dump_rows, json_response
 from app.db.database import get_db
 from app.db.dependency import get_current_user
-from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceResponse, ServiceListResponse
+from app.schemas.service import ServiceCreate, ServiceUpdate, ServiceUpsert, ServiceResponse, ServiceListResponse
 from app.services.service_service import ServiceService
-from app.models.user import User
+from app.schemas.batch import BatchCreateResponse, BatchUpdateResponse, BatchUpsertResponse
+from app.schemas.principal import Principal
 
 router = APIRouter()
 
 @router.get("/services", response_model=ServiceListResponse)
-async def get_services(db: Session = Depends(get_db)):
+def get_services(
+    request: Request,
+    limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page."),
+    sort: Optional[str] = Query(None, description="Field to sort by, prefixed with '-' for descending order."),
+    db: Session = Depends(get_db)):
     """
-    Get all services.
+    Get a page of services. Pass the returned `next_cursor` to fetch the following page.
+
+    Responds 304 Not Modified when no service changed since the client's copy, based on
+    the latest write and deletion of the table (see `DatabaseUtils.get_version`).
+    """
+    service_service = ServiceService(db)
+    last_modified, version = service_service.get_services_version()
+    etag = make_etag("services", version, limit, cursor, sort)
+
+    def render(headers):
+        services, next_cursor = service_service.get_services_page(limit, cursor, sort)
+        return json_response({"services": dump_rows(ServiceResponse, services), "next_cursor": next_cursor}, headers=headers)
+
+    return conditional_response(request, etag, last_modified, render)
+
+@router.get("/services/export")
+def export_services(
+    format: str = Query("ndjson", pattern="^(ndjson|json)$", description="Export format: ndjson or json."),
+    db: Session = Depends(get_db)):
+    """
+    Stream every service as NDJSON or as a JSON array.
+
+    Rows are read in batches from a server-side cursor and written as they arrive, so the
+    export runs in constant memory. The session is closed once the response has been sent.
     """
     service_service = ServiceService(db)
-    services = service_service.get_all_services()
-    return {"services": services}
+    rows = service_service.stream_services()
+    return StreamingResponse(
+        encode_export(rows, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        background=BackgroundTask(db.close),
+    )
 
 @router.get("/services/{service_id}", response_model=ServiceResponse)
-async def get_service_by_id(service_id: int, db: Session = Depends(get_db)):
+def get_service_by_id(request: Request, service_id: int, db: Session = Depends(get_db)):
     """
-    Get a service by its ID.
+    Get a service by its ID. Responds 304 Not Modified when the client's copy is current.
     """
     service_service = ServiceService(db)
-    return service_service.get_service_by_id(service_id)
+    service = service_service.get_service_by_id(service_id)
+    return conditional_response(
+        request,
+        make_etag("service", service_id, service["updated_at"]),
+        service["updated_at"],
+        lambda headers: json_response(dump_row(ServiceResponse, service), headers=headers),
+    )
 
 @router.post("/services", response_model=ServiceResponse, status_code=201)
-async def create_service(
+def create_service(
     service_data: ServiceCreate, 
     db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)):
+    current_user: Principal = Depends(get_current_user)):
     """
     Create a new service.
     """
     service_service = ServiceService(db)
     return service_service.create_service(service_data)
 
+@router.post("/services/batch", response_model=BatchCreateResponse)
+async def create_services(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    """
+    Create many services from a JSON array, or NDJSON with `Content-Type: application/x-ndjson`.
+
+    Items are validated individually and inserted in chunks within one transaction.
+    Invalid and already existing items are skipped and reported in `results`.
+    """
+    items = decode_batch(await request.body(), request.headers.get("content-type"), config.BATCH_MAX_ITEMS)
+    service_service = ServiceService(db)
+    return json_response(await run_in_threadpool(service_service.create_services, items))
+
+@router.patch("/services/batch", response_model=BatchUpdateResponse)
+async def update_services(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    """
+    Update many services by `service_id` from a JSON array, or NDJSON with
+    `Content-Type: application/x-ndjson`, e.g. to reprice part of the catalog.
+
+    Items setting the same fields are written together with one UPDATE per chunk, in one
+    transaction. Invalid and unknown items are skipped and reported in `results`.
+    """
+    items = decode_batch(await request.body(), request.headers.get("content-type"), config.BATCH_MAX_ITEMS)
+    service_service = ServiceService(db)
+    return json_response(await run_in_threadpool(service_service.update_services, items))
+
+@router.put("/services/by-name", response_model=BatchUpsertResponse)
+async def upsert_services(
+    request: Request,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    """
+    Create or update many services by name from a JSON array, or NDJSON with
+    `Content-Type: application/x-ndjson`.
+
+    Each chunk of items is written with a single INSERT ... ON CONFLICT DO UPDATE.
+    Invalid items are skipped and reported in `results`.
+    """
+    items = decode_batch(await request.body(), request.headers.get("content-type"), config.BATCH_MAX_ITEMS)
+    service_service = ServiceService(db)
+    return json_response(await run_in_threadpool(service_service.upsert_services, items))
+
+@router.put("/services/by-name/{service_name}", response_model=ServiceResponse, responses={201: {"model": ServiceResponse}})
+def upsert_service(
+    service_name: str,
+    data: ServiceUpsert,
+    db: Session = Depends(get_db),
+    current_user: Principal = Depends(get_current_user)):
+    """
+    Create the service with this name, or update it if it exists. Responds 201 when created.
+    """
+    service_service = ServiceService(db)
+    service, created = service_service.upsert_service(service_name, data)
+    return json_response(dump_row(ServiceResponse, service), status_code=201 if created else 200)
+
 @router.put("/services/{service_id}", response_model=ServiceResponse)
-async def update_service(
+def update_service(
     service_id: int, 
     updated_data: ServiceUpdate, 
     db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)):
+    current_user: Principal = Depends(get_current_user)):
     """
     Update an existing service by its ID.
     """
@@ -50,10 +157,10 @@ async def update_service(
     return service_service.update_service(service_id, updated_data)
 
 @router.delete("/services/{service_id}")
-async def delete_service(
+def delete_service(
     service_id: int, 
     db: Session = Depends(get_db), 
-    current_user: User = Depends(get_current_user)):
+    current_user: Principal = Depends(get_current_user)):
     """
     Delete a service by its ID.
     """
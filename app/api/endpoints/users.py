@@ -1,44 +1,50 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
+from app.core.config import config
 from app.db.database import get_db
 from app.db.dependency import get_current_user
 from app.services.user_service import UserService
-from app.schemas.user import UserResponse
-from app.models.user import User
+from app.schemas.user import UserResponse, UserListResponse
+from app.schemas.principal import Principal
+from app.utils.serialization_utils import dump_row, dump_rows, json_response
 
 router = APIRouter()
 
-@router.get("/users", response_model=List[UserResponse])
-async def get_users(
+@router.get("/users", response_model=UserListResponse)
+def get_users(
+    limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Cursor returned with the previous page."),
+    sort: Optional[str] = Query(None, description="Field to sort by, prefixed with '-' for descending order."),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
-    Get a list of all users.
+    Get a page of users. Pass the returned `next_cursor` to fetch the following page.
     """
     user_service = UserService(db)
-    return user_service.get_all_users()
+    users, next_cursor = user_service.get_users_page(limit, cursor, sort)
+    return json_response({"users": dump_rows(UserResponse, users), "next_cursor": next_cursor})
 
 
 @router.get("/users/{user_id}", response_model=UserResponse)
-async def get_user(
+def get_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Get a user by ID.
     """
     user_service = UserService(db)
-    return user_service.get_user_by_id(user_id)
+    return json_response(dump_row(UserResponse, user_service.get_user_by_id(user_id)))
 
 
 @router.delete("/users/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: int,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_user)
 ):
     """
     Delete a user by ID.
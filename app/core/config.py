@@ -16,14 +16,78 @@ class Config:
     ALGORITHM: str = os.getenv("ALGORITHM", "HS256")
     ACCESS_TOKEN_EXPIRE_MINUTES: int = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 30))
 
+    # Password hashing worker pool: concurrent bcrypt operations and how many may wait for a worker
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", os.cpu_count() or 1))
+    PASSWORD_HASH_MAX_QUEUE: int = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))
+
     # Refresh token expiration setting (in days)
     REFRESH_TOKEN_EXPIRE_DAYS: int = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", 7))
+
+    # Seconds between reloads of the in-memory token revocation list from the database
+    TOKEN_REVOCATION_REFRESH_SECONDS: float = float(os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", 30))
+    # Each reload re-reads revocations this many seconds older than the previous one, covering
+    # transactions that committed late and clock skew between workers
+    TOKEN_REVOCATION_OVERLAP_SECONDS: float = float(os.getenv("TOKEN_REVOCATION_OVERLAP_SECONDS", 60))
+
+    # Background purge of tokens whose refresh token has expired
+    TOKEN_PURGE_ENABLED: bool = os.getenv("TOKEN_PURGE_ENABLED", "true").lower() == "true"
+    TOKEN_PURGE_INTERVAL_SECONDS: float = float(os.getenv("TOKEN_PURGE_INTERVAL_SECONDS", 3600))
+    TOKEN_PURGE_BATCH_SIZE: int = int(os.getenv("TOKEN_PURGE_BATCH_SIZE", 10000))
+    TOKEN_PURGE_BATCH_PAUSE_SECONDS: float = float(os.getenv("TOKEN_PURGE_BATCH_PAUSE_SECONDS", 0.1))
+
+    # Authenticated principal cache, keyed by access token digest
+    PRINCIPAL_CACHE_MAX_SIZE: int = int(os.getenv("PRINCIPAL_CACHE_MAX_SIZE", 4096))
+    PRINCIPAL_CACHE_TTL_SECONDS: float = float(os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", 60))
+    # Users holding the role with this name may access the records of other users
+    ADMIN_ROLE_NAME: str = os.getenv("ADMIN_ROLE_NAME", "admin")
     # CORS settings
     ALLOWED_ORIGINS: list = os.getenv("ALLOWED_ORIGINS", "http://localhost:3000,http://127.0.0.1:3000").split(",")
 
     # Database settings
     DATABASE_URL: str = os.getenv("DATABASE_URL")
 
+    # Reload rows with a SELECT after add_and_commit/commit_and_refresh. Generated values are
+    # already fetched with RETURNING, so this is only needed for values set by triggers.
+    DB_REFRESH_AFTER_WRITE: bool = os.getenv("DB_REFRESH_AFTER_WRITE", "false").lower() == "true"
+
+    # Database connection pool settings (per engine, per worker process)
+    DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", 10))
+    DB_POOL_TIMEOUT: float = float(os.getenv("DB_POOL_TIMEOUT", 30))
+    DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", 1800))  # Seconds before a connection is replaced
+    DB_POOL_PRE_PING: bool = os.getenv("DB_POOL_PRE_PING", "false").lower() == "true"  # Ping on every checkout
+
+    # List endpoint page sizes (keyset pagination)
+    DEFAULT_PAGE_SIZE: int = int(os.getenv("DEFAULT_PAGE_SIZE", 100))
+    MAX_PAGE_SIZE: int = int(os.getenv("MAX_PAGE_SIZE", 1000))
+
+    # Rows fetched per round trip from the server-side cursor when streaming exports
+    EXPORT_BATCH_SIZE: int = int(os.getenv("EXPORT_BATCH_SIZE", 1000))
+
+    # Product/service lookup cache: "memory" (per-process LRU) or "shared" (shared backend stand-in)
+    CATALOG_CACHE_BACKEND: str = os.getenv("CATALOG_CACHE_BACKEND", "memory")
+    CATALOG_CACHE_MAX_SIZE: int = int(os.getenv("CATALOG_CACHE_MAX_SIZE", 10000))
+    CATALOG_CACHE_TTL_SECONDS: float = float(os.getenv("CATALOG_CACHE_TTL_SECONDS", 300))
+
+    # Batch create endpoints: items per request and rows per INSERT statement
+    BATCH_MAX_ITEMS: int = int(os.getenv("BATCH_MAX_ITEMS", 100000))
+    BATCH_CHUNK_SIZE: int = int(os.getenv("BATCH_CHUNK_SIZE", 1000))
+    # Batch job history lookup: user ids per request
+    JOB_HISTORY_BATCH_MAX_USERS: int = int(os.getenv("JOB_HISTORY_BATCH_MAX_USERS", 500))
+
+    # Change feed: watermarks older than this are rejected and the client syncs again from the start
+    CHANGE_FEED_WATERMARK_TTL_SECONDS: float = float(os.getenv("CHANGE_FEED_WATERMARK_TTL_SECONDS", 86400))
+    # Background purge of tombstones; keep them longer than the watermark TTL plus the
+    # longest transaction that deletes rows, or such a deletion can be missed
+    TOMBSTONE_PURGE_ENABLED: bool = os.getenv("TOMBSTONE_PURGE_ENABLED", "true").lower() == "true"
+    TOMBSTONE_PURGE_INTERVAL_SECONDS: float = float(os.getenv("TOMBSTONE_PURGE_INTERVAL_SECONDS", 3600))
+    TOMBSTONE_PURGE_BATCH_SIZE: int = int(os.getenv("TOMBSTONE_PURGE_BATCH_SIZE", 10000))
+    TOMBSTONE_RETENTION_SECONDS: float = float(os.getenv("TOMBSTONE_RETENTION_SECONDS", 604800))
+
+    # Permission cache settings
+    PERMISSION_CACHE_MAX_SIZE: int = int(os.getenv("PERMISSION_CACHE_MAX_SIZE", 1024))
+    PERMISSION_CACHE_TTL_SECONDS: float = float(os.getenv("PERMISSION_CACHE_TTL_SECONDS", 300))
+
 
 # Initialize a global `config` object for use throughout the app
 config = Config()
\ No newline at end of file
@@ -0,0 +1,54 @@
+import asyncio
+import logging
+from typing import Callable, Optional
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    Runs a blocking function in a worker thread at a fixed interval while the application is running.
+    """
+
+    def __init__(self, name: str, func: Callable[[], object], interval_seconds: float):
+        """
+        Initialize the job.
+
+        Args:
+            name (str): Name used in log messages.
+            func (Callable): Blocking function to run; it must manage its own database session.
+            interval_seconds (float): Seconds to wait between runs.
+        """
+        self.name = name
+        self.func = func
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await run_in_threadpool(self.func)
+            except Exception:
+                # A failed run must not stop the schedule; the next run retries
+                logger.exception("Periodic job %s failed", self.name)
+
+    def start(self) -> None:
+        """
+        Schedule the job on the running event loop.
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run_forever(), name=self.name)
+
+    async def stop(self) -> None:
+        """
+        Cancel the job and wait for it to finish.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
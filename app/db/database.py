@@ -3,6 +3,8 @@ from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
 from dotenv import load_dotenv
+from app.core.config import config
+from app.db.pool_stats import InstrumentedQueuePool
 
 # Load environment variables from the .env file
 load_dotenv()
@@ -14,9 +16,18 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise ValueError("DATABASE_URL is not set in the environment variables.")
 
+# Connection pool settings
+# Without pre-ping, stale connections are avoided by recycling them after DB_POOL_RECYCLE seconds
+POOL_OPTIONS = {
+    "pool_size": config.DB_POOL_SIZE,
+    "max_overflow": config.DB_MAX_OVERFLOW,
+    "pool_timeout": config.DB_POOL_TIMEOUT,
+    "pool_recycle": config.DB_POOL_RECYCLE,
+    "pool_pre_ping": config.DB_POOL_PRE_PING,
+}
+
 # Initialize the SQLAlchemy engine
-# Use `pool_pre_ping=True` to check if connections are alive
-engine = create_engine(DATABASE_URL, pool_pre_ping=True)
+engine = create_engine(DATABASE_URL, poolclass=InstrumentedQueuePool, **POOL_OPTIONS)
 
 # Create a configured "Session" class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -24,6 +35,12 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 # Base class for all models
 Base = declarative_base()
 
+def get_pool_stats() -> dict:
+    """
+    Report connection pool occupancy and checkout wait times.
+    """
+    return engine.pool.stats.snapshot(engine.pool)
+
 # Dependency for FastAPI to manage the session lifecycle
 def get_db():
     """
@@ -35,3 +52,4 @@ def get_db():
         yield db
     finally:
         db.close()
+
@@ -1,34 +1,135 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from sqlalchemy.orm import Session
-from app.db.database import SessionLocal
+from app.core.config import config
+from app.db.database import get_db
+from app.models.role import Role
+from app.models.role_permission import RolePermission
 from app.models.user import User
-from app.utils.token_utils import decode_access_token
+from app.schemas.principal import Principal
+from app.services.token_service import TokenService
+from app.utils.cache_utils import TTLCache
+from app.utils.revocation_utils import token_digest
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
-# Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Principals resolved from access tokens, shared by every request handled by this process.
+# Keyed by the token's SHA-256 digest, like the revocation list, so raw JWTs are not
+# kept in memory; evicted per user through `invalidate_principal`.
+principal_cache = TTLCache(
+    max_size=config.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=config.PRINCIPAL_CACHE_TTL_SECONDS,
+)
 
-# Dependency to get the current user
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)):
-    credentials_exception = HTTPException(
+
+def invalidate_principal(user_id: int = None) -> None:
+    """
+    Drop the cached principals of a user, e.g. after they were deleted or their roles
+    changed, or of every user when `user_id` is None.
+    """
+    if user_id is None:
+        principal_cache.delete_where(lambda digest: True)
+    else:
+        principal_cache.delete_values_where(lambda principal: principal.id == user_id)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    payload = decode_access_token(token)
+
+
+def _load_principal(db: Session, email: str) -> Principal:
+    """
+    Load the user's identity and roles in a single query, without hydrating a User.
+    """
+    rows = (
+        db.query(User.id, User.email, User.is_active, RolePermission.role_id, Role.name.label("role_name"))
+        .outerjoin(RolePermission, RolePermission.user_id == User.id)
+        .outerjoin(Role, Role.id == RolePermission.role_id)
+        .filter(User.email == email)
+        .all()
+    )
+    if not rows:
+        raise _credentials_exception()
+    user_id, user_email, is_active = rows[0][:3]
+    role_ids = tuple(sorted({row.role_id for row in rows if row.role_id is not None}))
+    is_admin = any(row.role_name == config.ADMIN_ROLE_NAME for row in rows)
+    return Principal(id=user_id, email=user_email, is_active=is_active, role_ids=role_ids, is_admin=is_admin)
+
+
+# Dependency to get the current user
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> Principal:
+    """
+    Resolve the authenticated user as a lightweight Principal.
+
+    The token signature, expiry and revocation are checked on every call, while the
+    principal itself is cached per token digest for PRINCIPAL_CACHE_TTL_SECONDS.
+    """
+    payload = TokenService(db).validate_access_token(token)
     if payload is None:
-        raise credentials_exception
+        raise _credentials_exception()
     email: str = payload.get("sub")
     if email is None:
-        raise credentials_exception
-    user = db.query(User).filter(User.email == email).first()
+        raise _credentials_exception()
+    return principal_cache.get_or_set(token_digest(token), lambda: _load_principal(db, email))
+
+
+# Dependency for admin-only endpoints
+def get_current_admin(current_user: Principal = Depends(get_current_user)) -> Principal:
+    """
+    Resolve the authenticated user and require the admin role.
+    """
+    ensure_admin(current_user)
+    return current_user
+
+
+# Dependency to get the full ORM model of the current user, for endpoints that need it
+def get_current_user_model(
+    current_user: Principal = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> User:
+    """
+    Load the full User for the authenticated principal.
+    """
+    user = db.get(User, current_user.id)
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
     return user
+
+
+def can_access_user(current_user: Principal, user_id: int) -> bool:
+    """
+    Return whether the principal may access a user's records: their own, or anyone's for an admin.
+    """
+    return current_user.id == user_id or current_user.is_admin
+
+
+def ensure_user_access(current_user: Principal, user_id: int) -> None:
+    """
+    Allow access to a user's records only to that user and to admins.
+
+    Raises:
+        HTTPException: 403 if the principal is neither the user nor an admin.
+    """
+    if not can_access_user(current_user, user_id):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not allowed to access another user's records",
+        )
+
+
+def ensure_admin(current_user: Principal) -> None:
+    """
+    Allow an operation only to admins.
+
+    Raises:
+        HTTPException: 403 if the principal is not an admin.
+    """
+    if not current_user.is_admin:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Admin role required",
+        )
@@ -0,0 +1,103 @@
+import threading
+import time
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import QueuePool
+
+# Upper bounds (in seconds) of the checkout wait time histogram buckets
+WAIT_TIME_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf"))
+
+
+class PoolStats:
+    """
+    Thread-safe counters describing how long requests wait for a pooled connection.
+    """
+
+    def __init__(self, buckets: tuple = WAIT_TIME_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """
+        Clear all recorded observations.
+        """
+        with self._lock:
+            self.checkouts = 0
+            self.timeouts = 0
+            self.wait_time_total = 0.0
+            self.wait_time_max = 0.0
+            self.bucket_counts = [0] * len(self.buckets)
+
+    def observe_wait(self, seconds: float) -> None:
+        """
+        Record the time a successful checkout spent waiting for a connection.
+        """
+        with self._lock:
+            self.checkouts += 1
+            self.wait_time_total += seconds
+            self.wait_time_max = max(self.wait_time_max, seconds)
+            for index, upper_bound in enumerate(self.buckets):
+                if seconds <= upper_bound:
+                    self.bucket_counts[index] += 1
+                    break
+
+    def record_timeout(self) -> None:
+        """
+        Record a checkout that gave up after the pool timeout.
+        """
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self, pool) -> dict:
+        """
+        Combine the live pool state with the recorded wait time histogram.
+
+        Args:
+            pool: The QueuePool the statistics belong to.
+
+        Returns:
+            dict: Pool occupancy and checkout wait time statistics.
+        """
+        with self._lock:
+            histogram = {
+                ("+Inf" if upper_bound == float("inf") else str(upper_bound)): count
+                for upper_bound, count in zip(self.buckets, self.bucket_counts)
+            }
+            return {
+                "pool_size": pool.size(),
+                "checked_out": pool.checkedout(),
+                "checked_in": pool.checkedin(),
+                "overflow": pool.overflow(),
+                "checkouts": self.checkouts,
+                "timeouts": self.timeouts,
+                "wait_time": {
+                    "total_seconds": self.wait_time_total,
+                    "max_seconds": self.wait_time_max,
+                    "buckets": histogram,
+                },
+            }
+
+
+class _InstrumentedPoolMixin:
+    """
+    Times every connection checkout and records it in the class level `stats`.
+    """
+    stats: PoolStats
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            self.stats.record_timeout()
+            raise
+        self.stats.observe_wait(time.perf_counter() - start)
+        return connection
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    """
+    QueuePool used by the sync engine.
+    """
+    stats = PoolStats()
+
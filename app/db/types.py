@@ -0,0 +1,68 @@
+from datetime import datetime, timezone
+from sqlalchemy import BigInteger, DateTime
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.types import TypeDecorator
+
+
+class utc_timestamp(FunctionElement):
+    """
+    Server-side current UTC time, for `server_default` and `onupdate` of `UTCDateTime` columns.
+
+    PostgreSQL's `now()` is converted to the session time zone when stored in a
+    `TIMESTAMP WITHOUT TIME ZONE` column, so it is shifted to UTC explicitly.
+    """
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utc_timestamp)
+def _compile_utc_timestamp(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utc_timestamp, "postgresql")
+def _compile_utc_timestamp_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+class current_txid(FunctionElement):
+    """
+    ID of the current transaction, for columns that record which transaction wrote a row.
+
+    PostgreSQL's `txid_current()` is 64-bit and never wraps, so IDs compare in the order
+    transactions started. Other databases get a constant; features that order by
+    transaction require PostgreSQL.
+    """
+    type = BigInteger()
+    inherit_cache = True
+
+
+@compiles(current_txid)
+def _compile_current_txid(element, compiler, **kw):
+    return "0"
+
+
+@compiles(current_txid, "postgresql")
+def _compile_current_txid_postgresql(element, compiler, **kw):
+    return "txid_current()"
+
+
+class UTCDateTime(TypeDecorator):
+    """
+    A naive DateTime column that accepts timezone-aware values.
+
+    Aware datetimes are converted to UTC and stored without tzinfo, so values
+    persist identically whatever the timezone of the connection.
+    """
+    impl = DateTime
+    cache_ok = True
+
+    @property
+    def python_type(self):
+        return datetime
+
+    def process_bind_param(self, value, dialect):
+        if value is not None and value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
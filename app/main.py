@@ -1,8 +1,57 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.api.endpoints import routers  # Import the routers list from the endpoints module
+from app.core.config import config
+from app.core.scheduler import PeriodicJob
+from app.db.database import SessionLocal
+from app.services.change_feed_service import ChangeFeedService
+from app.services.token_service import TokenService
 
-app = FastAPI()
+
+def purge_expired_tokens():
+    """
+    Delete expired tokens in batches using a dedicated session.
+    """
+    db = SessionLocal()
+    try:
+        TokenService(db).delete_expired_tokens(
+            batch_size=config.TOKEN_PURGE_BATCH_SIZE,
+            pause_seconds=config.TOKEN_PURGE_BATCH_PAUSE_SECONDS,
+        )
+    finally:
+        db.close()
+
+
+def purge_expired_tombstones():
+    """
+    Delete change feed tombstones past their retention in batches using a dedicated session.
+    """
+    db = SessionLocal()
+    try:
+        ChangeFeedService(db).delete_expired_tombstones(batch_size=config.TOMBSTONE_PURGE_BATCH_SIZE)
+    finally:
+        db.close()
+
+
+# Background jobs started with the application
+jobs = []
+if config.TOKEN_PURGE_ENABLED:
+    jobs.append(PeriodicJob("purge-expired-tokens", purge_expired_tokens, config.TOKEN_PURGE_INTERVAL_SECONDS))
+if config.TOMBSTONE_PURGE_ENABLED:
+    jobs.append(PeriodicJob("purge-expired-tombstones", purge_expired_tombstones, config.TOMBSTONE_PURGE_INTERVAL_SECONDS))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    for job in jobs:
+        job.start()
+    yield
+    for job in jobs:
+        await job.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 
 # Add CORS Middleware
 origins = ["http://localhost:3000", "http://127.0.0.1:3000"]
@@ -4,5 +4,8 @@ from app.models.role_permission import RolePermission
 from app.models.user import User
 from app.models.token import Token
 from app.models.job_history import JobHistory
+from app.models.product import Product
+from app.models.service import Service
+from app.models.tombstone import Tombstone
 
-__all__ = ["Permission", "Role", "User", "Token", "RolePermission", "JobHistory"]
\ No newline at end of file
+__all__ = ["Permission", "Role", "User", "Token", "RolePermission", "JobHistory", "Product", "Service", "Tombstone"]
\ No newline at end of file
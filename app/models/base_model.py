@@ -1,33 +1,38 @@
-from sqlalchemy import Column, DateTime
+from sqlalchemy import BigInteger, Column
 from sqlalchemy.ext.declarative import declared_attr
-from datetime import datetime, timezone
 from app.db.database import Base
+from app.db.types import UTCDateTime, current_txid, utc_timestamp
 
 
 class BaseModel(Base):
     __abstract__ = True  # Ensure this doesn't create a table
+    # Fetch server-generated values with RETURNING during INSERT/UPDATE instead of on next access
+    __mapper_args__ = {"eager_defaults": True}
     ## hello this is a comment
     @declared_attr
     def created_at(cls):
         """
-        Timestamp for when the record is created. Defaults to the current UTC time.
+        Timestamp for when the record is created. Set by the database to the current UTC
+        time, so every writer uses the same clock; read back with RETURNING.
         """
         return Column(
-            DateTime, 
-            default=datetime.now(timezone.utc), 
+            UTCDateTime,
+            server_default=utc_timestamp(),
             nullable=False
         )
 
     @declared_attr
     def updated_at(cls):
         """
-        Timestamp for when the record is last updated. Automatically updates to the current UTC time.
+        Timestamp for when the record is last updated. Set by the database to the current UTC time
+        on insert and on every ORM or Core UPDATE. Indexed for "changed since" queries.
         """
         return Column(
-            DateTime,
-            default=datetime.now(timezone.utc),
-            onupdate=datetime.now(timezone.utc),
-            nullable=False
+            UTCDateTime,
+            server_default=utc_timestamp(),
+            onupdate=utc_timestamp(),
+            nullable=False,
+            index=True
         )
 
     def to_dict(self):
@@ -41,3 +46,26 @@ class BaseModel(Base):
         Provide a readable string representation of the model.
         """
         return f"<{self.__class__.__name__} {self.to_dict()}>"
+
+
+class ChangeTrackedMixin:
+    """
+    Mixin for models exposed by the change feed.
+
+    Deleting an instance through the ORM, directly or by cascade, records a tombstone
+    (see `app.models.tombstone`).
+    """
+    @declared_attr
+    def txid(cls):
+        """
+        ID of the transaction that last inserted or updated the record. Unlike `updated_at`,
+        it lets the change feed tell which writes can no longer be committed behind it.
+        """
+        return Column(
+            BigInteger,
+            default=current_txid(),
+            server_default=current_txid(),
+            onupdate=current_txid(),
+            nullable=False,
+            index=True
+        )
@@ -1,13 +1,14 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, Index, Integer, String, ForeignKey, Boolean
 from sqlalchemy.orm import relationship, validates
-from app.models.base_model import BaseModel
+from app.db.types import UTCDateTime
+from app.models.base_model import BaseModel, ChangeTrackedMixin
 
 # Constants for column lengths
 MAX_LOCATION_LENGTH = 255
 MAX_DESCRIPTION_LENGTH = 1000
 
-class JobHistory(BaseModel):
+class JobHistory(ChangeTrackedMixin, BaseModel):
     """
     Represents the job history of a user, including details like location,
     description, and job duration.
@@ -60,18 +61,23 @@ class JobHistory(BaseModel):
     )
 
     start_date = Column(
-        DateTime,
+        UTCDateTime,
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
         doc="The start date of the job. Defaults to the current UTC time."
     )
 
     end_date = Column(
-        DateTime,
+        UTCDateTime,
         nullable=True,
         doc="The end date of the job. Nullable for active jobs."
     )
 
+    __table_args__ = (
+        # Serves a user's history listing, newest first, in one index scan
+        Index("ix_job_histories_user_id_start_date", "user_id", start_date.desc(), id.desc()),
+    )
+
     user = relationship(
         "User",
         back_populates="job_histories",
@@ -1,9 +1,9 @@
-from sqlalchemy import Column, Float, Integer, String
+from sqlalchemy import Column, Float, Index, Integer, String
 from sqlalchemy.orm import validates
-from app.models.base_model import BaseModel
+from app.models.base_model import BaseModel, ChangeTrackedMixin
 
 
-class Product(BaseModel):
+class Product(ChangeTrackedMixin, BaseModel):
     """
     Represents a product in the application.
 
@@ -14,6 +14,13 @@ class Product(BaseModel):
     """
 
     __tablename__ = "products"
+    __table_args__ = (
+        # Pages sorted by a non-unique field are read in (field, product_id) order straight from these;
+        # product_name is served by its unique index
+        Index("ix_products_product_amount_product_id", "product_amount", "product_id"),
+        Index("ix_products_created_at_product_id", "created_at", "product_id"),
+        Index("ix_products_updated_at_product_id", "updated_at", "product_id"),
+    )
 
     product_id = Column(
         Integer,
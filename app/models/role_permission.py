@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, ForeignKey, UniqueConstraint
+from sqlalchemy import Column, Integer, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship, validates
 from app.models.base_model import BaseModel
 
@@ -62,6 +62,10 @@ class RolePermission(BaseModel):
             "user_id", "role_id", "permission_id",
             name="uq_role_permission"
         ),
+        Index(
+            "ix_role_permissions_role_id_permission_id",
+            "role_id", "permission_id"
+        ),
     )
 
     @validates("user_id")
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, Integer, String, Float
+from sqlalchemy import Column, Index, Integer, String, Float
 from sqlalchemy.orm import validates
-from app.models.base_model import BaseModel
+from app.models.base_model import BaseModel, ChangeTrackedMixin
 
-class Service(BaseModel):
+class Service(ChangeTrackedMixin, BaseModel):
     """
     Represents a service offered by the application.
 
@@ -13,6 +13,13 @@ class Service(BaseModel):
     """
 
     __tablename__ = "services"
+    __table_args__ = (
+        # Pages sorted by a non-unique field are read in (field, service_id) order straight from these;
+        # service_name is served by its unique index
+        Index("ix_services_total_amount_service_id", "total_amount", "service_id"),
+        Index("ix_services_created_at_service_id", "created_at", "service_id"),
+        Index("ix_services_updated_at_service_id", "updated_at", "service_id"),
+    )
 
     service_id = Column(
         Integer,
@@ -1,6 +1,7 @@
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey
 from sqlalchemy.orm import relationship, validates
+from app.db.types import UTCDateTime
 from app.models.base_model import BaseModel
 
 
@@ -41,14 +42,16 @@ class Token(BaseModel):
     )
 
     expires_at = Column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
+        index=True,
         doc="Expiration time for the access token. Cannot be null."
     )
 
     refresh_expires_at = Column(
-        DateTime,
+        UTCDateTime,
         nullable=False,
+        index=True,
         doc="Expiration time for the refresh token. Cannot be null."
     )
 
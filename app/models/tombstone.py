@@ -0,0 +1,57 @@
+from sqlalchemy import BigInteger, Column, Index, Integer, String, event, insert
+from app.db.types import current_txid
+from app.models.base_model import BaseModel, ChangeTrackedMixin
+
+
+class Tombstone(BaseModel):
+    """
+    Records the deletion of a row so the change feed can report it.
+
+    Attributes:
+        id (int): Primary key identifier for the tombstone.
+        entity (str): Change feed entity of the deleted row, e.g. "products".
+        entity_id (int): Primary key of the deleted row.
+        txid (int): ID of the transaction that deleted the row.
+        updated_at (datetime): When the row was deleted (inherited from BaseModel).
+    """
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_entity_updated_at_id", "entity", "updated_at", "id"),
+        Index("ix_tombstones_entity_txid_id", "entity", "txid", "id"),
+    )
+
+    id = Column(
+        Integer,
+        primary_key=True,
+        doc="Primary key identifier for the tombstone."
+    )
+
+    entity = Column(
+        String(50),
+        nullable=False,
+        doc="Change feed entity of the deleted row, e.g. 'products'."
+    )
+
+    entity_id = Column(
+        Integer,
+        nullable=False,
+        doc="Primary key of the deleted row."
+    )
+
+    txid = Column(
+        BigInteger,
+        default=current_txid(),
+        server_default=current_txid(),
+        nullable=False,
+        doc="ID of the transaction that deleted the row."
+    )
+
+
+@event.listens_for(ChangeTrackedMixin, "after_delete", propagate=True)
+def record_tombstone(mapper, connection, target):
+    """
+    Write a tombstone in the flush that deletes a change-tracked row, whether it was
+    deleted directly or by an ORM cascade. Core DELETE statements bypass this.
+    """
+    entity_id = mapper.primary_key_from_instance(target)[0]
+    connection.execute(insert(Tombstone).values(entity=mapper.local_table.name, entity_id=entity_id))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean
+from sqlalchemy import Column, Index, Integer, String, Boolean, func
 from sqlalchemy.orm import relationship, validates
 from app.models.base_model import BaseModel
 
@@ -53,6 +53,16 @@ class User(BaseModel):
         doc="Indicates whether the user's account is active. Defaults to False."
     )
 
+    __table_args__ = (
+        # Case-insensitive uniqueness; registration relies on it instead of checking first
+        Index("ux_users_email_lower", func.lower(email), unique=True),
+        # Pages sorted by a non-unique field are read in (field, id) order straight from these;
+        # email is served by its unique index
+        Index("ix_users_last_name_id", "last_name", "id"),
+        Index("ix_users_created_at_id", "created_at", "id"),
+        Index("ix_users_updated_at_id", "updated_at", "id"),
+    )
+
     tokens = relationship(
         "Token",
         back_populates="user",
@@ -68,6 +78,7 @@ class User(BaseModel):
     job_histories = relationship(
         "JobHistory",
         back_populates="user",
+        order_by="(JobHistory.start_date.desc(), JobHistory.id.desc())",
         doc="Relationship to the JobHistory model, representing the user's job history."
     )
 
@@ -0,0 +1,82 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import List, Literal, Optional
+
+
+class BatchItemResult(BaseModel):
+    """
+    Outcome of one item of a batch request.
+    """
+    index: int = Field(..., description="Position of the item in the request.")
+    status: Literal["created", "updated", "unchanged", "failed"]
+    id: Optional[int] = Field(None, description="ID of the created or matched record.")
+    error: Optional[str] = Field(None, description="Why the item was rejected.")
+
+
+class BatchCreateResponse(BaseModel):
+    """
+    Fields returned by the batch create endpoints.
+    """
+    created: int = Field(..., description="Number of records created.")
+    failed: int = Field(..., description="Number of items rejected.")
+    results: List[BatchItemResult]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "created": 1,
+                "failed": 1,
+                "results": [
+                    {"index": 0, "status": "created", "id": 1},
+                    {"index": 1, "status": "failed", "error": "Product with product_name 'Laptop' already exists"},
+                ],
+            }
+        },
+    )
+
+
+class BatchUpsertResponse(BaseModel):
+    """
+    Fields returned by the bulk upsert endpoints.
+    """
+    created: int = Field(..., description="Number of records created.")
+    updated: int = Field(..., description="Number of existing records changed.")
+    unchanged: int = Field(..., description="Number of existing records that already matched.")
+    failed: int = Field(..., description="Number of items rejected.")
+    results: List[BatchItemResult]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "created": 1,
+                "updated": 1,
+                "unchanged": 0,
+                "failed": 0,
+                "results": [
+                    {"index": 0, "status": "created", "id": 3},
+                    {"index": 1, "status": "updated", "id": 1},
+                ],
+            }
+        },
+    )
+
+
+class BatchUpdateResponse(BaseModel):
+    """
+    Fields returned by the batch update endpoints.
+    """
+    updated: int = Field(..., description="Number of records updated.")
+    failed: int = Field(..., description="Number of items rejected.")
+    results: List[BatchItemResult]
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "updated": 1,
+                "failed": 1,
+                "results": [
+                    {"index": 0, "status": "updated", "id": 1},
+                    {"index": 1, "status": "failed", "error": "Product with ID 99 not found"},
+                ],
+            }
+        },
+    )
@@ -0,0 +1,40 @@
+from pydantic import BaseModel, ConfigDict, Field
+from datetime import datetime
+from typing import Any, Dict, List, Literal, Optional
+
+
+class ChangeResponse(BaseModel):
+    """
+    A single change in the change feed.
+    """
+    op: Literal["upsert", "delete"] = Field(..., description="Whether the row was created/updated or deleted.")
+    id: int = Field(..., description="Primary key of the changed row.")
+    updated_at: datetime = Field(..., description="When the change happened.")
+    data: Optional[Dict[str, Any]] = Field(None, description="Current row for upserts; absent for deletes.")
+
+
+class ChangeFeedResponse(BaseModel):
+    """
+    Fields returned by the change feed.
+    """
+    changes: List[ChangeResponse]
+    watermark: str = Field(..., description="Pass back as `since` to receive the following changes.")
+    has_more: bool = Field(..., description="Whether more changes are ready to be fetched immediately.")
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "changes": [
+                    {
+                        "op": "upsert",
+                        "id": 1,
+                        "updated_at": "2024-01-01T00:00:00",
+                        "data": {"product_id": 1, "product_name": "Smartphone", "product_amount": 699.99},
+                    },
+                    {"op": "delete", "id": 2, "updated_at": "2024-01-01T00:05:00"},
+                ],
+                "watermark": "eyJlbnRpdHkiOiJwcm9kdWN0cyJ9",
+                "has_more": False,
+            }
+        },
+    )
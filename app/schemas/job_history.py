@@ -1,6 +1,6 @@
-from pydantic import BaseModel, Field, field_validator, ConfigDict
-from datetime import datetime
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator, ConfigDict, ValidationInfo
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
 
 
 class JobHistoryBase(BaseModel):
@@ -14,8 +14,8 @@ class JobHistoryBase(BaseModel):
     end_date: Optional[datetime] = None
 
     @field_validator("end_date")
-    def validate_active_and_end_date(cls, end_date, values):
-        is_active = values.get("is_active")
+    def validate_active_and_end_date(cls, end_date, info: ValidationInfo):
+        is_active = info.data.get("is_active")
         if is_active and end_date is not None:
             raise ValueError("An active job can't have an end date.")
         if not is_active and end_date is None:
@@ -24,7 +24,10 @@ class JobHistoryBase(BaseModel):
 
     @field_validator("start_date")
     def validate_start_date(cls, start_date):
-        if start_date > datetime.now():
+        # Dates without an offset are taken as UTC, matching how they are stored
+        if start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=timezone.utc)
+        if start_date > datetime.now(timezone.utc):
             raise ValueError("Start date cannot be in the future.")
         return start_date
 
@@ -42,13 +45,13 @@ class JobHistoryUpdate(BaseModel):
     """
     location: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = Field(None, max_length=500)
-    is_active: Optional[bool]
-    start_date: Optional[datetime]
-    end_date: Optional[datetime]
+    is_active: Optional[bool] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
 
     @field_validator("end_date")
-    def validate_update_active_and_end_date(cls, end_date, values):
-        is_active = values.get("is_active")
+    def validate_update_active_and_end_date(cls, end_date, info: ValidationInfo):
+        is_active = info.data.get("is_active")
         if is_active is not None:
             if is_active and end_date is not None:
                 raise ValueError("An active job can't have an end date.")
@@ -67,3 +70,20 @@ class JobHistoryResponse(JobHistoryBase):
     model_config = ConfigDict(
         from_attributes=True  # Replaces `orm_mode`
     )
+
+
+class JobHistoryListResponse(BaseModel):
+    """
+    Fields returned in API responses for a page of a user's job histories.
+    """
+    job_histories: List[JobHistoryResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, or null on the last page.")
+
+
+class JobHistoryBatchResponse(BaseModel):
+    """
+    Fields returned in API responses for the job histories of several users.
+    """
+    job_histories: Dict[int, List[JobHistoryResponse]] = Field(
+        ..., description="Job histories of each requested user the caller may access, newest start date first."
+    )
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Tuple
+
+
+class Principal(BaseModel):
+    """
+    Lightweight, immutable identity of the authenticated user.
+    Returned by `get_current_user` instead of a full ORM User.
+    """
+    id: int = Field(..., description="The unique identifier of the user.")
+    email: str = Field(..., description="The email address of the user.")
+    is_active: bool = Field(..., description="Whether the user's account is active.")
+    role_ids: Tuple[int, ...] = Field(default=(), description="The roles assigned to the user.")
+    is_admin: bool = Field(default=False, description="Whether the user holds the admin role.")
+
+    model_config = ConfigDict(frozen=True)
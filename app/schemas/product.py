@@ -21,6 +21,18 @@ class ProductUpdate(BaseModel):
     product_name: Optional[str] = Field(None, max_length=255, description="The updated name of the product.")
     product_amount: Optional[float] = Field(None, gt=0, description="The updated amount or price of the product.")
 
+class ProductBatchUpdate(ProductUpdate):
+    """
+    One item of a batch product update: the product ID and the fields to change.
+    """
+    product_id: int = Field(..., description="The unique identifier of the product to update.")
+
+class ProductUpsert(BaseModel):
+    """
+    Fields set when upserting a product by name.
+    """
+    product_amount: float = Field(..., gt=0, description="The amount or price of the product.")
+
 class ProductResponse(ProductBase):
     """
     Fields returned in the API response for a single product.
@@ -43,6 +55,7 @@ class ProductListResponse(BaseModel):
     Fields returned in the API response for a list of products.
     """
     products: List[ProductResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, or null on the last page.")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -50,7 +63,8 @@ class ProductListResponse(BaseModel):
                 "products": [
                     {"product_id": 1, "product_name": "Smartphone", "product_amount": 699.99},
                     {"product_id": 2, "product_name": "Laptop", "product_amount": 1199.99},
-                ]
+                ],
+                "next_cursor": "eyJzb3J0IjoicHJvZHVjdF9pZCIsImFmdGVyIjpbMl19",
             }
         },
     )
@@ -21,6 +21,18 @@ class ServiceUpdate(BaseModel):
     service_name: Optional[str] = Field(None, max_length=255, description="The updated name of the service.")
     total_amount: Optional[float] = Field(None, gt=0, description="The updated total amount or cost of the service.")
 
+class ServiceBatchUpdate(ServiceUpdate):
+    """
+    One item of a batch service update: the service ID and the fields to change.
+    """
+    service_id: int = Field(..., description="The unique identifier of the service to update.")
+
+class ServiceUpsert(BaseModel):
+    """
+    Fields set when upserting a service by name.
+    """
+    total_amount: float = Field(..., gt=0, description="The total amount or cost of the service.")
+
 class ServiceResponse(ServiceBase):
     """
     Fields returned in the API response for a single service.
@@ -43,6 +55,7 @@ class ServiceListResponse(BaseModel):
     Fields returned in the API response for a list of services.
     """
     services: List[ServiceResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, or null on the last page.")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -50,7 +63,8 @@ class ServiceListResponse(BaseModel):
                 "services": [
                     {"service_id": 1, "service_name": "Website Development", "total_amount": 2500.00},
                     {"service_id": 2, "service_name": "SEO Optimization", "total_amount": 1200.00},
-                ]
+                ],
+                "next_cursor": "eyJzb3J0Ijoic2VydmljZV9pZCIsImFmdGVyIjpbMl19",
             }
         },
     )
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, EmailStr, Field, field_validator, ConfigDict
 from typing_extensions import Annotated
+from typing import List, Optional
 from datetime import datetime
 
 class UserResponse(BaseModel):
@@ -36,3 +37,8 @@ class UserResponse(BaseModel):
             }
         }
     )
+
+
+class UserListResponse(BaseModel):
+    users: List[UserResponse]
+    next_cursor: Optional[str] = Field(None, description="Cursor of the next page, or null on the last page.")
@@ -1,5 +1,8 @@
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
-from app.utils.database_utils import DatabaseUtils as _database
+from app.core.config import config
+from app.utils.batch_utils import validation_message
+from app.utils.database_utils import DatabaseUtils as _database, primary_key
 
 class BaseService:
     def __init__(self, db: Session):
@@ -7,3 +10,119 @@ class BaseService:
         Initialize the service with a database session and utilities.
         """
         self._database = _database(db)
+
+    def transaction(self, savepoint: bool = False):
+        """
+        Open a unit of work: the writes made by this service, and by any other service
+        sharing its session, inside the block are committed together when it exits.
+
+        Args:
+            savepoint (bool): Run a nested block in a SAVEPOINT.
+
+        Example:
+            with service.transaction():
+                ...
+        """
+        return self._database.transaction(savepoint=savepoint)
+
+    def _create_batch(self, model, schema, unique_column: str, items: list) -> dict:
+        """
+        Validate raw items against a create schema and insert the valid ones in bulk.
+
+        Args:
+            model: SQLAlchemy model class.
+            schema: Pydantic create schema each item must satisfy.
+            unique_column (str): Unique column identifying a record.
+            items (list): Decoded request items.
+
+        Returns:
+            dict: Created/failed counts and one result per item, in request order.
+        """
+        results = [None] * len(items)
+        rows, positions = [], []
+        for index, item in enumerate(items):
+            try:
+                rows.append(schema.model_validate(item).model_dump())
+                positions.append(index)
+            except ValidationError as e:
+                results[index] = {"index": index, "status": "failed", "error": validation_message(e)}
+
+        outcome = self._database.bulk_insert_rows(model, rows, unique_column, chunk_size=config.BATCH_CHUNK_SIZE)
+        for created in outcome["created"]:
+            index = positions[created["index"]]
+            results[index] = {"index": index, "status": "created", "id": created["id"]}
+        for failure in outcome["failed"]:
+            index = positions[failure["index"]]
+            results[index] = {"index": index, "status": "failed", "error": failure["error"]}
+
+        created_count = len(outcome["created"])
+        return {"created": created_count, "failed": len(items) - created_count, "results": results}
+
+    def _upsert_batch(self, model, schema, unique_column: str, items: list) -> dict:
+        """
+        Validate raw items against a create schema and insert or update them by a unique column.
+
+        Args:
+            model: SQLAlchemy model class.
+            schema: Pydantic create schema each item must satisfy.
+            unique_column (str): Unique column the items are matched on.
+            items (list): Decoded request items.
+
+        Returns:
+            dict: Counts per status and one result per item, in request order.
+        """
+        results = [None] * len(items)
+        rows, positions = [], []
+        for index, item in enumerate(items):
+            try:
+                rows.append(schema.model_validate(item).model_dump())
+                positions.append(index)
+            except ValidationError as e:
+                results[index] = {"index": index, "status": "failed", "error": validation_message(e)}
+
+        outcome = self._database.bulk_upsert_rows(model, rows, unique_column, chunk_size=config.BATCH_CHUNK_SIZE)
+        for upserted in outcome["upserted"]:
+            index = positions[upserted["index"]]
+            results[index] = {"index": index, "status": upserted["status"], "id": upserted["id"]}
+        for failure in outcome["failed"]:
+            index = positions[failure["index"]]
+            results[index] = {"index": index, "status": "failed", "error": failure["error"]}
+
+        counts = {status: 0 for status in ("created", "updated", "unchanged", "failed")}
+        for result in results:
+            counts[result["status"]] += 1
+        return {**counts, "results": results}
+
+
+    def _update_batch(self, model, schema, items: list) -> dict:
+        """
+        Validate raw items against a batch update schema and update the valid ones in bulk.
+
+        Args:
+            model: SQLAlchemy model class.
+            schema: Pydantic schema each item must satisfy, including the primary key.
+            items (list): Decoded request items.
+
+        Returns:
+            dict: Updated/failed counts and one result per item, in request order.
+        """
+        pk = primary_key(model).key
+        results = [None] * len(items)
+        rows, positions = [], []
+        for index, item in enumerate(items):
+            try:
+                rows.append(schema.model_validate(item).model_dump(exclude_unset=True))
+                positions.append(index)
+            except ValidationError as e:
+                results[index] = {"index": index, "status": "failed", "error": validation_message(e)}
+
+        outcome = self._database.bulk_update_rows(model, rows, chunk_size=config.BATCH_CHUNK_SIZE)
+        rejected = {failure["index"]: failure["error"] for failure in outcome["failed"]}
+        for position, index in enumerate(positions):
+            if position in rejected:
+                results[index] = {"index": index, "status": "failed", "error": rejected[position]}
+            else:
+                results[index] = {"index": index, "status": "updated", "id": rows[position][pk]}
+
+        updated_count = sum(result["status"] == "updated" for result in results)
+        return {"updated": updated_count, "failed": len(items) - updated_count, "results": results}
@@ -0,0 +1,42 @@
+from app.core.config import config
+from app.utils.cache_utils import CacheBackend, LocalSharedCache, TTLCache
+
+CACHE_BACKENDS = {
+    "memory": TTLCache,
+    "shared": LocalSharedCache,
+}
+
+
+def create_cache_backend(name: str, max_size: int, ttl: float) -> CacheBackend:
+    """
+    Build the cache backend registered under `name`.
+
+    Raises:
+        ValueError: If no backend is registered under `name`.
+    """
+    if name not in CACHE_BACKENDS:
+        raise ValueError(f"Unknown cache backend '{name}'. Expected one of: {', '.join(CACHE_BACKENDS)}")
+    return CACHE_BACKENDS[name](max_size=max_size, ttl=ttl)
+
+
+# Product and service lookups by ID, cached as column dicts.
+# Keys are "product:<product_id>" and "service:<service_id>".
+catalog_cache = create_cache_backend(
+    config.CATALOG_CACHE_BACKEND,
+    max_size=config.CATALOG_CACHE_MAX_SIZE,
+    ttl=config.CATALOG_CACHE_TTL_SECONDS,
+)
+
+
+def product_key(product_id: int) -> str:
+    """
+    Build the cache key of a product.
+    """
+    return f"product:{product_id}"
+
+
+def service_key(service_id: int) -> str:
+    """
+    Build the cache key of a service.
+    """
+    return f"service:{service_id}"
@@ -0,0 +1,145 @@
+import csv
+import io
+import json
+import time
+from typing import Callable, Iterable, Iterator, Optional
+from pydantic import ValidationError
+from app.models.product import Product
+from app.models.service import Service
+from app.schemas.product import ProductCreate
+from app.schemas.service import ServiceCreate
+from app.services.base_service import BaseService
+from app.utils.batch_utils import validation_message
+
+# Entities that can be imported: model, create schema and the unique column merged on
+IMPORT_ENTITIES = {
+    "products": (Product, ProductCreate, "product_name"),
+    "services": (Service, ServiceCreate, "service_name"),
+}
+
+# Rejected rows kept in the import report
+MAX_REPORTED_ERRORS = 100
+
+
+def read_records(stream: Iterable[str], input_format: str) -> Iterator[tuple]:
+    """
+    Yield (line number, record) pairs from CSV (with a header row) or NDJSON text.
+
+    Lines that are not valid JSON are yielded with a ValueError in place of the record.
+    """
+    if input_format == "csv":
+        reader = csv.DictReader(stream)
+        for record in reader:
+            yield reader.line_num, record
+        return
+    for number, line in enumerate(stream, start=1):
+        if line.strip():
+            try:
+                yield number, json.loads(line)
+            except ValueError as e:
+                yield number, ValueError(f"Invalid JSON: {e}")
+
+
+class CatalogImportService(BaseService):
+    def import_records(
+        self,
+        entity: str,
+        records: Iterable[tuple],
+        batch_size: int = 10000,
+        progress: Optional[Callable[[dict], None]] = None,
+    ) -> dict:
+        """
+        Bulk load products or services with COPY and merge them on their unique name.
+
+        Records are validated with the create schema and the model validators, then
+        streamed in batches with `COPY ... FROM STDIN` into a temporary staging table.
+        A single INSERT ... ON CONFLICT DO UPDATE then merges the staging table into the
+        target table (the last record wins when a name repeats) and the transaction is
+        committed. Only the given columns are changed on existing rows. Requires
+        PostgreSQL with psycopg2.
+
+        Args:
+            entity (str): One of IMPORT_ENTITIES.
+            records (Iterable[tuple]): (line number, record dict) pairs, see `read_records`.
+            batch_size (int): Records sent per COPY.
+            progress (Callable): Called with the running statistics after each batch.
+
+        Returns:
+            dict: Row counts, rejected records (up to MAX_REPORTED_ERRORS), duration and rows/sec.
+        """
+        model, schema, unique_column = IMPORT_ENTITIES[entity]
+        columns = list(schema.model_fields)
+        table = model.__tablename__
+        staging = f"import_{table}"
+        session = self._database.db
+        connection = session.connection()
+        dialect = connection.dialect
+
+        definitions = ", ".join(f"{name} {model.__table__.c[name].type.compile(dialect=dialect)}" for name in columns)
+        connection.exec_driver_sql(
+            f"CREATE TEMPORARY TABLE {staging} (import_seq BIGSERIAL, {definitions}) ON COMMIT DROP"
+        )
+        cursor = connection.connection.cursor()
+        copy_sql = f"COPY {staging} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+
+        stats = {"read": 0, "loaded": 0, "rejected": 0, "inserted": 0, "updated": 0, "errors": []}
+        started = time.perf_counter()
+
+        def report():
+            elapsed = time.perf_counter() - started
+            stats["seconds"] = round(elapsed, 3)
+            stats["rows_per_second"] = round(stats["read"] / elapsed, 1) if elapsed else 0.0
+            return stats
+
+        def flush(buffer: io.StringIO):
+            buffer.seek(0)
+            cursor.copy_expert(copy_sql, buffer)
+            if progress:
+                progress(report())
+
+        try:
+            buffer, buffered = io.StringIO(), 0
+            writer = csv.writer(buffer)
+            for line, record in records:
+                stats["read"] += 1
+                try:
+                    if isinstance(record, Exception):
+                        raise record
+                    values = self._database.validate_values(model, schema.model_validate(record).model_dump())
+                except (ValidationError, ValueError) as e:
+                    stats["rejected"] += 1
+                    if len(stats["errors"]) < MAX_REPORTED_ERRORS:
+                        message = validation_message(e) if isinstance(e, ValidationError) else str(e)
+                        stats["errors"].append({"line": line, "error": message})
+                    continue
+                writer.writerow([values[name] for name in columns])
+                stats["loaded"] += 1
+                buffered += 1
+                if buffered >= batch_size:
+                    flush(buffer)
+                    buffer, buffered = io.StringIO(), 0
+                    writer = csv.writer(buffer)
+            if buffered:
+                flush(buffer)
+
+            column_list = ", ".join(columns)
+            updates = ", ".join(f"{name} = EXCLUDED.{name}" for name in columns if name != unique_column)
+            changed = " OR ".join(f"{table}.{name} IS DISTINCT FROM EXCLUDED.{name}" for name in columns if name != unique_column)
+            merge = connection.exec_driver_sql(
+                f"INSERT INTO {table} ({column_list}, created_at, updated_at) "
+                f"SELECT DISTINCT ON ({unique_column}) {column_list}, "
+                f"TIMEZONE('utc', clock_timestamp()), TIMEZONE('utc', clock_timestamp()) "
+                f"FROM {staging} ORDER BY {unique_column}, import_seq DESC "
+                f"ON CONFLICT ({unique_column}) DO UPDATE SET {updates}, updated_at = EXCLUDED.updated_at, txid = EXCLUDED.txid "
+                f"WHERE {changed} "
+                f"RETURNING (xmax = 0) AS inserted"
+            )
+            for (inserted,) in merge:
+                stats["inserted" if inserted else "updated"] += 1
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            cursor.close()
+        return report()
@@ -0,0 +1,155 @@
+import time
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
+from sqlalchemy import delete, func, select, tuple_
+from app.core.config import config
+from app.models.job_history import JobHistory
+from app.models.product import Product
+from app.models.service import Service
+from app.models.tombstone import Tombstone
+from app.schemas.job_history import JobHistoryResponse
+from app.schemas.product import ProductResponse
+from app.schemas.service import ServiceResponse
+from app.services.base_service import BaseService
+from app.utils.database_utils import primary_key
+from app.utils.pagination_utils import decode_cursor, encode_cursor
+from app.utils.serialization_utils import dump_row
+
+# Entities exposed by the change feed: model and the schema of the row data it returns
+FEED_ENTITIES = {
+    "products": (Product, ProductResponse),
+    "services": (Service, ServiceResponse),
+    "job_histories": (JobHistory, JobHistoryResponse),
+}
+# Entities whose rows belong to individual users. Tombstones do not record the owner, so
+# deletions cannot be filtered per user and these feeds are only served to admins.
+ADMIN_FEED_ENTITIES = {"job_histories"}
+
+
+def _decode_position(position) -> tuple:
+    """
+    Convert a [txid, id] watermark component back to Python values.
+    """
+    if position is None:
+        return None
+    if not isinstance(position, list) or len(position) != 2:
+        raise HTTPException(status_code=400, detail="Invalid change feed watermark")
+    try:
+        return int(position[0]), int(position[1])
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid change feed watermark")
+
+
+class ChangeFeedService(BaseService):
+    def get_changes(self, entity: str, watermark: str = None, limit: int = 100) -> dict:
+        """
+        Return the rows of an entity changed, and the rows deleted, after a watermark.
+
+        Changed rows and tombstones are read in `(txid, id)` order and merged, so a client
+        that passes back the returned watermark receives every change exactly once. Only
+        writes of transactions older than every transaction still in progress (the snapshot
+        `xmin`) are returned: no write can commit behind them any more, however long the
+        transaction that made it ran. Changes of open transactions are returned once they
+        and every older transaction have finished. Requires PostgreSQL.
+
+        Args:
+            entity (str): One of FEED_ENTITIES.
+            watermark (str): Opaque watermark returned by the previous call, if any.
+            limit (int): Maximum number of changes to return.
+
+        Returns:
+            dict: `changes`, the `watermark` to resume from and whether more changes are ready.
+
+        Raises:
+            HTTPException: 400 if the watermark is malformed or belongs to another entity,
+            410 if it is older than CHANGE_FEED_WATERMARK_TTL_SECONDS and deletions may
+            have been pruned since; the client has to sync again from the beginning.
+        """
+        model, schema = FEED_ENTITIES[entity]
+        pk = primary_key(model)
+        rows_after, tombstones_after = None, None
+        now = datetime.now(timezone.utc)
+        if watermark:
+            state = decode_cursor(watermark)
+            if state.get("entity") != entity:
+                raise HTTPException(status_code=400, detail="Change feed watermark belongs to another entity")
+            rows_after = _decode_position(state.get("rows"))
+            tombstones_after = _decode_position(state.get("tombstones"))
+            try:
+                issued_at = datetime.fromisoformat(state["issued_at"])
+            except (KeyError, TypeError, ValueError):
+                raise HTTPException(status_code=400, detail="Invalid change feed watermark")
+            if now - issued_at > timedelta(seconds=config.CHANGE_FEED_WATERMARK_TTL_SECONDS):
+                raise HTTPException(status_code=410, detail="Change feed watermark expired; sync again from the beginning")
+
+        db = self._database.db
+        horizon = db.execute(select(func.txid_snapshot_xmin(func.txid_current_snapshot()))).scalar_one()
+
+        rows_query = db.query(model).filter(model.txid < horizon)
+        if rows_after:
+            rows_query = rows_query.filter(tuple_(model.txid, pk) > tuple_(*rows_after))
+        rows = rows_query.order_by(model.txid, pk).limit(limit + 1).all()
+
+        tombstones_query = db.query(Tombstone).filter(Tombstone.entity == entity, Tombstone.txid < horizon)
+        if tombstones_after:
+            tombstones_query = tombstones_query.filter(tuple_(Tombstone.txid, Tombstone.id) > tuple_(*tombstones_after))
+        tombstones = tombstones_query.order_by(Tombstone.txid, Tombstone.id).limit(limit + 1).all()
+
+        merged = sorted(
+            [(row.txid, 0, getattr(row, pk.key), row) for row in rows]
+            + [(tombstone.txid, 1, tombstone.id, tombstone) for tombstone in tombstones],
+            key=lambda item: item[:3],
+        )
+        changes = []
+        for txid, is_tombstone, item_id, item in merged[:limit]:
+            if is_tombstone:
+                tombstones_after = (txid, item_id)
+                changes.append({"op": "delete", "id": item.entity_id, "updated_at": item.updated_at})
+            else:
+                rows_after = (txid, item_id)
+                changes.append({"op": "upsert", "id": item_id, "updated_at": item.updated_at, "data": dump_row(schema, item)})
+
+        return {
+            "changes": changes,
+            "watermark": encode_cursor({
+                "entity": entity,
+                "rows": rows_after,
+                "tombstones": tombstones_after,
+                "issued_at": now.isoformat(),
+            }),
+            "has_more": len(merged) > limit,
+        }
+
+    def delete_expired_tombstones(self, batch_size: int = None, pause_seconds: float = 0.0) -> int:
+        """
+        Delete tombstones older than TOMBSTONE_RETENTION_SECONDS.
+
+        Rows are removed with one DELETE per batch of at most `batch_size` rows, each
+        committed on its own, sleeping `pause_seconds` between batches. Watermarks expire
+        sooner (CHANGE_FEED_WATERMARK_TTL_SECONDS), so a client holding a valid watermark
+        only misses a deletion made by a transaction that stayed open for longer than
+        the difference.
+
+        Returns:
+            int: The number of tombstones deleted.
+        """
+        batch_size = batch_size or config.TOMBSTONE_PURGE_BATCH_SIZE
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=config.TOMBSTONE_RETENTION_SECONDS)
+        expired_ids = (
+            select(Tombstone.id)
+            .where(Tombstone.updated_at < cutoff)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+        statement = delete(Tombstone).where(Tombstone.id.in_(expired_ids)).execution_options(synchronize_session=False)
+
+        deleted = 0
+        while True:
+            result = self._database.db.execute(statement)
+            self._database.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                break
+            if pause_seconds:
+                time.sleep(pause_seconds)
+        return deleted
@@ -1,17 +1,61 @@
+from app.db.dependency import ensure_user_access
 from app.models.job_history import JobHistory
-from app.schemas.job_history import JobHistoryCreate, JobHistoryUpdate
+from app.schemas.job_history import JobHistoryCreate, JobHistoryUpdate, JobHistoryResponse
+from app.schemas.principal import Principal
 from app.services.base_service import BaseService
 from fastapi import HTTPException, status
 from datetime import datetime
 
+JOB_HISTORY_LIST_FIELDS = tuple(JobHistoryResponse.model_fields)
 
 class JobHistoryService(BaseService):
-    def get_user_jobs(self, user_id: int):
+    def get_user_jobs(self, user_id: int, limit: int, cursor: str = None, is_active: bool = None):
         """
-        Get all job history entries for a specific user.
+        Retrieve one page of a user's job histories, most recent start date first.
+
+        Pages are read from the (user_id, start_date DESC, id DESC) index.
+
+        Args:
+            user_id (int): The user whose job histories are listed.
+            limit (int): Maximum number of entries to return.
+            cursor (str): Cursor returned with the previous page, if any.
+            is_active (bool): Only return active (True) or past (False) jobs when set.
+
+        Returns:
+            tuple: (entries as dicts of the response fields, cursor of the next page or None).
+        """
+        filters = {"user_id": user_id}
+        if is_active is not None:
+            filters["is_active"] = is_active
+        return self._database.get_page(
+            JobHistory, limit, cursor=cursor, sort="-start_date", allowed_sorts=("start_date",),
+            filters=filters, columns=JOB_HISTORY_LIST_FIELDS
+        )
+
+    def get_jobs_for_users(self, user_ids: list, is_active: bool = None) -> dict:
         """
-        jobs = self._database.find_or_404(JobHistory, user_id=user_id)
-        return jobs
+        Retrieve the job histories of several users with a single query.
+
+        Args:
+            user_ids (list): The users whose job histories are fetched.
+            is_active (bool): Only return active (True) or past (False) jobs when set.
+
+        Returns:
+            dict: Entries as dicts of the response fields, most recent start date first, per
+            user id. Every requested user is present, with an empty list if they have none.
+        """
+        user_ids = list(dict.fromkeys(user_ids))
+        query = self._database.db.query(
+            *[getattr(JobHistory, field) for field in JOB_HISTORY_LIST_FIELDS]
+        ).filter(JobHistory.user_id.in_(user_ids))
+        if is_active is not None:
+            query = query.filter(JobHistory.is_active == is_active)
+        query = query.order_by(JobHistory.user_id, JobHistory.start_date.desc(), JobHistory.id.desc())
+
+        grouped = {user_id: [] for user_id in user_ids}
+        for row in query:
+            grouped[row.user_id].append(dict(row._mapping))
+        return grouped
 
     def create_job_history(self, job_history_data: JobHistoryCreate):
         """
@@ -20,22 +64,24 @@ class JobHistoryService(BaseService):
         new_job_history = JobHistory(**job_history_data.dict())
         return self._database.add_and_commit(new_job_history)
 
-    def edit_job_history(self, job_history_id: int, job_data: JobHistoryUpdate):
+    def edit_job_history(self, job_history_id: int, job_data: JobHistoryUpdate, current_user: Principal):
         """
-        Edit an existing job history entry.
+        Edit an existing job history entry of the current user, or of anyone for an admin.
         """
         job_history = self._database.get_by_id(JobHistory, job_history_id)
+        ensure_user_access(current_user, job_history.user_id)
 
         for key, value in job_data.model_dump(exclude_unset=True).items():
             setattr(job_history, key, value)
 
         return self._database.commit_and_refresh(job_history)
 
-    def delete_job_history(self, job_history_id: int):
+    def delete_job_history(self, job_history_id: int, current_user: Principal):
         """
-        Delete a job history entry by ID.
+        Delete a job history entry of the current user, or of anyone for an admin.
         """
         job_history = self._database.get_by_id(JobHistory, job_history_id)
+        ensure_user_access(current_user, job_history.user_id)
 
         if job_history.end_date and job_history.end_date > datetime.now():
             raise HTTPException(
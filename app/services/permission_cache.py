@@ -0,0 +1,42 @@
+from app.core.config import config
+from app.db.dependency import invalidate_principal
+from app.utils.cache_utils import TTLCache
+
+# Resolved permissions shared by every request handled by this process.
+# Keys are ("user", user_id, <view>) and ("role", role_id).
+permission_cache = TTLCache(
+    max_size=config.PERMISSION_CACHE_MAX_SIZE,
+    ttl=config.PERMISSION_CACHE_TTL_SECONDS,
+)
+
+
+def user_key(user_id: int, view: str) -> tuple:
+    """
+    Build the cache key of a user's resolved permissions.
+    """
+    return ("user", user_id, view)
+
+
+def role_key(role_id: int) -> tuple:
+    """
+    Build the cache key of a role's permissions.
+    """
+    return ("role", role_id)
+
+
+def invalidate_user_permissions(user_id: int) -> None:
+    """
+    Drop every cached permission view and the cached principal of a user, e.g. after
+    their role changed.
+    """
+    permission_cache.delete_where(lambda key: key[0] == "user" and key[1] == user_id)
+    invalidate_principal(user_id)
+
+
+def invalidate_role_permissions(role_id: int) -> None:
+    """
+    Drop the cached permissions of a role and of all users, along with all cached principals,
+    since any user may have gained or lost the role.
+    """
+    permission_cache.delete_where(lambda key: key[0] == "user" or key == role_key(role_id))
+    invalidate_principal()
@@ -1,7 +1,15 @@
+from app.core.config import config
 from app.services.base_service import BaseService
+from app.utils.batch_utils import validation_message
+from app.services.catalog_cache import catalog_cache, product_key
 from app.models.product import Product
-from app.schemas.product import ProductCreate, ProductUpdate
+from app.schemas.product import ProductBatchUpdate, ProductCreate, ProductResponse, ProductUpdate, ProductUpsert
 from fastapi import HTTPException
+from pydantic import ValidationError
+
+PRODUCT_SORT_FIELDS = ("product_id", "product_name", "product_amount", "created_at", "updated_at")
+PRODUCT_LIST_FIELDS = tuple(ProductResponse.model_fields)
+PRODUCT_EXPORT_FIELDS = ("product_id", "product_name", "product_amount")
 
 class ProductService(BaseService):
     def get_all_products(self):
@@ -10,14 +18,40 @@ class ProductService(BaseService):
         """
         return self._database.get_all(Product)
 
-    def get_product_by_id(self, product_id: int):
+    def get_products_page(self, limit: int, cursor: str = None, sort: str = None):
         """
-        Retrieve a single product by its ID.
+        Retrieve one page of products, as dicts of the response fields, and the cursor of the next page.
         """
-        product = self._database.get_by_id(Product, product_id)
-        if not product:
-            raise HTTPException(status_code=404, detail="Product not found")
-        return product
+        return self._database.get_page(
+            Product, limit, cursor=cursor, sort=sort, allowed_sorts=PRODUCT_SORT_FIELDS, columns=PRODUCT_LIST_FIELDS
+        )
+
+    def get_products_version(self):
+        """
+        Return when products last changed (written or deleted) and an opaque version that
+        changes with every committed write, for conditional requests.
+        """
+        return self._database.get_version(Product)
+
+    def stream_products(self):
+        """
+        Yield every product as a dict, reading the table in batches.
+        """
+        return self._database.stream_rows(Product, PRODUCT_EXPORT_FIELDS, batch_size=config.EXPORT_BATCH_SIZE)
+
+    def get_product_by_id(self, product_id: int) -> dict:
+        """
+        Retrieve a single product by its ID as a dict of its columns.
+
+        Lookups are served from the catalog cache and only hit the database on a miss.
+        """
+        return catalog_cache.get_or_set(product_key(product_id), lambda: self._load_product(product_id))
+
+    def _load_product(self, product_id: int) -> dict:
+        """
+        Load a product from the database for the catalog cache.
+        """
+        return self._database.get_by_id(Product, product_id).to_dict()
 
     def create_product(self, product_data: ProductCreate):
         """
@@ -26,6 +60,43 @@ class ProductService(BaseService):
         new_product = Product(**product_data.dict())
         return self._database.add_and_commit(new_product)
 
+    def create_products(self, items: list) -> dict:
+        """
+        Create many products in one transaction, reporting the outcome of each item.
+        """
+        return self._create_batch(Product, ProductCreate, "product_name", items)
+
+    def upsert_product(self, product_name: str, data: ProductUpsert) -> tuple:
+        """
+        Create the product named `product_name`, or update it if it already exists.
+
+        Returns:
+            tuple: The product as a dict and whether it was created.
+
+        Raises:
+            HTTPException: 400 if the name is rejected by the model validators.
+        """
+        try:
+            values = ProductCreate(product_name=product_name, **data.model_dump()).model_dump()
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=validation_message(e))
+        outcome = self._database.bulk_upsert_rows(Product, [values], "product_name")
+        if outcome["failed"]:
+            raise HTTPException(status_code=400, detail=outcome["failed"][0]["error"])
+        result = outcome["upserted"][0]
+        self._invalidate(result["id"])
+        return result["row"], result["status"] == "created"
+
+    def upsert_products(self, items: list) -> dict:
+        """
+        Create or update many products by name in one transaction, reporting the outcome of each item.
+        """
+        outcome = self._upsert_batch(Product, ProductCreate, "product_name", items)
+        for result in outcome["results"]:
+            if result["status"] == "updated":
+                self._invalidate(result["id"])
+        return outcome
+
     def update_product(self, product_id: int, updated_data: ProductUpdate):
         """
         Update an existing product by its ID.
@@ -33,7 +104,19 @@ class ProductService(BaseService):
         product = self._database.get_by_id(Product, product_id)
         for key, value in updated_data.dict(exclude_unset=True).items():
             setattr(product, key, value)
-        return self._database.commit_and_refresh(product)
+        product = self._database.commit_and_refresh(product)
+        self._invalidate(product_id)
+        return product
+
+    def update_products(self, items: list) -> dict:
+        """
+        Update many products by ID in one transaction, reporting the outcome of each item.
+        """
+        outcome = self._update_batch(Product, ProductBatchUpdate, items)
+        for result in outcome["results"]:
+            if result["status"] == "updated":
+                self._invalidate(result["id"])
+        return outcome
 
     def delete_product(self, product_id: int):
         """
@@ -41,4 +124,12 @@ class ProductService(BaseService):
         """
         product = self._database.get_by_id(Product, product_id)
         self._database.delete_and_commit(product)
+        self._invalidate(product_id)
         return {"message": "Product deleted successfully"}
+
+    def _invalidate(self, product_id: int):
+        """
+        Evict a product from the catalog cache once the write that changed it is committed,
+        so a concurrent read can't re-cache the row as it was before the commit.
+        """
+        self._database.after_commit(lambda: catalog_cache.delete(product_key(product_id)))
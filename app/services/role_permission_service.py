@@ -1,4 +1,6 @@
 from app.services.base_service import BaseService
+from app.services.permission_cache import invalidate_role_permissions
+from app.models.permission import Permission
 from app.models.role_permission import RolePermission
 from app.schemas.role_permission import RolePermissionCreate
 from fastapi import HTTPException
@@ -23,16 +25,26 @@ class RolePermissionService(BaseService):
     def get_permissions_for_role(self, role_id: int):
         """
         Retrieve all permissions associated with a specific role.
+
+        Resolves the permissions with a single joined query that is served by the
+        composite (role_id, permission_id) index on role_permissions.
         """
-        role_permissions = self._database.get_all(RolePermission)
-        return [rp.permission for rp in role_permissions if rp.role_id == role_id]
+        return (
+            self._database.db.query(Permission)
+            .join(RolePermission, RolePermission.permission_id == Permission.id)
+            .filter(RolePermission.role_id == role_id)
+            .distinct()
+            .all()
+        )
 
     def create_role_permission(self, role_permission_data: RolePermissionCreate):
         """
         Create a new role-permission association and save it to the database.
         """
         new_role_permission = RolePermission(**role_permission_data.dict())
-        return self._database.add_and_commit(new_role_permission)
+        new_role_permission = self._database.add_and_commit(new_role_permission)
+        invalidate_role_permissions(new_role_permission.role_id)
+        return new_role_permission
 
     def add_multiple_permissions_to_role(self, role_id: int, permission_ids: List[int]):
         """
@@ -43,6 +55,7 @@ class RolePermissionService(BaseService):
         ]
         self._database.bulk_add(new_role_permissions)
         self._database.commit()
+        invalidate_role_permissions(role_id)
         return {"message": f"Added {len(permission_ids)} permissions to role {role_id}"}
 
     def delete_role_permission(self, role_permission_id: int):
@@ -52,5 +65,7 @@ class RolePermissionService(BaseService):
         role_permission = self._database.get_by_id(RolePermission, role_permission_id)
         if not role_permission:
             raise HTTPException(status_code=404, detail="Role-Permission association not found")
+        role_id = role_permission.role_id
         self._database.delete_and_commit(role_permission)
+        invalidate_role_permissions(role_id)
         return {"message": "Role-Permission association deleted successfully"}
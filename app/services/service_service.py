@@ -1,7 +1,15 @@
+from app.core.config import config
 from app.services.base_service import BaseService
+from app.utils.batch_utils import validation_message
+from app.services.catalog_cache import catalog_cache, service_key
 from app.models.service import Service
-from app.schemas.service import ServiceCreate, ServiceUpdate
+from app.schemas.service import ServiceBatchUpdate, ServiceCreate, ServiceResponse, ServiceUpdate, ServiceUpsert
 from fastapi import HTTPException
+from pydantic import ValidationError
+
+SERVICE_SORT_FIELDS = ("service_id", "service_name", "total_amount", "created_at", "updated_at")
+SERVICE_LIST_FIELDS = tuple(ServiceResponse.model_fields)
+SERVICE_EXPORT_FIELDS = ("service_id", "service_name", "total_amount")
 
 class ServiceService(BaseService):
     def get_all_services(self):
@@ -10,14 +18,40 @@ class ServiceService(BaseService):
         """
         return self._database.get_all(Service)
 
-    def get_service_by_id(self, service_id: int):
+    def get_services_page(self, limit: int, cursor: str = None, sort: str = None):
         """
-        Retrieve a single service by its ID.
+        Retrieve one page of services, as dicts of the response fields, and the cursor of the next page.
         """
-        service = self._database.get_by_id(Service, service_id)
-        if not service:
-            raise HTTPException(status_code=404, detail="Service not found")
-        return service
+        return self._database.get_page(
+            Service, limit, cursor=cursor, sort=sort, allowed_sorts=SERVICE_SORT_FIELDS, columns=SERVICE_LIST_FIELDS
+        )
+
+    def get_services_version(self):
+        """
+        Return when services last changed (written or deleted) and an opaque version that
+        changes with every committed write, for conditional requests.
+        """
+        return self._database.get_version(Service)
+
+    def stream_services(self):
+        """
+        Yield every service as a dict, reading the table in batches.
+        """
+        return self._database.stream_rows(Service, SERVICE_EXPORT_FIELDS, batch_size=config.EXPORT_BATCH_SIZE)
+
+    def get_service_by_id(self, service_id: int) -> dict:
+        """
+        Retrieve a single service by its ID as a dict of its columns.
+
+        Lookups are served from the catalog cache and only hit the database on a miss.
+        """
+        return catalog_cache.get_or_set(service_key(service_id), lambda: self._load_service(service_id))
+
+    def _load_service(self, service_id: int) -> dict:
+        """
+        Load a service from the database for the catalog cache.
+        """
+        return self._database.get_by_id(Service, service_id).to_dict()
 
     def create_service(self, service_data: ServiceCreate):
         """
@@ -26,6 +60,43 @@ class ServiceService(BaseService):
         new_service = Service(**service_data.dict())
         return self._database.add_and_commit(new_service)
 
+    def create_services(self, items: list) -> dict:
+        """
+        Create many services in one transaction, reporting the outcome of each item.
+        """
+        return self._create_batch(Service, ServiceCreate, "service_name", items)
+
+    def upsert_service(self, service_name: str, data: ServiceUpsert) -> tuple:
+        """
+        Create the service named `service_name`, or update it if it already exists.
+
+        Returns:
+            tuple: The service as a dict and whether it was created.
+
+        Raises:
+            HTTPException: 400 if the name is rejected by the model validators.
+        """
+        try:
+            values = ServiceCreate(service_name=service_name, **data.model_dump()).model_dump()
+        except ValidationError as e:
+            raise HTTPException(status_code=400, detail=validation_message(e))
+        outcome = self._database.bulk_upsert_rows(Service, [values], "service_name")
+        if outcome["failed"]:
+            raise HTTPException(status_code=400, detail=outcome["failed"][0]["error"])
+        result = outcome["upserted"][0]
+        self._invalidate(result["id"])
+        return result["row"], result["status"] == "created"
+
+    def upsert_services(self, items: list) -> dict:
+        """
+        Create or update many services by name in one transaction, reporting the outcome of each item.
+        """
+        outcome = self._upsert_batch(Service, ServiceCreate, "service_name", items)
+        for result in outcome["results"]:
+            if result["status"] == "updated":
+                self._invalidate(result["id"])
+        return outcome
+
     def update_service(self, service_id: int, updated_data: ServiceUpdate):
         """
         Update an existing service by its ID.
@@ -35,7 +106,19 @@ class ServiceService(BaseService):
             raise HTTPException(status_code=404, detail="Service not found")
         for key, value in updated_data.dict(exclude_unset=True).items():
             setattr(service, key, value)
-        return self._database.commit_and_refresh(service)
+        service = self._database.commit_and_refresh(service)
+        self._invalidate(service_id)
+        return service
+
+    def update_services(self, items: list) -> dict:
+        """
+        Update many services by ID in one transaction, reporting the outcome of each item.
+        """
+        outcome = self._update_batch(Service, ServiceBatchUpdate, items)
+        for result in outcome["results"]:
+            if result["status"] == "updated":
+                self._invalidate(result["id"])
+        return outcome
 
     def delete_service(self, service_id: int):
         """
@@ -45,4 +128,12 @@ class ServiceService(BaseService):
         if not service:
             raise HTTPException(status_code=404, detail="Service not found")
         self._database.delete_and_commit(service)
+        self._invalidate(service_id)
         return {"message": "Service deleted successfully"}
+
+    def _invalidate(self, service_id: int):
+        """
+        Evict a service from the catalog cache once the write that changed it is committed,
+        so a concurrent read can't re-cache the row as it was before the commit.
+        """
+        self._database.after_commit(lambda: catalog_cache.delete(service_key(service_id)))
@@ -1,10 +1,64 @@
+import threading
+import time
 from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, select
 from app.models.token import Token
 from app.utils.token_utils import create_access_token, validate_token
+from app.utils.revocation_utils import RevocationList
 from app.core.config import config
 from app.services.base_service import BaseService
 from fastapi import HTTPException, status
 
+# Revoked access tokens shared by every request handled by this process
+revocation_list = RevocationList(
+    refresh_interval=config.TOKEN_REVOCATION_REFRESH_SECONDS,
+    overlap=config.TOKEN_REVOCATION_OVERLAP_SECONDS,
+)
+
+
+class TokenPurgeStats:
+    """
+    Counters describing the expired-token purges run by this process.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.runs = 0
+        self.rows_deleted_total = 0
+        self.seconds_total = 0.0
+        self.last_rows_deleted = None
+        self.last_seconds = None
+        self.last_finished_at = None
+
+    def record(self, rows_deleted: int, seconds: float) -> None:
+        """
+        Record the outcome of one purge run.
+        """
+        with self._lock:
+            self.runs += 1
+            self.rows_deleted_total += rows_deleted
+            self.seconds_total += seconds
+            self.last_rows_deleted = rows_deleted
+            self.last_seconds = seconds
+            self.last_finished_at = datetime.now(timezone.utc)
+
+    def snapshot(self) -> dict:
+        """
+        Report the recorded counters.
+        """
+        with self._lock:
+            return {
+                "runs": self.runs,
+                "rows_deleted_total": self.rows_deleted_total,
+                "seconds_total": self.seconds_total,
+                "last_rows_deleted": self.last_rows_deleted,
+                "last_seconds": self.last_seconds,
+                "last_finished_at": self.last_finished_at,
+            }
+
+
+token_purge_stats = TokenPurgeStats()
+
 
 class TokenService(BaseService):
     ACCESS_TOKEN_EXPIRE_MINUTES = config.ACCESS_TOKEN_EXPIRE_MINUTES
@@ -32,18 +86,40 @@ class TokenService(BaseService):
 
     def validate_access_token(self, token_str: str) -> dict:
         """
-        Validate an access token by checking its blacklist status and decoding it.
+        Validate an access token by decoding it and checking its blacklist status.
+
+        The blacklist check uses the in-memory revocation list, so the database is
+        only queried when the list is due for its periodic refresh.
         """
         payload = validate_token(token_str)
-        token = self._database.find_or_404(Token, token=token_str)
+        self.refresh_revocation_list()
 
-        if token.is_blacklisted:
+        if revocation_list.contains(token_str):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED, detail="Token is blacklisted"
             )
 
         return payload
 
+    def refresh_revocation_list(self, force: bool = False) -> None:
+        """
+        Merge the blacklisted, not yet expired tokens from the database into the revocation list.
+        Runs at most once per refresh interval unless `force` is set.
+
+        After the first load only tokens whose `updated_at` (indexed) moved since the previous
+        load are read; expired entries are dropped from the list locally.
+        """
+        if not (revocation_list.claim_refresh() or force):
+            return
+        now = datetime.now(timezone.utc)
+        blacklisted_tokens = self._database.db.query(Token.token, Token.expires_at).filter(
+            Token.is_blacklisted.is_(True), Token.expires_at > now
+        )
+        since = revocation_list.since()
+        if since is not None:
+            blacklisted_tokens = blacklisted_tokens.filter(Token.updated_at >= since)
+        revocation_list.merge(blacklisted_tokens.all(), loaded_at=now)
+
     def blacklist_token(self, token_str: str) -> None:
         """
         Blacklist an access token, preventing further use.
@@ -51,6 +127,7 @@ class TokenService(BaseService):
         token = self._database.find_or_404(Token, token=token_str)
         token.is_blacklisted = True
         self._database.commit_and_refresh(token)
+        revocation_list.add(token_str, token.expires_at)
 
     def refresh_access_token(self, refresh_token_str: str) -> str:
         """
@@ -81,13 +158,38 @@ class TokenService(BaseService):
 
         return new_access_token
 
-    def delete_expired_tokens(self) -> None:
+    def delete_expired_tokens(self, batch_size: int = None, pause_seconds: float = 0.0) -> int:
         """
-        Delete all expired tokens from the database.
+        Delete all tokens whose refresh token has expired.
+
+        Rows are removed with one DELETE per batch of at most `batch_size` rows, each
+        committed on its own so locks are held briefly, sleeping `pause_seconds` between
+        batches. Tokens with an expired access token but a valid refresh token are kept,
+        since they are still needed to refresh.
+
+        Returns:
+            int: The number of tokens deleted.
         """
+        batch_size = batch_size or config.TOKEN_PURGE_BATCH_SIZE
+        started = time.perf_counter()
         now = datetime.now(timezone.utc)
-        expired_tokens = self._database.db.query(Token).filter(
-            (Token.expires_at < now) | (Token.refresh_expires_at < now)
+        expired_ids = (
+            select(Token.id)
+            .where(Token.refresh_expires_at < now)
+            .limit(batch_size)
+            .scalar_subquery()
         )
-        for token in expired_tokens:
-            self._database.delete_and_commit(token)
+        statement = delete(Token).where(Token.id.in_(expired_ids)).execution_options(synchronize_session=False)
+
+        deleted = 0
+        while True:
+            result = self._database.db.execute(statement)
+            self._database.commit()
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                break
+            if pause_seconds:
+                time.sleep(pause_seconds)
+
+        token_purge_stats.record(deleted, time.perf_counter() - started)
+        return deleted
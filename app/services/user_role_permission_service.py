@@ -1,6 +1,14 @@
 from app.services.base_service import BaseService
+from app.services.permission_cache import (
+    invalidate_role_permissions,
+    invalidate_user_permissions,
+    permission_cache,
+    role_key,
+    user_key,
+)
 from app.services.role_permission_service import RolePermissionService
 from app.models.role import Role
+from app.models.role_permission import RolePermission
 from app.models.user import User
 from fastapi import HTTPException
 from typing import List
@@ -10,65 +18,123 @@ class UserRolePermissionService(BaseService):
         super().__init__(database)
         self.role_permission_service = role_permission_service
 
+    def get_user_roles(self, user_id: int) -> List[Role]:
+        """
+        Retrieve the roles assigned to a user through their role-permission mappings.
+
+        Raises:
+            HTTPException: 404 if the user does not exist.
+        """
+        self._database.get_by_id(User, user_id)
+        return (
+            self._database.db.query(Role)
+            .join(RolePermission, RolePermission.role_id == Role.id)
+            .filter(RolePermission.user_id == user_id)
+            .distinct()
+            .order_by(Role.id)
+            .all()
+        )
+
     def get_user_role(self, user_id: int):
         """
-        Retrieve the role assigned to a user.
+        Retrieve the first role assigned to a user, or None if they have none.
         """
-        user = self._database.get_by_id(User, user_id)
-        return user.role
+        roles = self.get_user_roles(user_id)
+        return roles[0] if roles else None
 
     def get_user_permissions(self, user_id: int):
         """
-        Retrieve all permissions assigned to a user through their role.
+        Retrieve all permissions granted to a user through their roles.
+
+        Permissions are returned as dictionaries and cached per user until the
+        TTL expires or the user's roles or the roles' permissions change.
+        """
+        return permission_cache.get_or_set(
+            user_key(user_id, "permissions"),
+            lambda: self._load_user_permissions(user_id),
+        )
+
+    def _load_user_permissions(self, user_id: int):
+        """
+        Resolve a user's permissions without consulting the user cache.
         """
-        user = self._database.get_by_id(User, user_id)
-        if not user.role:
+        roles = self.get_user_roles(user_id)
+        if not roles:
             raise HTTPException(status_code=404, detail=f"User {user_id} has no assigned role")
-        return self.role_permission_service.get_permissions_for_role(user.role.id)
+        permissions = {}
+        for role in roles:
+            for permission in self._get_cached_role_permissions(role.id):
+                permissions.setdefault(permission["id"], permission)
+        return list(permissions.values())
+
+    def _get_cached_role_permissions(self, role_id: int):
+        """
+        Retrieve a role's permissions as dictionaries, cached per role.
+        """
+        return permission_cache.get_or_set(
+            role_key(role_id),
+            lambda: [
+                permission.to_dict()
+                for permission in self.role_permission_service.get_permissions_for_role(role_id)
+            ],
+        )
 
     def assign_role_to_user(self, user_id: int, role_id: int):
         """
-        Assign a single role to a user.
+        Assign a role to a user by adding a role mapping without a permission.
         """
-        user = self._database.get_by_id(User, user_id)
-        role = self._database.get_by_id(Role, role_id)
-        if user.role and user.role.id == role_id:
+        self._database.get_by_id(Role, role_id)
+        if any(role.id == role_id for role in self.get_user_roles(user_id)):
             raise HTTPException(status_code=400, detail=f"User {user_id} already has role {role_id}")
-        user.role = role
-        self._database.commit()
+        self._database.add_and_commit(RolePermission(user_id=user_id, role_id=role_id))
+        invalidate_user_permissions(user_id)
         return {"message": f"Role {role_id} assigned to user {user_id}"}
 
     def remove_role_from_user(self, user_id: int):
         """
-        Remove the role from a user.
+        Remove every role from a user by deleting their role mappings.
+
+        Permissions granted through those mappings are removed from the roles as well,
+        so the cached permissions of the affected roles are dropped too.
         """
-        user = self._database.get_by_id(User, user_id)
-        if user.role:
-            user.role = None
-            self._database.commit()
-        else:
+        self._database.get_by_id(User, user_id)
+        mappings = self._database.db.query(RolePermission).filter(RolePermission.user_id == user_id).all()
+        if not mappings:
             raise HTTPException(status_code=400, detail=f"User {user_id} has no role to remove")
+        with self.transaction():
+            for mapping in mappings:
+                self._database.delete_and_commit(mapping)
+        for role_id in {mapping.role_id for mapping in mappings}:
+            invalidate_role_permissions(role_id)
         return {"message": f"Role removed from user {user_id}"}
 
     def get_roles_permissions(self, role_id: int):
         """
-        Retrieve all permissions associated with a role.
+        Retrieve all permissions associated with a role, as cached dictionaries.
         """
-        return self.role_permission_service.get_permissions_for_role(role_id)
+        return self._get_cached_role_permissions(role_id)
 
     def add_permissions_to_role(self, role_id: int, permission_ids: List[int]):
         """
         Add multiple permissions to a role using RolePermissionService.
+        RolePermissionService invalidates the cached permissions of the role.
         """
-        return self.role_permission_service.add_permissions_to_role(role_id, permission_ids)
+        return self.role_permission_service.add_multiple_permissions_to_role(role_id, permission_ids)
 
     def get_user_role_permissions(self, user_id: int):
         """
-        Retrieve the user's role and its permissions.
+        Retrieve the user's roles and their permissions, keyed by role name, cached per user.
+        """
+        return permission_cache.get_or_set(
+            user_key(user_id, "role_permissions"),
+            lambda: self._load_user_role_permissions(user_id),
+        )
+
+    def _load_user_role_permissions(self, user_id: int):
+        """
+        Resolve a user's roles and their permissions without consulting the user cache.
         """
-        user = self._database.get_by_id(User, user_id)
-        role = user.role
-        if not role:
+        roles = self.get_user_roles(user_id)
+        if not roles:
             raise HTTPException(status_code=404, detail=f"User {user_id} has no assigned role")
-        permissions = self.role_permission_service.get_permissions_for_role(role.id)
-        return {role.name: permissions}
+        return {role.name: self._get_cached_role_permissions(role.id) for role in roles}
@@ -1,28 +1,39 @@
 from app.models.user import User
 from app.schemas.register import RegisterRequest, RegisterResponse
 from app.schemas.token import TokenResponse
-from app.utils.security_utils import hash_password, verify_password
+from app.schemas.user import UserResponse
+from app.utils.security_utils import hash_password_async, verify_password_async
+from app.db.dependency import invalidate_principal
+from app.services.permission_cache import invalidate_user_permissions
 from app.services.token_service import TokenService
 from app.services.base_service import BaseService
 from fastapi import HTTPException, status
+from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
 
+USER_LIST_FIELDS = tuple(UserResponse.model_fields)
+USER_SORT_FIELDS = ("id", "email", "last_name", "created_at", "updated_at")
+# Unique indexes whose violation means the email is already registered
+EMAIL_UNIQUE_INDEXES = ("ux_users_email_lower", "ix_users_email")
 
 class UserService(BaseService):
     def __init__(self, db):
         super().__init__(db)
         self.token_service = TokenService(db)
 
-    def register_user(self, user_data: RegisterRequest) -> RegisterResponse:
+    async def register_user(self, user_data: RegisterRequest) -> RegisterResponse:
         """
         Register a new user and return their details along with an access token.
-        """
-        if self._database.find_or_404(User, email=user_data.email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Email already registered",
-            )
 
-        hashed_password = hash_password(user_data.password)
+        Database work runs in the request threadpool and bcrypt runs on the password
+        hashing pool, so the event loop is never blocked. Duplicate emails are detected
+        by the unique index on lower(email) rather than a lookup before the INSERT.
+
+        Raises:
+            HTTPException: 400 if the email is already registered, in any letter case.
+        """
+        hashed_password = await hash_password_async(user_data.password)
         new_user = User(
             email=user_data.email,
             hashed_password=hashed_password,
@@ -30,38 +41,56 @@ class UserService(BaseService):
             last_name=user_data.last_name,
         )
 
-        new_user = self._database.add_and_commit(new_user)
-
-        token = self.token_service.create_token(
-            user_id=new_user.id,
-            payload={"sub": new_user.email},
-        )
-
-        return RegisterResponse(
-            id=new_user.id,
-            email=new_user.email,
-            first_name=new_user.first_name,
-            last_name=new_user.last_name,
-            created_at=new_user.created_at.isoformat(),
-            updated_at=new_user.updated_at.isoformat(),
-            token=TokenResponse(
-                access_token=token.token,
-                refresh_token=token.refresh_token,
-                token_type="bearer",
-            ),
-        )
+        return await run_in_threadpool(self._create_user_with_token, new_user)
 
-    def login_user(self, email: str, password: str) -> RegisterResponse:
+    async def login_user(self, email: str, password: str) -> RegisterResponse:
         """
         Authenticate a user and return their details along with an access token.
         """
-        user = self._database.find_or_404(User, email=email)
-        if not verify_password(password, user.hashed_password):
+        user = await run_in_threadpool(self._find_by_email_or_404, email)
+        if not await verify_password_async(password, user.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid email or password",
             )
 
+        return await run_in_threadpool(self._issue_token_response, user)
+
+    def _find_by_email_or_404(self, email: str) -> User:
+        """
+        Look a user up by email, ignoring letter case, through the lower(email) index.
+        """
+        user = self._database.db.query(User).filter(func.lower(User.email) == email.lower()).first()
+        if not user:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"User with email={email} not found",
+            )
+        return user
+
+    def _create_user_with_token(self, new_user: User) -> RegisterResponse:
+        """
+        Insert the user and their first token in one transaction, so a failure cannot
+        leave a registered user without a token. Only a violation of an email index is
+        reported as a duplicate; other integrity errors are re-raised.
+        """
+        try:
+            with self.transaction():
+                self._database.add_and_commit(new_user)
+                return self._issue_token_response(new_user)
+        except IntegrityError as e:
+            constraint = getattr(getattr(e.orig, "diag", None), "constraint_name", None)
+            if constraint not in EMAIL_UNIQUE_INDEXES:
+                raise
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered",
+            ) from e
+
+    def _issue_token_response(self, user: User) -> RegisterResponse:
+        """
+        Create a token for the user and build the response returned by register and login.
+        """
         token = self.token_service.create_token(
             user_id=user.id,
             payload={"sub": user.email},
@@ -87,6 +116,14 @@ class UserService(BaseService):
         """
         return self._database.get_all(User)
 
+    def get_users_page(self, limit: int, cursor: str = None, sort: str = None):
+        """
+        Retrieve one page of users, as dicts of the response fields, and the cursor of the next page.
+        """
+        return self._database.get_page(
+            User, limit, cursor=cursor, sort=sort, allowed_sorts=USER_SORT_FIELDS, columns=USER_LIST_FIELDS
+        )
+
     def get_user_by_id(self, user_id: int) -> User:
         """
         Retrieve a user by their ID.
@@ -99,4 +136,6 @@ class UserService(BaseService):
         """
         user = self._database.find_or_404(User, id=user_id)
         self._database.delete_and_commit(user)
+        invalidate_principal(user_id)
+        invalidate_user_permissions(user_id)
         return {"message": "User deleted successfully"}
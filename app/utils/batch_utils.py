@@ -0,0 +1,50 @@
+import json
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+NDJSON_MEDIA_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl")
+
+
+def decode_batch(body: bytes, content_type: str, max_items: int) -> list:
+    """
+    Decode a batch request body: a JSON array, or one JSON object per line for NDJSON.
+
+    Args:
+        body (bytes): Raw request body.
+        content_type (str): Request content type, selecting the format.
+        max_items (int): Maximum number of items accepted.
+
+    Returns:
+        list: The decoded items.
+
+    Raises:
+        HTTPException: 400 if the body is malformed, 413 if it has too many items.
+    """
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    try:
+        if media_type in NDJSON_MEDIA_TYPES:
+            items = []
+            for number, line in enumerate(body.splitlines(), start=1):
+                if line.strip():
+                    try:
+                        items.append(json.loads(line))
+                    except ValueError:
+                        raise HTTPException(status_code=400, detail=f"Invalid JSON on line {number}")
+        else:
+            items = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Request body must be a JSON array")
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Request body must be a JSON array")
+    if len(items) > max_items:
+        raise HTTPException(status_code=413, detail=f"A batch may contain at most {max_items} items")
+    return items
+
+
+def validation_message(error: ValidationError) -> str:
+    """
+    Summarize a pydantic ValidationError as a single line.
+    """
+    return "; ".join(
+        f"{'.'.join(map(str, detail['loc'])) or 'item'}: {detail['msg']}" for detail in error.errors()
+    )
@@ -0,0 +1,239 @@
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+
+# Sentinel distinguishing a cache miss from a cached `None`
+_MISSING = object()
+
+
+class CacheBackend(ABC):
+    """
+    Interface shared by the in-process and shared cache backends.
+    """
+
+    @abstractmethod
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for `key`, or `default` if it is missing or expired.
+        """
+
+    @abstractmethod
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store `value` under `key`.
+        """
+
+    @abstractmethod
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove `key` from the cache if present.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the hit/miss counters.
+        """
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """
+        Report the cache size and hit/miss counters.
+        """
+
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for `key`, calling `loader` to populate it on a miss.
+        """
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = loader()
+            self.set(key, value)
+        return value
+
+
+class TTLCache(CacheBackend):
+    """
+    Thread-safe, size-bounded LRU cache whose entries expire after a fixed time-to-live.
+
+    Values are shared between all callers, so they should be treated as read-only.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300, timer: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept before the least recently used is evicted.
+            ttl (float): Seconds an entry stays valid after it is stored.
+            timer (Callable): Monotonic clock, overridable for testing.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._timer = timer
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for `key`, or `default` if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key, _MISSING)
+            if entry is not _MISSING:
+                expires_at, value = entry
+                if expires_at > self._timer():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store `value` under `key`, evicting the least recently used entry when full.
+        """
+        with self._lock:
+            self._entries[key] = (self._timer() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove `key` from the cache if present.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Hashable], bool]) -> None:
+        """
+        Remove every entry whose key satisfies `predicate`.
+        """
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+
+    def delete_values_where(self, predicate: Callable[[Any], bool]) -> None:
+        """
+        Remove every entry whose value satisfies `predicate`.
+        """
+        with self._lock:
+            for key in [key for key, (_, value) in self._entries.items() if predicate(value)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the hit/miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Report the cache size and hit/miss counters.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
+
+
+class LocalSharedCache(CacheBackend):
+    """
+    In-process stand-in for a shared cache such as Redis or memcached.
+
+    Values are pickled on write and unpickled on read, as they would be on the way to
+    and from a cache server, so each caller gets its own copy and cached values must be
+    picklable. Swap in a networked implementation of `CacheBackend` to share entries
+    (and invalidations) between worker processes.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl: float = 300, timer: Callable[[], float] = time.monotonic):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size (int): Maximum number of entries kept before the oldest is evicted.
+            ttl (float): Seconds an entry stays valid after it is stored.
+            timer (Callable): Monotonic clock, overridable for testing.
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._timer = timer
+        self._entries = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return a copy of the cached value for `key`, or `default` if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._timer():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            payload = entry[1]
+        return pickle.loads(payload)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store a pickled copy of `value` under `key`, evicting the oldest entry when full.
+        """
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (self._timer() + self.ttl, payload)
+            while len(self._entries) > self.max_size:
+                del self._entries[next(iter(self._entries))]
+
+    def delete(self, key: Hashable) -> None:
+        """
+        Remove `key` from the cache if present.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the hit/miss counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> dict:
+        """
+        Report the cache size and hit/miss counters.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+            }
@@ -0,0 +1,100 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Callable, Optional
+from fastapi import Request, Response
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a weak ETag from the values a representation is derived from.
+
+    Args:
+        *parts: Values identifying the representation, e.g. a row ID and its `updated_at`.
+
+    Returns:
+        str: The quoted weak ETag.
+    """
+    digest = hashlib.sha1("|".join(map(str, parts)).encode()).hexdigest()
+    return f'W/"{digest}"'
+
+
+def http_date(value: datetime) -> str:
+    """
+    Format a datetime (naive values are taken as UTC) as an HTTP date.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """
+    Weakly compare an If-None-Match header against an ETag.
+    """
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in header.split(","))
+
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    """
+    Evaluate the request's If-None-Match / If-Modified-Since preconditions.
+
+    If-None-Match takes precedence; If-Modified-Since is only used when it is absent,
+    and is compared at the one-second resolution of HTTP dates.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return _etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    if last_modified.tzinfo is None:
+        last_modified = last_modified.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> dict:
+    """
+    Build the ETag, Last-Modified and Cache-Control headers of a response.
+
+    `no-cache` lets clients store the response but makes them revalidate it on each use.
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def conditional_response(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime],
+    render: Callable[[dict], Response],
+) -> Response:
+    """
+    Answer 304 Not Modified when the client's copy is current, otherwise render the body.
+
+    Args:
+        request (Request): Incoming request carrying the precondition headers.
+        etag (str): ETag of the current representation.
+        last_modified (datetime): When the representation last changed, if known.
+        render (Callable): Builds the full response from the validator headers. Only
+            called when the representation has changed, so nothing is serialized for a 304.
+
+    Returns:
+        Response: The 304 or full response, carrying the validator headers.
+    """
+    headers = validator_headers(etag, last_modified)
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    return render(headers)
@@ -1,6 +1,107 @@
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import groupby
+from typing import Optional
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy import String, cast, column, func, inspect, literal_column, or_, select, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.exc import DBAPIError, SQLAlchemyError
 from fastapi import HTTPException
+from app.core.config import config
+from app.db.types import UTCDateTime
+from app.models.tombstone import Tombstone
+from app.utils.pagination_utils import coerce_cursor_value, decode_cursor, encode_cursor, parse_sort
+
+
+def primary_key(model):
+    """
+    Return the primary key attribute of a model, e.g. `Product.product_id`.
+    """
+    mapper = inspect(model)
+    return getattr(model, mapper.get_property_by_column(mapper.primary_key[0]).key)
+
+
+@lru_cache(maxsize=None)
+def _type_adapter(python_type: type, nullable: bool) -> TypeAdapter:
+    return TypeAdapter(Optional[python_type] if nullable else python_type)
+
+
+def _as_utc(column, value):
+    """
+    Attach UTC to naive values of UTCDateTime columns, which store and return UTC without tzinfo.
+    """
+    if isinstance(column.type, UTCDateTime) and isinstance(value, datetime) and value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def coerce_column_value(model, key: str, value):
+    """
+    Convert a value to the Python type of a model column, e.g. "5" to 5 for an Integer.
+
+    Raises:
+        ValueError: If the value cannot be converted, or is None for a NOT NULL column.
+    """
+    column = inspect(model).columns[key]
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    try:
+        value = _type_adapter(python_type, bool(column.nullable)).validate_python(value)
+    except ValidationError as e:
+        raise ValueError(f"Invalid value for {key}: {e.errors()[0]['msg']}")
+    return _as_utc(column, value)
+
+
+@contextmanager
+def retain_on_commit(session: Session):
+    """
+    Keep loaded attribute values across a commit instead of expiring them.
+
+    Values set by the application and those fetched with RETURNING during the flush
+    (primary keys, eager defaults) stay readable without reloading the row.
+    """
+    previous = session.expire_on_commit
+    session.expire_on_commit = False
+    try:
+        yield
+    finally:
+        session.expire_on_commit = previous
+
+
+def _update_from_values(model, rows: list[dict]):
+    """
+    Build one UPDATE ... FROM (VALUES ...) statement setting each row's values on the
+    record with its primary key. All rows must set the same columns.
+    """
+    table = model.__table__
+    pk = primary_key(model).key
+    keys = list(rows[0])
+    source = values(*(column(key, table.c[key].type) for key in keys), name="source").data(
+        [tuple(row[key] for key in keys) for row in rows]
+    )
+    # VALUES columns are typed from their literals (NULL is text), so cast them back to the column types
+    return (
+        update(table)
+        .where(table.c[pk] == source.c[pk])
+        .values({key: cast(source.c[key], table.c[key].type) for key in keys if key != pk})
+    )
+
+
+TRANSACTION_DEPTH = "transaction_depth"
+AFTER_COMMIT = "after_commit"
+
+
+def _should_refresh(refresh) -> bool:
+    """
+    Resolve a per-call `refresh` argument against the DB_REFRESH_AFTER_WRITE setting.
+    """
+    return config.DB_REFRESH_AFTER_WRITE if refresh is None else refresh
+
 
 class DatabaseUtils:
     def __init__(self, db: Session):
@@ -12,17 +113,114 @@ class DatabaseUtils:
         """
         self.db = db
 
-    def add_and_commit(self, instance):
+    @property
+    def in_transaction(self) -> bool:
+        """
+        Whether a `transaction()` block is open on this session.
+        """
+        return self.db.info.get(TRANSACTION_DEPTH, 0) > 0
+
+    @contextmanager
+    def transaction(self, savepoint: bool = False):
         """
-        Add an instance to the database, commit the session, and refresh the instance.
+        Group the writes made inside the block into a single commit.
+
+        While the block is open, methods that normally commit only flush, so generated
+        values are still available, and errors are left for the block to roll back. The
+        outermost block commits on success and rolls back on error. Blocks share the
+        session, so services built on the same session join the same transaction.
+
+        Args:
+            savepoint (bool): For a nested block, run it in a SAVEPOINT so an error
+                only undoes the block's own writes and the outer transaction can go on.
+
+        Raises:
+            Exception: Any error raised inside the block, after rolling back.
         """
+        depth = self.db.info.get(TRANSACTION_DEPTH, 0)
+        nested = self.db.begin_nested() if depth and savepoint else None
+        self.db.info[TRANSACTION_DEPTH] = depth + 1
         try:
-            self.db.add(instance)
+            yield self
+        except BaseException:
+            self.db.info[TRANSACTION_DEPTH] = depth
+            if nested is not None:
+                nested.rollback()
+            elif not depth:
+                self.db.info.pop(AFTER_COMMIT, None)
+                self.db.rollback()
+            raise
+        self.db.info[TRANSACTION_DEPTH] = depth
+        try:
+            if nested is not None:
+                nested.commit()
+            elif not depth:
+                if _should_refresh(None):
+                    self.db.commit()
+                else:
+                    with retain_on_commit(self.db):
+                        self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.info.pop(AFTER_COMMIT, None)
+            self._rollback()
+            raise e
+        if not depth:
+            for callback in self.db.info.pop(AFTER_COMMIT, []):
+                callback()
+
+    def after_commit(self, callback):
+        """
+        Run `callback` once the current writes are committed.
+
+        Outside a `transaction()` block the writes are already committed, so it runs
+        at once. Inside one it is queued and runs after the outermost block commits,
+        or is dropped if it rolls back. Use it for side effects such as cache
+        invalidation that must not run before other sessions can see the writes.
+        """
+        if self.in_transaction:
+            self.db.info.setdefault(AFTER_COMMIT, []).append(callback)
+        else:
+            callback()
+
+    def _commit(self):
+        """
+        Commit the session, or only flush it inside a `transaction()` block.
+        """
+        if self.in_transaction:
+            self.db.flush()
+        else:
             self.db.commit()
-            self.db.refresh(instance)
+
+    def _rollback(self):
+        """
+        Roll the session back, unless a `transaction()` block will do so.
+        """
+        if not self.in_transaction:
+            self.db.rollback()
+
+    def add_and_commit(self, instance, refresh: bool = None):
+        """
+        Add an instance to the database and commit the session.
+
+        Generated values (primary key, defaults) are populated during the INSERT via
+        RETURNING, so the instance is usable without reloading it.
+
+        Args:
+            instance: The instance to add.
+            refresh (bool): Reload the row with a SELECT after committing, e.g. to pick up
+                changes made by database triggers. Defaults to DB_REFRESH_AFTER_WRITE.
+        """
+        try:
+            self.db.add(instance)
+            if _should_refresh(refresh):
+                self._commit()
+                self.db.refresh(instance)
+            else:
+                with retain_on_commit(self.db):
+                    self._commit()
             return instance
         except SQLAlchemyError as e:
-            self.db.rollback()
+            self._rollback()
             raise e
 
     def add_all_and_commit(self, instances):
@@ -31,9 +229,9 @@ class DatabaseUtils:
         """
         try:
             self.db.add_all(instances)
-            self.db.commit()
+            self._commit()
         except SQLAlchemyError as e:
-            self.db.rollback()
+            self._rollback()
             raise e
 
     def bulk_add(self, instances):
@@ -43,26 +241,47 @@ class DatabaseUtils:
         try:
             self.db.add_all(instances)
         except SQLAlchemyError as e:
-            self.db.rollback()
+            self._rollback()
             raise e
 
-    def commit_and_refresh(self, instance):
+    def commit(self):
         """
-        Commit the current transaction and refresh the given instance.
+        Commit the current transaction.
         """
         try:
-            self.db.commit()
-            self.db.refresh(instance)
+            self._commit()
+        except SQLAlchemyError as e:
+            self._rollback()
+            raise e
+
+    def commit_and_refresh(self, instance, refresh: bool = None):
+        """
+        Commit the current transaction and return the given instance.
+
+        The instance keeps the values written by the UPDATE instead of being reloaded.
+
+        Args:
+            instance: The instance that was changed.
+            refresh (bool): Reload the row with a SELECT after committing. Defaults to
+                DB_REFRESH_AFTER_WRITE.
+        """
+        try:
+            if _should_refresh(refresh):
+                self._commit()
+                self.db.refresh(instance)
+            else:
+                with retain_on_commit(self.db):
+                    self._commit()
             return instance
         except SQLAlchemyError as e:
-            self.db.rollback()
+            self._rollback()
             raise e
 
     def get_by_id(self, model, id: int):
         """
         Retrieve an instance of a model by its ID.
         """
-        instance = self.db.query(model).filter(model.id == id).first()
+        instance = self.db.query(model).filter(primary_key(model) == id).first()
         if not instance:
             raise HTTPException(status_code=404, detail=f"{model.__name__} with ID {id} not found")
         return instance
@@ -116,15 +335,151 @@ class DatabaseUtils:
         """
         return self.db.query(model).all()
 
+    def get_page(self, model, limit: int, cursor: str = None, sort: str = None,
+                 allowed_sorts=(), filters: dict = None, columns=None):
+        """
+        Retrieve one page of a model using keyset (cursor) pagination.
+
+        Rows are ordered by the optional sort field and then the primary key, and each
+        page starts right after the last row of the previous one, so fetching a page
+        costs the same regardless of how deep into the table it is.
+
+        Args:
+            model: SQLAlchemy model class.
+            limit (int): Maximum number of rows to return.
+            cursor (str): Opaque cursor returned with the previous page, if any.
+            sort (str): Field to sort by, prefixed with `-` for descending order.
+            allowed_sorts: Field names that may be used in `sort`.
+            filters (dict): Field-value pairs to filter by.
+            columns: Attribute names to select. When given, rows are returned as plain dicts
+                instead of ORM instances, so they skip identity-map tracking and attribute
+                instrumentation, and columns a response does not need are never read.
+
+        Returns:
+            tuple: (list of instances or dicts, cursor of the next page or None on the last page).
+        """
+        pk = primary_key(model)
+        field, descending = parse_sort(sort, allowed_sorts) if sort else (pk.key, False)
+        sort_column = getattr(model, field)
+        order_columns = [sort_column] if sort_column is pk else [sort_column, pk]
+
+        if columns:
+            selected = list(dict.fromkeys([*columns, *(column.key for column in order_columns)]))
+            query = self.db.query(*[getattr(model, column) for column in selected])
+        else:
+            query = self.db.query(model)
+        query = query.filter_by(**(filters or {}))
+        if cursor:
+            position = decode_cursor(cursor)
+            values = position.get("after")
+            if position.get("sort") != (sort or pk.key) or not isinstance(values, list) \
+                    or len(values) != len(order_columns):
+                raise HTTPException(status_code=400, detail="Pagination cursor does not match the requested sort")
+            values = [coerce_cursor_value(column, value) for column, value in zip(order_columns, values)]
+            if descending:
+                query = query.filter(tuple_(*order_columns) < tuple_(*values))
+            else:
+                query = query.filter(tuple_(*order_columns) > tuple_(*values))
+
+        query = query.order_by(*[column.desc() if descending else column for column in order_columns])
+        items = query.limit(limit + 1).all()
+        if columns:
+            items = [dict(row._mapping) for row in items]
+
+        next_cursor = None
+        if len(items) > limit:
+            items = items[:limit]
+            last = items[-1]
+            next_cursor = encode_cursor({
+                "sort": sort or pk.key,
+                "after": [last[column.key] if columns else getattr(last, column.key) for column in order_columns],
+            })
+        return items, next_cursor
+
+    def get_version(self, model, filters: dict = None) -> tuple:
+        """
+        Summarize the state of a table for cache validation.
+
+        Inserts and updates move the latest `updated_at`; deletes are covered by the
+        newest tombstone of the table. Both maxima are read from indexes in a single
+        statement, so the cost does not grow with the table.
+
+        `updated_at` is stamped by the writer before commit, so a transaction that commits
+        after a later-stamped one leaves the maximum unchanged. For change-tracked models on
+        PostgreSQL the version is therefore built from the latest `txid` instead, together
+        with the transactions still in progress below it: any of them committing, or a
+        newer write, changes the version.
+
+        Args:
+            model: SQLAlchemy model class with an `updated_at` column.
+            filters (dict): Field-value pairs to filter by. Tombstones are not filtered,
+                so a delete anywhere in the table changes the version.
+
+        Returns:
+            tuple: (latest change time or None when there are no rows and no deletes,
+            opaque version string for ETags).
+        """
+        def latest_row(column):
+            return select(func.max(column)).filter_by(**(filters or {})).scalar_subquery()
+
+        def latest_delete(column):
+            return select(func.max(column)).where(Tombstone.entity == model.__tablename__).scalar_subquery()
+
+        columns = [latest_row(model.updated_at), latest_delete(Tombstone.updated_at)]
+        by_txid = hasattr(model, "txid") and self.db.get_bind().dialect.name == "postgresql"
+        if by_txid:
+            columns += [
+                latest_row(model.txid),
+                latest_delete(Tombstone.txid),
+                cast(func.txid_current_snapshot(), String),
+            ]
+        result = self.db.execute(select(*columns)).one()
+        last_modified = max((timestamp for timestamp in result[:2] if timestamp is not None), default=None)
+        if not by_txid:
+            return last_modified, str(last_modified)
+
+        latest_txid = max((txid for txid in result[2:4] if txid is not None), default=0)
+        in_progress = [int(txid) for txid in result[4].split(":")[2].split(",") if txid and int(txid) < latest_txid]
+        return last_modified, f"{latest_txid}:{','.join(map(str, sorted(in_progress)))}"
+
+    def stream_rows(self, model, columns=None, batch_size: int = 1000):
+        """
+        Yield the rows of a model as dicts without loading the whole table.
+
+        Rows are read through a server-side cursor (`yield_per`), `batch_size` at a time,
+        in primary key order. Only the requested columns are selected and no ORM
+        instances are built.
+
+        Args:
+            model: SQLAlchemy model class.
+            columns: Attribute names to select. Defaults to every mapped column.
+            batch_size (int): Rows fetched per round trip.
+
+        Yields:
+            dict: One row, keyed by attribute name.
+        """
+        columns = columns or [attribute.key for attribute in inspect(model).column_attrs]
+        statement = (
+            select(*[getattr(model, column) for column in columns])
+            .order_by(primary_key(model))
+            .execution_options(yield_per=batch_size)
+        )
+        result = self.db.execute(statement)
+        try:
+            for row in result:
+                yield dict(row._mapping)
+        finally:
+            result.close()
+
     def delete_and_commit(self, instance):
         """
         Delete an instance from the database and commit the session.
         """
         try:
             self.db.delete(instance)
-            self.db.commit()
+            self._commit()
         except SQLAlchemyError as e:
-            self.db.rollback()
+            self._rollback()
             raise e
 
     def find_and_update(self, model, id: int, updated_data: dict):
@@ -139,14 +494,301 @@ class DatabaseUtils:
     def bulk_update(self, model, updates: list[dict]):
         """
         Bulk update multiple records in the database.
+
+        All records are loaded with one query and written in a single transaction.
+        Raises 400 for an update without an ID and 404 if any record does not exist.
         """
-        updated_instances = []
+        pk = primary_key(model)
+        ids = []
         for update_data in updates:
-            id = update_data.pop("id", None)
+            id = update_data.pop(pk.key, None)
             if not id:
                 raise HTTPException(status_code=400, detail="Missing ID for bulk update")
-            instance = self.get_by_id(model, id)
+            ids.append(id)
+
+        instances = {getattr(instance, pk.key): instance for instance in self.db.query(model).filter(pk.in_(ids))}
+        for id, update_data in zip(ids, updates):
+            instance = instances.get(id)
+            if instance is None:
+                raise HTTPException(status_code=404, detail=f"{model.__name__} with ID {id} not found")
             for key, value in update_data.items():
                 setattr(instance, key, value)
-            updated_instances.append(self.commit_and_refresh(instance))
-        return updated_instances
+        self.commit()
+        return [instances[id] for id in ids]
+
+    def bulk_update_rows(self, model, updates: list[dict], returning: bool = False, chunk_size: int = 1000) -> dict:
+        """
+        Update many records by primary key with set-based statements in one transaction.
+
+        The targeted records are loaded with a single query, then each row's values are
+        coerced to their column types and run through the model's validators against the
+        stored record. Invalid rows are reported and skipped instead of aborting the batch.
+        Valid rows are grouped by the columns they set and each chunk of a group is sent as
+        one UPDATE ... FROM (VALUES ...) statement. If the database rejects a chunk, it is
+        split in halves and retried in savepoints until the offending rows are isolated, so
+        only they fail and a few bad rows cost a few extra statements, not one per row.
+        When an ID repeats in the batch its rows are applied in order. Requires PostgreSQL.
+
+        Args:
+            model: SQLAlchemy model class.
+            updates (list[dict]): Rows containing the primary key and the values to set.
+            returning (bool): Load the updated instances with one SELECT after the UPDATEs
+                and return them instead of their IDs.
+            chunk_size (int): Rows sent per statement.
+
+        Returns:
+            dict: `updated` (IDs or instances) and `failed` (index, id and error per rejected row).
+        """
+        pk = primary_key(model)
+        columns = set(inspect(model).column_attrs.keys())
+        failed = []
+        candidates = []
+        for index, update_data in enumerate(updates):
+            id = update_data.get(pk.key)
+            values = {key: value for key, value in update_data.items() if key != pk.key}
+            unknown = sorted(set(values) - columns)
+            if id is None:
+                failed.append({"index": index, "id": None, "error": "Missing ID for bulk update"})
+            elif unknown:
+                failed.append({"index": index, "id": id, "error": f"Unknown fields: {', '.join(unknown)}"})
+            elif not values:
+                failed.append({"index": index, "id": id, "error": "No fields to update"})
+            else:
+                try:
+                    candidates.append((index, coerce_column_value(model, pk.key, id), values))
+                except ValueError as e:
+                    failed.append({"index": index, "id": id, "error": str(e)})
+
+        requested_ids = {id for _, id, _ in candidates}
+        table = model.__table__
+        stored = {
+            row[pk.key]: dict(row) for row in self.db.execute(select(table).where(pk.in_(requested_ids))).mappings()
+        } if requested_ids else {}
+        rows = []
+        for index, id, values in candidates:
+            if id not in stored:
+                failed.append({"index": index, "id": id, "error": f"{model.__name__} with ID {id} not found"})
+                continue
+            try:
+                rows.append((index, {pk.key: id, **self.validate_values(model, values, current=stored[id])}))
+            except ValueError as e:
+                failed.append({"index": index, "id": id, "error": str(e)})
+
+        updated = []
+
+        def apply(chunk):
+            try:
+                with self.db.begin_nested():
+                    self.db.execute(_update_from_values(model, [row for _, row in chunk]))
+                updated.extend((index, row[pk.key]) for index, row in chunk)
+            except DBAPIError as e:
+                if len(chunk) == 1:
+                    index, row = chunk[0]
+                    error = str(e.orig).strip().splitlines()[0]
+                    failed.append({"index": index, "id": row[pk.key], "error": error})
+                    return
+                middle = len(chunk) // 2
+                apply(chunk[:middle])
+                apply(chunk[middle:])
+
+        # A row repeating an earlier ID goes in a later round, so repeated IDs are applied in order
+        occurrences = {}
+        rounds = []
+        for index, row in rows:
+            occurrence = occurrences[row[pk.key]] = occurrences.get(row[pk.key], -1) + 1
+            rounds.append((occurrence, tuple(sorted(row)), index, row))
+        rounds.sort(key=lambda item: item[:3])
+        try:
+            for _, group in groupby(rounds, key=lambda item: item[:2]):
+                group = [(index, row) for _, _, index, row in group]
+                for start in range(0, len(group), chunk_size):
+                    apply(group[start:start + chunk_size])
+            self._commit()
+        except SQLAlchemyError as e:
+            self._rollback()
+            raise e
+
+        updated_ids = list(dict.fromkeys(id for _, id in sorted(updated)))
+        if returning:
+            updated = (
+                self.db.query(model).filter(pk.in_(updated_ids)).order_by(pk).populate_existing().all()
+                if updated_ids else []
+            )
+        else:
+            updated = updated_ids
+        return {"updated": updated, "failed": sorted(failed, key=lambda failure: failure["index"])}
+
+    def bulk_insert_rows(self, model, rows: list[dict], unique_column: str, chunk_size: int = 1000) -> dict:
+        """
+        Insert many records with multi-row INSERT ... RETURNING statements in one transaction.
+
+        Values are run through the model's validators up front. Rows that fail validation,
+        repeat a unique value earlier in the batch or already exist are reported and skipped
+        (ON CONFLICT DO NOTHING) instead of aborting the batch. Requires PostgreSQL.
+
+        Args:
+            model: SQLAlchemy model class.
+            rows (list[dict]): Column values of the records to create.
+            unique_column (str): Unique column identifying a record, e.g. "product_name".
+            chunk_size (int): Rows sent per INSERT statement.
+
+        Returns:
+            dict: `created` (index and id per inserted row) and `failed` (index and error per rejected row).
+        """
+        pk = primary_key(model)
+        unique = getattr(model, unique_column)
+        columns = set(inspect(model).column_attrs.keys())
+        failed = []
+        candidates = {}
+        for index, values in enumerate(rows):
+            unknown = sorted(set(values) - columns)
+            if unknown:
+                failed.append({"index": index, "error": f"Unknown fields: {', '.join(unknown)}"})
+                continue
+            try:
+                values = self.validate_values(model, values)
+            except ValueError as e:
+                failed.append({"index": index, "error": str(e)})
+                continue
+            key = values.get(unique_column)
+            if key in candidates:
+                failed.append({"index": index, "error": f"Duplicate {unique_column} '{key}' in batch"})
+            else:
+                candidates[key] = (index, values)
+
+        inserted = {}
+        pending = list(candidates.values())
+        try:
+            for start in range(0, len(pending), chunk_size):
+                chunk = [values for _, values in pending[start:start + chunk_size]]
+                statement = (
+                    pg_insert(model)
+                    .values(chunk)
+                    .on_conflict_do_nothing(index_elements=[unique])
+                    .returning(pk, unique)
+                )
+                inserted.update((key, id) for id, key in self.db.execute(statement))
+            self._commit()
+        except SQLAlchemyError as e:
+            self._rollback()
+            raise e
+
+        created = []
+        for key, (index, _) in candidates.items():
+            if key in inserted:
+                created.append({"index": index, "id": inserted[key]})
+            else:
+                failed.append({"index": index, "error": f"{model.__name__} with {unique_column} '{key}' already exists"})
+        return {"created": created, "failed": sorted(failed, key=lambda failure: failure["index"])}
+
+    def bulk_upsert_rows(self, model, rows: list[dict], unique_column: str, chunk_size: int = 1000) -> dict:
+        """
+        Insert or update many records by a unique column with INSERT ... ON CONFLICT DO UPDATE.
+
+        Each chunk is a single statement returning the affected rows, and all chunks are
+        committed together. Values are run through the model's validators up front and
+        invalid rows are reported and skipped. When a unique value repeats in the batch the
+        last row wins. Rows whose values already match are left untouched, so their
+        `updated_at` does not move. Requires PostgreSQL.
+
+        Args:
+            model: SQLAlchemy model class.
+            rows (list[dict]): Column values, each including `unique_column`.
+            unique_column (str): Unique column the rows are matched on, e.g. "product_name".
+            chunk_size (int): Rows sent per statement.
+
+        Returns:
+            dict: `upserted` (index, id, status "created"/"updated"/"unchanged" and the row
+            as a dict, per accepted row) and `failed` (index and error per rejected row).
+        """
+        unique = getattr(model, unique_column)
+        table = model.__table__
+        columns = set(inspect(model).column_attrs.keys())
+        failed = []
+        candidates = {}
+        for index, values in enumerate(rows):
+            unknown = sorted(set(values) - columns)
+            if unknown:
+                failed.append({"index": index, "error": f"Unknown fields: {', '.join(unknown)}"})
+                continue
+            if values.get(unique_column) is None:
+                failed.append({"index": index, "error": f"Missing {unique_column}"})
+                continue
+            try:
+                values = self.validate_values(model, values)
+            except ValueError as e:
+                failed.append({"index": index, "error": str(e)})
+                continue
+            key = values[unique_column]
+            indexes = candidates.pop(key, ([], None))[0]
+            candidates[key] = (indexes + [index], values)
+
+        affected = {}
+        pending = list(candidates.values())
+        try:
+            for start in range(0, len(pending), chunk_size):
+                chunk = [values for _, values in pending[start:start + chunk_size]]
+                statement = pg_insert(model).values(chunk)
+                changed = [name for name in chunk[0] if name != unique_column]
+                excluded = statement.excluded
+                # ON CONFLICT DO UPDATE skips `onupdate`, so take those columns (updated_at, txid) from the insert
+                stamps = {column.name: excluded[column.name] for column in table.c if column.onupdate is not None}
+                statement = statement.on_conflict_do_update(
+                    index_elements=[unique],
+                    set_={**{name: excluded[name] for name in changed}, **stamps},
+                    where=or_(*[table.c[name].is_distinct_from(excluded[name]) for name in changed]) if changed else None,
+                ).returning(*table.c, literal_column("(xmax = 0)").label("_created"))
+                for row in self.db.execute(statement).mappings():
+                    row = dict(row)
+                    affected[row[unique_column]] = ("created" if row.pop("_created") else "updated", row)
+
+            unchanged = [key for key in candidates if key not in affected]
+            if unchanged:
+                for row in self.db.execute(select(table).where(unique.in_(unchanged))).mappings():
+                    affected[row[unique_column]] = ("unchanged", dict(row))
+            self._commit()
+        except SQLAlchemyError as e:
+            self._rollback()
+            raise e
+
+        pk = primary_key(model)
+        upserted = []
+        for key, (indexes, _) in candidates.items():
+            status, row = affected[key]
+            upserted.extend({"index": index, "id": row[pk.key], "status": status, "row": row} for index in indexes)
+        return {
+            "upserted": sorted(upserted, key=lambda result: result["index"]),
+            "failed": sorted(failed, key=lambda failure: failure["index"]),
+        }
+
+    @staticmethod
+    def validate_values(model, values: dict, current: dict = None) -> dict:
+        """
+        Coerce values to their column types, run the model's @validates hooks on a transient
+        instance and return the validated values.
+
+        Values are set in column order, so validators comparing fields (e.g. an end date
+        after a start date) see the fields declared before them.
+
+        Args:
+            model: SQLAlchemy model class.
+            values (dict): Column values to validate.
+            current (dict): The record's stored column values, loaded into the probe first
+                so validators of a partial update can compare against them.
+
+        Raises:
+            ValueError: If a value has the wrong type or a validator rejects it.
+        """
+        probe = model()
+        table_columns = inspect(model).columns
+        for key, value in (current or {}).items():
+            set_committed_value(probe, key, _as_utc(table_columns[key], value))
+        order = {key: position for position, key in enumerate(table_columns.keys())}
+        for key in sorted(values, key=lambda key: order.get(key, len(order))):
+            value = coerce_column_value(model, key, values[key]) if key in order else values[key]
+            try:
+                setattr(probe, key, value)
+            except (TypeError, AttributeError) as e:
+                raise ValueError(f"Invalid value for {key}: {e}")
+        return {key: getattr(probe, key) for key in values}
+
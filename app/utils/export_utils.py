@@ -0,0 +1,59 @@
+from itertools import islice
+from pydantic_core import to_json
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "json": "application/json",
+}
+
+
+def _chunks(rows, size: int):
+    """
+    Group an iterable of rows into lists of at most `size` rows.
+    """
+    rows = iter(rows)
+    while chunk := list(islice(rows, size)):
+        yield chunk
+
+
+def encode_ndjson(rows, chunk_size: int = 500):
+    """
+    Encode rows as newline-delimited JSON, one object per line.
+
+    Args:
+        rows: Iterable of JSON-serializable dicts.
+        chunk_size (int): Number of rows written per chunk.
+
+    Yields:
+        bytes: Encoded chunks.
+    """
+    for chunk in _chunks(rows, chunk_size):
+        yield b"".join(to_json(row) + b"\n" for row in chunk)
+
+
+def encode_json_array(rows, chunk_size: int = 500):
+    """
+    Encode rows as a single JSON array written incrementally.
+
+    Args:
+        rows: Iterable of JSON-serializable dicts.
+        chunk_size (int): Number of rows written per chunk.
+
+    Yields:
+        bytes: Encoded chunks.
+    """
+    yield b"["
+    separator = b""
+    for chunk in _chunks(rows, chunk_size):
+        yield separator + b",".join(to_json(row) for row in chunk)
+        separator = b","
+    yield b"]"
+
+
+def encode_export(rows, export_format: str, chunk_size: int = 500):
+    """
+    Encode rows in the requested export format ("ndjson" or "json").
+    """
+    if export_format == "json":
+        return encode_json_array(rows, chunk_size)
+    return encode_ndjson(rows, chunk_size)
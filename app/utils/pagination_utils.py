@@ -0,0 +1,69 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from fastapi import HTTPException
+from pydantic_core import to_json
+
+
+def encode_cursor(data: dict) -> str:
+    """
+    Encode pagination state into an opaque, URL-safe cursor.
+
+    Args:
+        data (dict): JSON-serializable state (datetimes are encoded as ISO strings).
+
+    Returns:
+        str: The encoded cursor.
+    """
+    return base64.urlsafe_b64encode(to_json(data)).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> dict:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    if not isinstance(data, dict):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+    return data
+
+
+def parse_sort(sort: str, allowed_fields) -> tuple:
+    """
+    Parse a sort parameter such as `product_name` or `-product_amount`.
+
+    Args:
+        sort (str): Field name, prefixed with `-` for descending order.
+        allowed_fields: Field names that may be sorted on.
+
+    Returns:
+        tuple: (field name, descending flag).
+
+    Raises:
+        HTTPException: 400 if the field is not sortable.
+    """
+    descending = sort.startswith("-")
+    field = sort[1:] if descending else sort
+    if field not in allowed_fields:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cannot sort by '{field}'. Allowed fields: {', '.join(allowed_fields)}",
+        )
+    return field, descending
+
+
+def coerce_cursor_value(column, value):
+    """
+    Convert a JSON-decoded cursor value back to the Python type of its column.
+    """
+    if value is not None and column.type.python_type is datetime and isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return value
@@ -0,0 +1,111 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from hashlib import sha256
+from typing import Callable, Iterable, Optional, Tuple
+
+
+def token_digest(token: str) -> str:
+    """
+    Hash a token so raw JWTs are never kept in memory.
+    """
+    return sha256(token.encode()).hexdigest()
+
+
+def _to_timestamp(value: datetime) -> float:
+    """
+    Convert a datetime to a POSIX timestamp, treating naive values as UTC.
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+class RevocationList:
+    """
+    In-memory set of revoked access tokens, each kept until the token itself expires.
+
+    The set is periodically merged with the blacklisted tokens stored in the database,
+    so revocations made by other workers are picked up within `refresh_interval` seconds.
+    The first load reads every revocation; later loads only read those changed since the
+    previous load (see `since`).
+    """
+
+    def __init__(self, refresh_interval: float, overlap: float = 0.0, timer: Callable[[], float] = time.monotonic):
+        """
+        Initialize the revocation list.
+
+        Args:
+            refresh_interval (float): Seconds between reloads from the database.
+            overlap (float): Seconds each incremental load reaches back before the previous one.
+            timer (Callable): Monotonic clock, overridable for testing.
+        """
+        self.refresh_interval = refresh_interval
+        self.overlap = timedelta(seconds=overlap)
+        self._timer = timer
+        self._revoked = {}
+        self._lock = threading.Lock()
+        self._next_refresh_at = 0.0
+        self._since = None
+
+    def add(self, token: str, expires_at: datetime) -> None:
+        """
+        Mark a token as revoked until its expiration time.
+        """
+        with self._lock:
+            self._revoked[token_digest(token)] = _to_timestamp(expires_at)
+
+    def since(self) -> Optional[datetime]:
+        """
+        Return the oldest change time the next load must read, or None for a full load.
+        """
+        with self._lock:
+            return self._since
+
+    def merge(self, entries: Iterable[Tuple[str, datetime]], loaded_at: datetime = None) -> None:
+        """
+        Add (token, expires_at) pairs loaded from the database and drop expired entries.
+
+        Args:
+            entries: Revoked tokens and their expiration times.
+            loaded_at (datetime): When the load started. The next load then only reads
+                revocations changed after `loaded_at` minus the overlap.
+        """
+        loaded = {token_digest(token): _to_timestamp(expires_at) for token, expires_at in entries}
+        now = time.time()
+        with self._lock:
+            self._revoked.update(loaded)
+            self._revoked = {digest: expires for digest, expires in self._revoked.items() if expires > now}
+            if loaded_at is not None:
+                self._since = loaded_at - self.overlap
+
+    def contains(self, token: str) -> bool:
+        """
+        Check whether a token has been revoked.
+        """
+        with self._lock:
+            return token_digest(token) in self._revoked
+
+    def claim_refresh(self) -> bool:
+        """
+        Return True for exactly one caller once the refresh interval has elapsed.
+        """
+        with self._lock:
+            now = self._timer()
+            if now < self._next_refresh_at:
+                return False
+            self._next_refresh_at = now + self.refresh_interval
+            return True
+
+    def reset(self) -> None:
+        """
+        Forget all revocations and force a reload on the next check.
+        """
+        with self._lock:
+            self._revoked = {}
+            self._next_refresh_at = 0.0
+            self._since = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._revoked)
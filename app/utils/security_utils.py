@@ -1,10 +1,24 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from hashlib import sha256
+from fastapi import HTTPException, status
 from passlib.context import CryptContext
 from app.core.config import config
 
 # Password hashing utilities
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Dedicated workers for bcrypt so hashing never runs on the event loop or holds a request threadpool slot.
+# bcrypt releases the GIL, so throughput scales with the number of workers up to the number of cores.
+password_executor = ThreadPoolExecutor(
+    max_workers=config.PASSWORD_HASH_WORKERS,
+    thread_name_prefix="password-hash",
+)
+
+# Limits running plus queued hash operations; requests beyond it are rejected with 503
+password_slots = threading.BoundedSemaphore(config.PASSWORD_HASH_WORKERS + config.PASSWORD_HASH_MAX_QUEUE)
+
 
 def hash_password(password: str) -> str:
     """
@@ -33,6 +47,60 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+async def _run_password_task(func, *args):
+    """
+    Run a password hashing function on the dedicated worker pool.
+
+    The slot is released when the job itself finishes (or is cancelled before it
+    starts), not when the caller stops waiting, so cancelled requests cannot push
+    more work onto the pool than the limit allows.
+
+    Raises:
+        HTTPException: 503 if the pool and its queue are already full.
+    """
+    slots = password_slots
+    if not slots.acquire(blocking=False):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many concurrent authentication requests, please retry",
+            headers={"Retry-After": "1"},
+        )
+    try:
+        future = password_executor.submit(func, *args)
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(lambda _: slots.release())
+    return await asyncio.wrap_future(future)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a plain-text password on the password hashing worker pool.
+
+    Args:
+        password (str): Plain-text password to hash.
+
+    Returns:
+        str: Hashed password.
+    """
+    return await _run_password_task(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a plain-text password against a hashed password on the password hashing worker pool.
+
+    Args:
+        plain_password (str): The plain-text password.
+        hashed_password (str): The hashed password.
+
+    Returns:
+        bool: True if the passwords match, False otherwise.
+    """
+    return await _run_password_task(verify_password, plain_password, hashed_password)
+
+
 def generate_secure_value(input_value: str) -> str:
     """
     Generate a secure hash using the app's SECRET_KEY.
@@ -0,0 +1,68 @@
+from collections.abc import Mapping
+from functools import lru_cache
+from fastapi import Response
+from pydantic_core import to_json
+
+
+class JSONBytesResponse(Response):
+    """
+    Response for a body that has already been encoded to JSON bytes.
+    """
+    media_type = "application/json"
+
+
+@lru_cache(maxsize=None)
+def _field_names(schema: type) -> tuple:
+    """
+    Return the field names of a response schema, computed once per schema.
+    """
+    return tuple(schema.model_fields)
+
+
+def dump_row(schema: type, obj) -> dict:
+    """
+    Extract the fields of a response schema from an ORM object or mapping.
+
+    The values are not validated: they already passed the model validators on the
+    way into the database, so checking them again on the way out only costs CPU.
+
+    Args:
+        schema (type): Pydantic response model whose fields are extracted.
+        obj: ORM instance, row mapping or dict providing the fields.
+
+    Returns:
+        dict: Field name to value.
+    """
+    if isinstance(obj, Mapping):
+        return {name: obj[name] for name in _field_names(schema) if name in obj}
+    return {name: getattr(obj, name) for name in _field_names(schema)}
+
+
+def dump_rows(schema: type, objs) -> list:
+    """
+    Extract the fields of a response schema from each object in `objs`.
+    """
+    names = _field_names(schema)
+    return [
+        {name: obj[name] for name in names if name in obj} if isinstance(obj, Mapping)
+        else {name: getattr(obj, name) for name in names}
+        for obj in objs
+    ]
+
+
+def json_response(content, status_code: int = 200, headers: dict = None) -> JSONBytesResponse:
+    """
+    Encode content with the pydantic-core JSON encoder.
+
+    Returning a Response directly stops FastAPI from validating the data again against
+    the route's `response_model`, which is kept for the OpenAPI schema only.
+
+    Args:
+        content: Dicts, lists and scalars (datetimes are encoded as ISO 8601 strings).
+        status_code (int): HTTP status code.
+        headers (dict): Extra response headers.
+
+    Returns:
+        JSONBytesResponse: The encoded response.
+    """
+    return JSONBytesResponse(content=to_json(content), status_code=status_code, headers=headers)
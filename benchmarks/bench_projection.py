@@ -0,0 +1,78 @@
+"""
+Compare loading list rows as ORM entities with the column projection path.
+
+Both paths load every row as a single page with `DatabaseUtils.get_page`: the entity
+path without `columns`, the projection path with the fields of `ProductResponse`, as
+the list endpoints do. Each path is timed, then its peak Python memory is measured
+with tracemalloc.
+
+Rows are inserted into the products table of DATABASE_URL inside a transaction that
+is rolled back at the end, so the database is left unchanged:
+
+    python -m benchmarks.bench_projection --rows 100000 --repeat 3
+"""
+import argparse
+import gc
+import time
+import tracemalloc
+from sqlalchemy import insert
+from app.db.database import SessionLocal
+from app.models.product import Product
+from app.schemas.product import ProductResponse
+from app.utils.database_utils import DatabaseUtils
+
+
+def measure(func, repeat: int) -> tuple:
+    """
+    Return the best time in milliseconds and the peak traced memory in MiB of `func`.
+
+    Timing runs are not traced, since tracemalloc slows allocation-heavy code down.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    gc.collect()
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best * 1000, peak / 2 ** 20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000, help="Products to load.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per path.")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        db.execute(insert(Product), [
+            {"product_name": f"Benchmark product {i}", "product_amount": 1 + i % 1000}
+            for i in range(args.rows)
+        ])
+        database = DatabaseUtils(db)
+        columns = tuple(ProductResponse.model_fields)
+
+        def entities():
+            rows, _ = database.get_page(Product, args.rows)
+            db.expunge_all()
+            return rows
+
+        entity_ms, entity_mib = measure(entities, args.repeat)
+        projection_ms, projection_mib = measure(lambda: database.get_page(Product, args.rows, columns=columns), args.repeat)
+    finally:
+        db.rollback()
+        db.close()
+
+    print(f"rows loaded: {args.rows:,}")
+    print(f"ORM entities:       {entity_ms:9.1f} ms  {entity_mib:8.1f} MiB peak")
+    print(f"column projection:  {projection_ms:9.1f} ms  {projection_mib:8.1f} MiB peak")
+    print(f"speed-up: {entity_ms / projection_ms:.1f}x, memory: {entity_mib / projection_mib:.1f}x less")
+
+
+if __name__ == "__main__":
+    main()
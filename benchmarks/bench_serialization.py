@@ -0,0 +1,68 @@
+"""
+Compare the default FastAPI response path with the fast serialization path.
+
+The default path validates the handler's return value against the route's
+`response_model` and renders it with `JSONResponse`; the fast path extracts the
+schema's fields from each row and encodes them with the pydantic-core JSON
+encoder (see app/utils/serialization_utils.py).
+
+Runs on transient ORM instances and never connects to the database, but
+DATABASE_URL must be set because the models import the engine:
+
+    python -m benchmarks.bench_serialization --rows 1000 --repeat 50
+"""
+import argparse
+import asyncio
+import time
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from app.models.product import Product
+from app.schemas.product import ProductListResponse, ProductResponse
+from app.utils.serialization_utils import dump_rows, json_response
+
+
+def default_path(field, products):
+    content = asyncio.run(serialize_response(field=field, response_content={"products": products, "next_cursor": None}))
+    return JSONResponse(content).body
+
+
+def fast_path(products):
+    return json_response({"products": dump_rows(ProductResponse, products), "next_cursor": None}).body
+
+
+def measure(func, repeat: int) -> float:
+    """
+    Return the best per-call time in milliseconds over `repeat` runs.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000, help="Products per response.")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per path.")
+    args = parser.parse_args()
+
+    products = [
+        Product(product_id=i, product_name=f"Product {i}", product_amount=9.99 + i)
+        for i in range(args.rows)
+    ]
+    field = create_model_field("Response_get_products", ProductListResponse, mode="serialization")
+
+    default_ms = measure(lambda: default_path(field, products), args.repeat)
+    fast_ms = measure(lambda: fast_path(products), args.repeat)
+
+    print(f"rows per response: {args.rows}")
+    print(f"default response_model path: {default_ms:8.3f} ms")
+    print(f"fast serialization path:     {fast_ms:8.3f} ms")
+    print(f"CPU saved per request:       {default_ms - fast_ms:8.3f} ms ({default_ms / fast_ms:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
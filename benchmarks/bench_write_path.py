@@ -0,0 +1,110 @@
+"""
+Compare single-row writes with and without the refresh SELECT after commit.
+
+Each service creates `--rows` records one at a time through its `create_*` method,
+once with DB_REFRESH_AFTER_WRITE enabled (commit, then SELECT the row back) and once
+with it disabled (generated values come back with INSERT ... RETURNING). The mean
+latency per write and the statements issued per write are reported for each path.
+
+Rows are written to DATABASE_URL and deleted again afterwards:
+
+    python -m benchmarks.bench_write_path --rows 500
+"""
+import argparse
+import time
+from datetime import datetime, timezone
+from sqlalchemy import delete, event
+from app.core.config import config
+from app.db.database import SessionLocal, engine
+from app.models.job_history import JobHistory
+from app.models.product import Product
+from app.models.service import Service
+from app.models.user import User
+from app.schemas.job_history import JobHistoryCreate
+from app.schemas.product import ProductCreate
+from app.schemas.service import ServiceCreate
+from app.services.job_history_service import JobHistoryService
+from app.services.product_service import ProductService
+from app.services.service_service import ServiceService
+
+
+class StatementCounter:
+    """
+    Count the SQL statements sent through the engine while enabled.
+    """
+    def __init__(self):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, *args):
+        self.count += 1
+
+    def close(self):
+        event.remove(engine, "before_cursor_execute", self._on_execute)
+
+
+def run(label: str, write, rows: int, refresh: bool, counter: StatementCounter) -> str:
+    """
+    Perform `rows` writes and return a formatted line with the mean latency and statements per write.
+    """
+    config.DB_REFRESH_AFTER_WRITE = refresh
+    counter.count = 0
+    start = time.perf_counter()
+    for i in range(rows):
+        write(i)
+    elapsed = time.perf_counter() - start
+    mode = "refresh" if refresh else "RETURNING"
+    return (
+        f"{label:<20} {mode:<10} {elapsed / rows * 1000:8.3f} ms/write"
+        f"  {counter.count / rows:5.2f} statements/write"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=500, help="Writes per service and mode.")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    counter = StatementCounter()
+    original = config.DB_REFRESH_AFTER_WRITE
+    user = User(email="write-path-benchmark@example.com", hashed_password="x", first_name="Bench", last_name="Mark")
+    db.add(user)
+    db.commit()
+    user_id = user.id
+    started = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    products, services, job_histories = ProductService(db), ServiceService(db), JobHistoryService(db)
+    cases = [
+        ("ProductService", lambda tag: lambda i: products.create_product(
+            ProductCreate(product_name=f"Write path {tag} {i}", product_amount=1 + i))),
+        ("ServiceService", lambda tag: lambda i: services.create_service(
+            ServiceCreate(service_name=f"Write path {tag} {i}", total_amount=1 + i))),
+        # model_construct: the schema compares start_date with a naive now(), the model with an aware one
+        ("JobHistoryService", lambda tag: lambda i: job_histories.create_job_history(JobHistoryCreate.model_construct(
+            user_id=user_id, location=f"Write path {tag} {i}", description="Benchmark",
+            is_active=True, start_date=started, end_date=None))),
+    ]
+    lines = []
+    try:
+        for label, make_write in cases:
+            for refresh in (True, False):
+                tag = "refresh" if refresh else "returning"
+                lines.append(run(label, make_write(tag), args.rows, refresh, counter))
+    finally:
+        config.DB_REFRESH_AFTER_WRITE = original
+        counter.close()
+        db.rollback()
+        db.execute(delete(Product).where(Product.product_name.like("Write path %")))
+        db.execute(delete(Service).where(Service.service_name.like("Write path %")))
+        db.execute(delete(JobHistory).where(JobHistory.user_id == user_id))
+        db.execute(delete(User).where(User.id == user_id))
+        db.commit()
+        db.close()
+
+    print(f"writes per service and mode: {args.rows:,}")
+    print("\n".join(lines))
+
+
+if __name__ == "__main__":
+    main()
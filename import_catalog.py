@@ -0,0 +1,51 @@
+"""
+Bulk import products or services from a CSV (with a header row) or NDJSON file.
+
+Rows are validated, loaded with COPY and merged on the unique name, so re-running
+an import updates existing rows instead of failing:
+
+    python import_catalog.py products catalog.csv
+    python import_catalog.py services - --format ndjson < services.ndjson
+"""
+import argparse
+import json
+import sys
+from app.db.database import SessionLocal
+from app.services.catalog_import_service import IMPORT_ENTITIES, CatalogImportService, read_records
+
+
+def print_progress(stats: dict) -> None:
+    print(
+        f"read {stats['read']:,} rows ({stats['rejected']:,} rejected) "
+        f"in {stats['seconds']:.1f}s, {stats['rows_per_second']:,.0f} rows/s",
+        file=sys.stderr,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bulk import products or services.")
+    parser.add_argument("entity", choices=sorted(IMPORT_ENTITIES), help="Table to import into.")
+    parser.add_argument("path", help="Input file, or - for standard input.")
+    parser.add_argument("--format", choices=("csv", "ndjson"), help="Input format. Defaults to the file extension, else csv.")
+    parser.add_argument("--batch-size", type=int, default=10000, help="Rows sent per COPY.")
+    args = parser.parse_args()
+
+    input_format = args.format or ("ndjson" if args.path.endswith((".ndjson", ".jsonl")) else "csv")
+    stream = sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8")
+    db = SessionLocal()
+    try:
+        stats = CatalogImportService(db).import_records(
+            args.entity,
+            read_records(stream, input_format),
+            batch_size=args.batch_size,
+            progress=print_progress,
+        )
+    finally:
+        db.close()
+        if stream is not sys.stdin:
+            stream.close()
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == "__main__":
+    main()
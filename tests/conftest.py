@@ -1,12 +1,16 @@
 import os
 import sys
 import pytest
+from contextlib import contextmanager
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 from app.db.database import Base, get_db
+from app.db.dependency import get_current_user
 from app.main import app
+from app.schemas.principal import Principal
+from app.services.catalog_cache import catalog_cache
 
 # Load environment variables
 load_dotenv()
@@ -62,6 +66,7 @@ def db():
         print("Tearing down test database: closing session and dropping tables...")
         db_session.close()
         Base.metadata.drop_all(bind=engine)
+        catalog_cache.clear()  # Cached rows would outlive the dropped tables
         print("Test database teardown complete.")
 
 
@@ -73,3 +78,39 @@ def test_client():
     """
     with TestClient(app) as client:
         yield client
+
+
+# Fixture for counting the SQL a block of code sends to the test database
+@pytest.fixture
+def record_statements():
+    """
+    Returns a context manager that collects the SQL statements executed on the test
+    database inside its block, e.g. `with record_statements() as statements: ...`.
+    """
+    @contextmanager
+    def record():
+        statements = []
+        listener = lambda conn, cursor, statement, *args: statements.append(statement)
+        event.listen(engine, "before_cursor_execute", listener)
+        try:
+            yield statements
+        finally:
+            event.remove(engine, "before_cursor_execute", listener)
+
+    return record
+
+
+# Fixture for authenticating requests without issuing tokens
+@pytest.fixture
+def sign_in():
+    """
+    Returns a function that makes the following requests authenticate as the given user,
+    optionally an admin. The override is removed when the test ends.
+    """
+    def sign_in(user_id: int = 1, is_admin: bool = False) -> Principal:
+        principal = Principal(id=user_id, email=f"user{user_id}@example.com", is_active=True, is_admin=is_admin)
+        app.dependency_overrides[get_current_user] = lambda: principal
+        return principal
+
+    yield sign_in
+    app.dependency_overrides.pop(get_current_user, None)
@@ -124,10 +124,33 @@ def test_user_job_history_relationship(db, sample_user):
     db.add_all([job1, job2])
     db.commit()
 
-    # Refresh the user and validate job histories
+    # Refresh the user and validate job histories, newest first
     db.refresh(sample_user)
     assert len(sample_user.job_histories) == 2
-    assert sample_user.job_histories[0].location == "New York"
-    assert sample_user.job_histories[1].location == "San Francisco"
-    assert strip_timezone(sample_user.job_histories[0].start_date) == strip_timezone(now - timedelta(days=365))
-    assert strip_timezone(sample_user.job_histories[0].end_date) == strip_timezone(now - timedelta(days=180))
+    assert sample_user.job_histories[0].location == "San Francisco"
+    assert sample_user.job_histories[1].location == "New York"
+    assert strip_timezone(sample_user.job_histories[1].start_date) == strip_timezone(now - timedelta(days=365))
+    assert strip_timezone(sample_user.job_histories[1].end_date) == strip_timezone(now - timedelta(days=180))
+
+
+def test_user_job_histories_are_ordered_newest_first(db, sample_user):
+    """
+    Test that User.job_histories follows the listing order: start date, then id, descending.
+    """
+    started = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    jobs = [
+        JobHistory(user_id=sample_user.id, location=location, description="Engineer", is_active=True, start_date=start_date)
+        for location, start_date in (
+            ("Oldest", started - timedelta(days=365)),
+            ("Same day, first", started),
+            ("Newest", started + timedelta(days=365)),
+            ("Same day, second", started),
+        )
+    ]
+    db.add_all(jobs)
+    db.commit()
+
+    db.refresh(sample_user)
+    assert [job.location for job in sample_user.job_histories] == [
+        "Newest", "Same day, second", "Same day, first", "Oldest"
+    ]
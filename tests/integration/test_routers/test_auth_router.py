@@ -0,0 +1,94 @@
+from app.models.user import User
+from app.utils.security_utils import hash_password
+
+
+def create_user(db, email="login_user@example.com", password="securepassword"):
+    user = User(
+        email=email,
+        hashed_password=hash_password(password),
+        first_name="Login",
+        last_name="User",
+        is_active=True
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_login_user(db, test_client):
+    """
+    Test that valid credentials return the user and a token pair.
+    """
+    create_user(db)
+
+    response = test_client.post(
+        "/api/v1/login",
+        data={"username": "login_user@example.com", "password": "securepassword"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["email"] == "login_user@example.com"
+    assert body["token"]["token_type"] == "bearer"
+
+
+def test_login_user_wrong_password(db, test_client):
+    """
+    Test that an invalid password is rejected.
+    """
+    create_user(db)
+
+    response = test_client.post(
+        "/api/v1/login",
+        data={"username": "login_user@example.com", "password": "wrongpassword"},
+    )
+
+    assert response.status_code == 401
+
+
+def test_register_user(db, test_client):
+    """
+    Test that registering a new email creates the user and issues a token.
+    """
+    response = test_client.post(
+        "/api/v1/register",
+        json={"email": "new_user@example.com", "password": "securepassword", "first_name": "New", "last_name": "User"},
+    )
+
+    assert response.status_code == 201
+    body = response.json()
+    assert body["email"] == "new_user@example.com"
+    assert body["token"]["access_token"]
+    assert db.query(User).filter_by(email="new_user@example.com").count() == 1
+
+
+def test_register_user_duplicate_email_ignores_case(db, test_client):
+    """
+    Test that an email registered in any letter case is rejected with 400 and nothing is written.
+    """
+    create_user(db, email="taken@example.com")
+
+    response = test_client.post(
+        "/api/v1/register",
+        json={"email": "Taken@Example.com", "password": "securepassword", "first_name": "Dup", "last_name": "User"},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+    db.expire_all()
+    assert db.query(User).count() == 1
+
+
+def test_login_user_ignores_email_case(db, test_client):
+    """
+    Test that login matches the email regardless of letter case.
+    """
+    create_user(db)
+
+    response = test_client.post(
+        "/api/v1/login",
+        data={"username": "Login_User@Example.com", "password": "securepassword"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["email"] == "login_user@example.com"
@@ -0,0 +1,46 @@
+from datetime import datetime, timezone
+from app.models.job_history import JobHistory
+from app.models.user import User
+
+
+def test_changes_requires_authentication(test_client):
+    """
+    Test that the change feed is not public.
+    """
+    assert test_client.get("/api/v1/changes/products").status_code == 401
+
+
+def test_changes_rejects_unknown_entity(test_client, db, sign_in):
+    """
+    Test that only the feed entities can be requested.
+    """
+    sign_in()
+    assert test_client.get("/api/v1/changes/users").status_code == 422
+    response = test_client.get("/api/v1/changes/services")
+
+    assert response.status_code == 200
+    assert set(response.json()) == {"changes", "watermark", "has_more"}
+
+
+def test_job_history_changes_are_admin_only(test_client, db, sign_in):
+    """
+    Test that a user cannot read other users' job histories through the change feed.
+    """
+    owner = User(email="owner@example.com", hashed_password="hashed", first_name="Own", last_name="Er")
+    reader = User(email="reader@example.com", hashed_password="hashed", first_name="Rea", last_name="Der")
+    db.add_all([owner, reader])
+    db.commit()
+    db.add(JobHistory(
+        user_id=owner.id, location="Private office", description="Secret project",
+        is_active=True, start_date=datetime(2020, 1, 1, tzinfo=timezone.utc),
+    ))
+    db.commit()
+
+    sign_in(reader.id)
+    response = test_client.get("/api/v1/changes/job_histories")
+    assert response.status_code == 403
+    assert "Private office" not in response.text
+
+    sign_in(reader.id, is_admin=True)
+    changes = test_client.get("/api/v1/changes/job_histories").json()["changes"]
+    assert [change["data"]["location"] for change in changes] == ["Private office"]
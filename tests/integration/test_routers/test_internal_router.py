@@ -0,0 +1,38 @@
+def test_pool_stats_requires_authentication(test_client):
+    """
+    Test that the pool statistics endpoint is not public.
+    """
+    response = test_client.get("/api/v1/internal/pool-stats")
+    assert response.status_code == 401
+
+
+def test_internal_stats_require_admin(test_client, sign_in):
+    """
+    Test that authenticated users without the admin role cannot read worker internals.
+    """
+    sign_in()
+    for path in ("pool-stats", "cache-stats", "token-purge-stats"):
+        assert test_client.get(f"/api/v1/internal/{path}").status_code == 403
+
+
+def test_pool_stats_reports_engine_pool(test_client, sign_in):
+    """
+    Test that the pool statistics endpoint reports the engine's pool.
+    """
+    sign_in(is_admin=True)
+    response = test_client.get("/api/v1/internal/pool-stats")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert "buckets" in body["wait_time"]
+
+
+def test_cache_stats_reports_permission_cache(test_client, sign_in):
+    """
+    Test that the cache statistics endpoint reports the permission cache.
+    """
+    sign_in(is_admin=True)
+    response = test_client.get("/api/v1/internal/cache-stats")
+
+    assert response.status_code == 200
+    assert "hit_ratio" in response.json()["permissions"]
@@ -0,0 +1,177 @@
+from datetime import datetime, timezone
+from app.core.config import config
+from app.models.job_history import JobHistory
+from app.models.user import User
+
+
+def create_user_with_jobs(db, email="history@example.com"):
+    """
+    Create a user with two past jobs and one active job, one year apart.
+    """
+    user = User(email=email, hashed_password="hashed_password", first_name="History", last_name="User")
+    db.add(user)
+    db.commit()
+    for year, is_active in ((2020, False), (2021, False), (2022, True)):
+        job = JobHistory(
+            user_id=user.id,
+            location=f"Office {year}",
+            description="Engineer",
+            is_active=is_active,
+            start_date=datetime(year, 1, 1, tzinfo=timezone.utc),
+        )
+        if not is_active:
+            job.end_date = datetime(year, 12, 31, tzinfo=timezone.utc)
+        db.add(job)
+    db.commit()
+    return user
+
+
+def test_list_user_jobs_is_paginated_newest_first(test_client, db, sign_in):
+    """
+    Test that a user's job histories are returned newest first, in pages linked by next_cursor.
+    """
+    user = create_user_with_jobs(db)
+    create_user_with_jobs(db, email="other@example.com")
+    sign_in(user.id)
+
+    response = test_client.get("/api/v1/job-history", params={"user_id": user.id, "limit": 2})
+    assert response.status_code == 200
+    first = response.json()
+    assert [job["location"] for job in first["job_histories"]] == ["Office 2022", "Office 2021"]
+    assert all(job["user_id"] == user.id for job in first["job_histories"])
+
+    response = test_client.get(
+        "/api/v1/job-history", params={"user_id": user.id, "limit": 2, "cursor": first["next_cursor"]}
+    )
+    second = response.json()
+    assert [job["location"] for job in second["job_histories"]] == ["Office 2020"]
+    assert second["next_cursor"] is None
+
+
+def test_list_user_jobs_filters_by_is_active(test_client, db, sign_in):
+    """
+    Test that is_active restricts the listing to active or past jobs.
+    """
+    user = create_user_with_jobs(db)
+    sign_in(user.id)
+
+    response = test_client.get("/api/v1/job-history", params={"user_id": user.id, "is_active": False})
+    assert [job["location"] for job in response.json()["job_histories"]] == ["Office 2021", "Office 2020"]
+
+    response = test_client.get("/api/v1/job-history", params={"user_id": user.id, "is_active": True})
+    assert [job["location"] for job in response.json()["job_histories"]] == ["Office 2022"]
+
+
+def test_list_user_jobs_without_history_is_empty(test_client, db, sign_in):
+    """
+    Test that a user without job histories gets an empty page rather than 404.
+    """
+    sign_in(1)
+    response = test_client.get("/api/v1/job-history", params={"user_id": 1})
+
+    assert response.status_code == 200
+    assert response.json() == {"job_histories": [], "next_cursor": None}
+
+
+def test_job_history_requires_authentication(test_client, db):
+    """
+    Test that every job history route rejects anonymous requests.
+    """
+    user = create_user_with_jobs(db)
+    job = db.query(JobHistory).filter_by(user_id=user.id).first()
+
+    assert test_client.get("/api/v1/job-history", params={"user_id": user.id}).status_code == 401
+    assert test_client.post("/api/v1/create-job-history", json={}).status_code == 401
+    assert test_client.put(f"/api/v1/edit-job-history/{job.id}", json={"location": "Moved"}).status_code == 401
+    assert test_client.delete(f"/api/v1/delete-job-history/{job.id}").status_code == 401
+
+
+def test_job_history_of_other_users_is_forbidden(test_client, db, sign_in):
+    """
+    Test that a user can neither read nor change another user's job history.
+    """
+    owner = create_user_with_jobs(db)
+    intruder = create_user_with_jobs(db, email="intruder@example.com")
+    job = db.query(JobHistory).filter_by(user_id=owner.id).order_by(JobHistory.start_date).first()
+    sign_in(intruder.id)
+
+    assert test_client.get("/api/v1/job-history", params={"user_id": owner.id}).status_code == 403
+    created = test_client.post("/api/v1/create-job-history", json={
+        "user_id": owner.id, "location": "Planted", "description": "Engineer",
+        "is_active": True, "start_date": "2023-01-01T00:00:00",
+    })
+    assert created.status_code == 403
+    assert test_client.put(f"/api/v1/edit-job-history/{job.id}", json={"location": "Moved"}).status_code == 403
+    assert test_client.delete(f"/api/v1/delete-job-history/{job.id}").status_code == 403
+
+    db.expire_all()
+    assert db.get(JobHistory, job.id).location == "Office 2020"
+    assert db.query(JobHistory).filter_by(user_id=owner.id).count() == 3
+
+
+def test_admin_can_manage_other_users_job_history(test_client, db, sign_in):
+    """
+    Test that an admin can list, edit and delete any user's job history.
+    """
+    owner = create_user_with_jobs(db)
+    job = db.query(JobHistory).filter_by(user_id=owner.id, is_active=False).first()
+    sign_in(owner.id + 1000, is_admin=True)
+
+    assert len(test_client.get("/api/v1/job-history", params={"user_id": owner.id}).json()["job_histories"]) == 3
+    edited = test_client.put(f"/api/v1/edit-job-history/{job.id}", json={"location": "Moved"})
+    assert edited.status_code == 200
+    assert edited.json()["location"] == "Moved"
+    assert test_client.delete(f"/api/v1/delete-job-history/{job.id}").status_code == 200
+
+
+def test_batch_user_jobs_groups_by_user_in_one_query(test_client, db, sign_in, record_statements):
+    """
+    Test that job histories of several users come back grouped by user id from a single query.
+    """
+    first = create_user_with_jobs(db)
+    second = create_user_with_jobs(db, email="other@example.com")
+    sign_in(first.id, is_admin=True)
+    with record_statements() as statements:
+        response = test_client.get(
+            "/api/v1/job-history/batch", params={"user_ids": [second.id, first.id, 9999], "is_active": False}
+        )
+
+    assert response.status_code == 200
+    body = response.json()["job_histories"]
+    assert list(body) == [str(second.id), str(first.id), "9999"]
+    assert [job["location"] for job in body[str(first.id)]] == ["Office 2021", "Office 2020"]
+    assert all(job["user_id"] == second.id for job in body[str(second.id)])
+    assert body["9999"] == []
+    assert len([s for s in statements if "job_histories" in s]) == 1
+
+
+def test_batch_user_jobs_only_returns_accessible_users(test_client, db, sign_in):
+    """
+    Test that the batch requires authentication and leaves out users the caller may not access.
+    """
+    own = create_user_with_jobs(db)
+    other = create_user_with_jobs(db, email="other@example.com")
+    params = {"user_ids": [other.id, own.id]}
+
+    assert test_client.get("/api/v1/job-history/batch", params=params).status_code == 401
+
+    sign_in(own.id)
+    response = test_client.get("/api/v1/job-history/batch", params=params)
+    assert response.status_code == 200
+    body = response.json()["job_histories"]
+    assert list(body) == [str(own.id)]
+    assert all(job["user_id"] == own.id for job in body[str(own.id)])
+
+    sign_in(other.id)
+    response = test_client.get("/api/v1/job-history/batch", params={"user_ids": [own.id]})
+    assert response.json() == {"job_histories": {}}
+
+
+def test_batch_user_jobs_limits_user_ids(test_client, sign_in):
+    """
+    Test that the number of user ids per request is capped.
+    """
+    sign_in(1, is_admin=True)
+    response = test_client.get("/api/v1/job-history/batch", params={"user_ids": list(range(config.JOB_HISTORY_BATCH_MAX_USERS + 1))})
+
+    assert response.status_code == 422
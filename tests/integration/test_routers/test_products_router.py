@@ -0,0 +1,178 @@
+import json
+from app.models.product import Product
+
+
+def test_list_products_is_paginated(test_client, db):
+    """
+    Test that the product list returns pages linked by next_cursor.
+    """
+    db.add_all([Product(product_name=f"Product {i}", product_amount=10 + i) for i in range(3)])
+    db.commit()
+
+    response = test_client.get("/api/v1/products", params={"limit": 2, "sort": "-product_amount"})
+    assert response.status_code == 200
+    first = response.json()
+    assert [p["product_amount"] for p in first["products"]] == [12, 11]
+
+    response = test_client.get(
+        "/api/v1/products", params={"limit": 2, "sort": "-product_amount", "cursor": first["next_cursor"]}
+    )
+    second = response.json()
+    assert [p["product_amount"] for p in second["products"]] == [10]
+    assert second["next_cursor"] is None
+
+
+def test_list_products_rejects_oversized_page(test_client):
+    """
+    Test that the page size is capped.
+    """
+    response = test_client.get("/api/v1/products", params={"limit": 100000})
+    assert response.status_code == 422
+
+
+def test_export_products_ndjson(test_client, db):
+    """
+    Test that the NDJSON export streams one product per line.
+    """
+    db.add_all([Product(product_name=f"Export {i}", product_amount=5 + i) for i in range(3)])
+    db.commit()
+
+    response = test_client.get("/api/v1/products/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["product_name"] for line in lines] == ["Export 0", "Export 1", "Export 2"]
+    assert set(lines[0]) == {"product_id", "product_name", "product_amount"}
+
+
+def test_export_products_json_array(test_client, db):
+    """
+    Test that the JSON export produces a single valid array.
+    """
+    db.add_all([Product(product_name=f"Array {i}", product_amount=1 + i) for i in range(2)])
+    db.commit()
+
+    response = test_client.get("/api/v1/products/export", params={"format": "json"})
+    assert response.status_code == 200
+    assert [row["product_amount"] for row in response.json()] == [1, 2]
+
+    assert test_client.get("/api/v1/products/export", params={"format": "csv"}).status_code == 422
+
+
+def test_get_product_conditional_requests(test_client, db):
+    """
+    Test that a product detail is answered with 304 while the client's ETag is current.
+    """
+    product = Product(product_name="Conditional", product_amount=42)
+    db.add(product)
+    db.commit()
+
+    response = test_client.get(f"/api/v1/products/{product.product_id}")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "last-modified" in response.headers
+
+    response = test_client.get(f"/api/v1/products/{product.product_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+
+def test_list_products_etag_changes_with_collection(test_client, db):
+    """
+    Test that the collection ETag changes when a product is added.
+    """
+    db.add(Product(product_name="First", product_amount=1))
+    db.commit()
+    etag = test_client.get("/api/v1/products").headers["etag"]
+
+    assert test_client.get("/api/v1/products", headers={"If-None-Match": etag}).status_code == 304
+    assert test_client.get("/api/v1/products", params={"limit": 5}, headers={"If-None-Match": etag}).status_code == 200
+
+    db.add(Product(product_name="Second", product_amount=2))
+    db.commit()
+    assert test_client.get("/api/v1/products", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_list_products_etag_changes_on_delete(test_client, db, sign_in):
+    """
+    Test that the collection ETag changes when a product is deleted, even though no remaining row changed.
+    """
+    first = Product(product_name="First", product_amount=1)
+    second = Product(product_name="Second", product_amount=2)
+    db.add_all([first, second])
+    db.commit()
+    etag = test_client.get("/api/v1/products").headers["etag"]
+
+    sign_in()
+    assert test_client.delete(f"/api/v1/products/{first.product_id}").status_code == 200
+    assert test_client.get("/api/v1/products", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_batch_create_products(test_client, db, sign_in):
+    """
+    Test that a batch reports one result per item, as JSON array or NDJSON.
+    """
+    sign_in()
+    response = test_client.post("/api/v1/products/batch", json=[
+        {"product_name": "Batch One", "product_amount": 1},
+        {"product_name": "Batch Two"},
+    ])
+    ndjson = test_client.post(
+        "/api/v1/products/batch",
+        content=b'{"product_name": "Batch One", "product_amount": 1}\n{"product_name": "Batch Three", "product_amount": 3}\n',
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    malformed = test_client.post("/api/v1/products/batch", content=b"{", headers={"Content-Type": "application/json"})
+
+    body = response.json()
+    assert (body["created"], body["failed"]) == (1, 1)
+    assert [result["status"] for result in body["results"]] == ["created", "failed"]
+    assert "product_amount" in body["results"][1]["error"]
+
+    assert [result["status"] for result in ndjson.json()["results"]] == ["failed", "created"]
+    assert malformed.status_code == 400
+
+
+def test_upsert_product_by_name(test_client, db, sign_in):
+    """
+    Test that PUT by name creates the product once and updates it afterwards.
+    """
+    sign_in()
+    created = test_client.put("/api/v1/products/by-name/Upserted", json={"product_amount": 10})
+    updated = test_client.put("/api/v1/products/by-name/Upserted", json={"product_amount": 20})
+    bulk = test_client.put("/api/v1/products/by-name", json=[
+        {"product_name": "Upserted", "product_amount": 20},
+        {"product_name": "Another", "product_amount": 1},
+    ])
+
+    assert created.status_code == 201
+    assert updated.status_code == 200
+    assert updated.json()["product_id"] == created.json()["product_id"]
+    assert updated.json()["product_amount"] == 20
+    assert [result["status"] for result in bulk.json()["results"]] == ["unchanged", "created"]
+
+
+def test_batch_update_products(test_client, db, sign_in):
+    """
+    Test that a batch update reprices the listed products and reports rejected items.
+    """
+    products = [Product(product_name=f"Priced {i}", product_amount=10) for i in range(2)]
+    db.add_all(products)
+    db.commit()
+    ids = [product.product_id for product in products]
+    assert test_client.get(f"/api/v1/products/{ids[0]}").json()["product_amount"] == 10
+
+    sign_in()
+    response = test_client.patch("/api/v1/products/batch", json=[
+        {"product_id": ids[0], "product_amount": 12.5},
+        {"product_id": ids[1], "product_amount": -1},
+        {"product_id": 999999, "product_amount": 5},
+        {"product_id": ids[1], "product_amount": 15},
+    ])
+
+    body = response.json()
+    assert (body["updated"], body["failed"]) == (2, 2)
+    assert [result["status"] for result in body["results"]] == ["updated", "failed", "failed", "updated"]
+    assert body["results"][2]["error"] == "Product with ID 999999 not found"
+    assert test_client.get(f"/api/v1/products/{ids[0]}").json()["product_amount"] == 12.5
+    assert test_client.get(f"/api/v1/products/{ids[1]}").json()["product_amount"] == 15
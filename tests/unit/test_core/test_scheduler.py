@@ -0,0 +1,26 @@
+import asyncio
+import pytest
+from app.core.scheduler import PeriodicJob
+
+
+@pytest.mark.asyncio
+async def test_periodic_job_runs_until_stopped():
+    """
+    Test that the job runs repeatedly, survives failures and stops cleanly.
+    """
+    calls = []
+
+    def work():
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("first run fails")
+
+    job = PeriodicJob("test-job", work, interval_seconds=0.01)
+    job.start()
+    await asyncio.sleep(0.2)
+    await job.stop()
+    runs = len(calls)
+    await asyncio.sleep(0.05)
+
+    assert runs >= 2
+    assert len(calls) == runs
@@ -0,0 +1,124 @@
+import pytest
+from fastapi import HTTPException
+from app.db.dependency import get_current_user, get_current_user_model, principal_cache
+from app.models.role import Role
+from app.models.role_permission import RolePermission
+from app.models.user import User
+from app.schemas.principal import Principal
+from app.services.role_permission_service import RolePermissionService
+from app.services.token_service import revocation_list
+from app.services.user_role_permission_service import UserRolePermissionService
+from app.services.user_service import UserService
+from app.utils.revocation_utils import token_digest
+from app.utils.token_utils import create_access_token
+
+
+@pytest.fixture
+def access_token(db):
+    """
+    Creates a user with a role and returns an access token for them.
+    """
+    principal_cache.clear()
+    revocation_list.reset()
+    user = User(email="principal@example.com", hashed_password="hashed123", first_name="Prin", last_name="Cipal")
+    role = Role(name="admin")
+    db.add_all([user, role])
+    db.commit()
+    db.add(RolePermission(user_id=user.id, role_id=role.id))
+    db.commit()
+    yield create_access_token({"sub": "principal@example.com"})
+    principal_cache.clear()
+
+
+def test_get_current_user_returns_cached_principal(db, access_token, record_statements):
+    """
+    Test that the principal is loaded once and then served from the cache.
+    """
+    with record_statements() as statements:
+        principal = get_current_user(token=access_token, db=db)
+        queries_after_first_call = len(statements)
+        cached_principal = get_current_user(token=access_token, db=db)
+
+    assert isinstance(principal, Principal)
+    assert principal.email == "principal@example.com"
+    assert len(principal.role_ids) == 1
+    assert principal.is_admin is True
+    assert cached_principal is principal
+    assert principal_cache.get(token_digest(access_token)) is principal
+    assert principal_cache.get(access_token) is None
+    assert len(statements) == queries_after_first_call
+
+
+def test_principal_without_admin_role_is_not_admin(db):
+    """
+    Test that only the role named ADMIN_ROLE_NAME grants admin access.
+    """
+    principal_cache.clear()
+    user = User(email="editor@example.com", hashed_password="hashed123", first_name="Ed", last_name="Itor")
+    role = Role(name="editor")
+    db.add_all([user, role])
+    db.commit()
+    db.add(RolePermission(user_id=user.id, role_id=role.id))
+    db.commit()
+
+    principal = get_current_user(token=create_access_token({"sub": "editor@example.com"}), db=db)
+    principal_cache.clear()
+
+    assert principal.role_ids == (role.id,)
+    assert principal.is_admin is False
+
+
+def test_get_current_user_unknown_email(db):
+    """
+    Test that a valid token for a missing user is rejected.
+    """
+    principal_cache.clear()
+    token = create_access_token({"sub": "missing@example.com"})
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_current_user(token=token, db=db)
+
+    assert exc_info.value.status_code == 401
+
+
+def test_get_current_user_model_loads_full_user(db, access_token):
+    """
+    Test that the full User can be requested for the principal.
+    """
+    principal = get_current_user(token=access_token, db=db)
+
+    user = get_current_user_model(current_user=principal, db=db)
+
+    assert isinstance(user, User)
+    assert user.id == principal.id
+
+
+def test_deleting_user_evicts_cached_principal(db, access_token):
+    """
+    Test that a deleted user's token stops resolving instead of serving the cached principal.
+    """
+    principal = get_current_user(token=access_token, db=db)
+    db.query(RolePermission).filter_by(user_id=principal.id).delete()
+    db.commit()
+
+    UserService(db).delete_user_by_id(principal.id)
+
+    with pytest.raises(HTTPException) as exc_info:
+        get_current_user(token=access_token, db=db)
+    assert exc_info.value.status_code == 401
+
+
+def test_role_changes_evict_cached_principal(db, access_token):
+    """
+    Test that assigning a role reloads the principal with the new role ids.
+    """
+    principal = get_current_user(token=access_token, db=db)
+    editor = Role(name="editor")
+    db.add(editor)
+    db.commit()
+
+    UserRolePermissionService(db, RolePermissionService(db)).assign_role_to_user(principal.id, editor.id)
+
+    reloaded = get_current_user(token=access_token, db=db)
+    assert reloaded is not principal
+    assert editor.id in reloaded.role_ids
@@ -0,0 +1,53 @@
+from sqlalchemy import create_engine, text
+from app.db.pool_stats import InstrumentedQueuePool, PoolStats
+
+
+class FakePool:
+    def size(self):
+        return 5
+
+    def checkedout(self):
+        return 2
+
+    def checkedin(self):
+        return 3
+
+    def overflow(self):
+        return -3
+
+
+def test_observe_wait_fills_histogram_buckets():
+    """
+    Test that wait times land in the first bucket whose bound covers them.
+    """
+    stats = PoolStats(buckets=(0.01, 0.1, float("inf")))
+
+    stats.observe_wait(0.005)
+    stats.observe_wait(0.05)
+    stats.observe_wait(2.0)
+    stats.record_timeout()
+
+    snapshot = stats.snapshot(FakePool())
+
+    assert snapshot["checkouts"] == 3
+    assert snapshot["timeouts"] == 1
+    assert snapshot["checked_out"] == 2
+    assert snapshot["wait_time"]["max_seconds"] == 2.0
+    assert snapshot["wait_time"]["buckets"] == {"0.01": 1, "0.1": 1, "+Inf": 1}
+
+
+def test_instrumented_pool_records_checkouts():
+    """
+    Test that checkouts from the instrumented pool are recorded.
+    """
+    engine = create_engine("sqlite://", poolclass=InstrumentedQueuePool)
+    InstrumentedQueuePool.stats.reset()
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert engine.pool.stats.snapshot(engine.pool)["checked_out"] == 1
+
+    snapshot = engine.pool.stats.snapshot(engine.pool)
+    assert snapshot["checkouts"] == 1
+    assert snapshot["checked_out"] == 0
+    engine.dispose()
@@ -0,0 +1,51 @@
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import text
+from app.models.product import Product
+from app.models.service import Service
+from app.models.user import User
+from app.services.product_service import PRODUCT_SORT_FIELDS
+from app.services.service_service import SERVICE_SORT_FIELDS
+from app.services.user_service import USER_SORT_FIELDS
+
+
+def test_timestamps_are_set_per_row(db):
+    """
+    Test that created_at/updated_at reflect each row's write time, not the import time.
+    """
+    before = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1)
+    product = Product(product_name="Timestamped", product_amount=10)
+    db.add(product)
+    db.commit()
+
+    assert product.created_at >= before
+    created_at, updated_at = product.created_at, product.updated_at
+
+    product.product_amount = 20
+    db.commit()
+    assert product.updated_at > updated_at
+    assert product.created_at == created_at
+
+
+def test_server_default_fills_timestamps(db):
+    """
+    Test that rows inserted without the ORM defaults still get timestamps from the database.
+    """
+    before = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=1)
+    db.execute(text("INSERT INTO products (product_name, product_amount) VALUES ('Raw insert', 5)"))
+    db.commit()
+
+    row = db.query(Product).filter_by(product_name="Raw insert").one()
+    assert row.created_at >= before
+
+
+def test_every_sort_field_is_indexed():
+    """
+    Test that each advertised sort field leads an index in (field, primary key) order,
+    or is unique, so paging never sorts the whole table.
+    """
+    for model, fields in ((Product, PRODUCT_SORT_FIELDS), (Service, SERVICE_SORT_FIELDS), (User, USER_SORT_FIELDS)):
+        table = model.__table__
+        pk = table.primary_key.columns[0].name
+        indexed = {tuple(column.name for column in index.columns) for index in table.indexes}
+        for field in fields:
+            assert field == pk or table.c[field].unique or (field, pk) in indexed, (table.name, field)
@@ -0,0 +1,55 @@
+from datetime import datetime, timedelta, timezone
+import pytest
+from pydantic import ValidationError
+from app.schemas.job_history import JobHistoryCreate, JobHistoryUpdate
+
+
+def make_job(**overrides):
+    values = {
+        "user_id": 1,
+        "location": "Remote",
+        "description": "Engineer",
+        "is_active": True,
+        "start_date": datetime(2022, 1, 1),
+    }
+    return JobHistoryCreate(**{**values, **overrides})
+
+
+def test_active_job_cannot_have_end_date():
+    """
+    Test that the end date check sees the already-validated is_active value.
+    """
+    with pytest.raises(ValidationError, match="An active job can't have an end date."):
+        make_job(end_date=datetime(2022, 6, 1))
+
+
+def test_inactive_job_with_end_date_is_valid():
+    """
+    Test that an inactive job with an end date passes validation.
+    """
+    job = make_job(is_active=False, end_date=datetime(2022, 6, 1))
+
+    assert job.end_date == datetime(2022, 6, 1)
+
+
+def test_start_date_without_offset_is_treated_as_utc():
+    """
+    Test that naive start dates are taken as UTC and future dates are rejected.
+    """
+    assert make_job().start_date == datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+    with pytest.raises(ValidationError, match="Start date cannot be in the future."):
+        make_job(start_date=datetime.now(timezone.utc) + timedelta(days=1))
+
+
+def test_update_fields_are_optional():
+    """
+    Test that a partial update only needs the fields being changed.
+    """
+    update = JobHistoryUpdate(location="Office", is_active=False, end_date=datetime(2023, 1, 1))
+
+    assert update.model_dump(exclude_unset=True) == {
+        "location": "Office", "is_active": False, "end_date": datetime(2023, 1, 1)
+    }
+    with pytest.raises(ValidationError, match="An inactive job must have an end date."):
+        JobHistoryUpdate(is_active=False, end_date=None)
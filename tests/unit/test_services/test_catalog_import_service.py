@@ -0,0 +1,40 @@
+import io
+from app.models.service import Service
+from app.services.catalog_import_service import CatalogImportService, read_records
+
+
+def test_import_validates_copies_and_merges(db):
+    """
+    Test that valid rows are loaded, invalid ones reported and existing names updated.
+    """
+    db.add(Service(service_name="Hosting", total_amount=10))
+    db.commit()
+    ndjson = io.StringIO(
+        '{"service_name": "Hosting", "total_amount": 12}\n'
+        '{"service_name": "SEO, local", "total_amount": 5}\n'
+        '{"service_name": "SEO, local", "total_amount": 6}\n'
+        '{"service_name": "Free", "total_amount": 0}\n'
+        'not json\n'
+    )
+    progress = []
+
+    stats = CatalogImportService(db).import_records(
+        "services", read_records(ndjson, "ndjson"), batch_size=2, progress=progress.append
+    )
+
+    assert (stats["read"], stats["loaded"], stats["rejected"]) == (5, 3, 2)
+    assert (stats["inserted"], stats["updated"]) == (1, 1)
+    assert [error["line"] for error in stats["errors"]] == [4, 5]
+    assert len(progress) == 2
+    db.expire_all()
+    assert {service.service_name: service.total_amount for service in db.query(Service)} == {
+        "Hosting": 12, "SEO, local": 6,
+    }
+
+
+def test_read_records_parses_csv_with_line_numbers():
+    """
+    Test that CSV records are keyed by the header row.
+    """
+    records = list(read_records(io.StringIO("service_name,total_amount\nHosting,10\n"), "csv"))
+    assert records == [(2, {"service_name": "Hosting", "total_amount": "10"})]
@@ -0,0 +1,133 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+from app.core.config import config
+from app.models.product import Product
+from app.models.tombstone import Tombstone
+from app.services.change_feed_service import ChangeFeedService
+from app.services.product_service import ProductService
+from app.utils.pagination_utils import decode_cursor, encode_cursor
+
+
+def test_changes_are_returned_once_in_order(db):
+    """
+    Test that following the watermark returns every upsert and deletion exactly once.
+    """
+    db.add_all([Product(product_name=f"Feed {i}", product_amount=1 + i) for i in range(3)])
+    db.commit()
+    feed = ChangeFeedService(db)
+
+    first = feed.get_changes("products", limit=2)
+    assert [change["data"]["product_name"] for change in first["changes"]] == ["Feed 0", "Feed 1"]
+    assert first["has_more"] is True
+
+    deleted_id = first["changes"][0]["id"]
+    ProductService(db).delete_product(deleted_id)
+
+    second = feed.get_changes("products", first["watermark"], limit=10)
+    assert [(change["op"], change["id"]) for change in second["changes"]] == [
+        ("upsert", first["changes"][1]["id"] + 1),
+        ("delete", deleted_id),
+    ]
+    assert second["has_more"] is False
+
+    assert feed.get_changes("products", second["watermark"])["changes"] == []
+
+
+def test_updates_reappear_after_watermark(db):
+    """
+    Test that a row updated after being synced is returned again.
+    """
+    product = Product(product_name="Updated", product_amount=1)
+    db.add(product)
+    db.commit()
+    feed = ChangeFeedService(db)
+    watermark = feed.get_changes("products")["watermark"]
+
+    product.product_amount = 2
+    db.commit()
+
+    changes = feed.get_changes("products", watermark)["changes"]
+    assert [change["data"]["product_amount"] for change in changes] == [2]
+
+
+def test_changes_wait_for_older_open_transactions(db):
+    """
+    Test that a long transaction that commits after a newer one is not skipped by the watermark.
+    """
+    long_running = Session(db.get_bind())
+    try:
+        long_running.add(Product(product_name="Long transaction", product_amount=1))
+        long_running.flush()
+        db.add(Product(product_name="Short transaction", product_amount=2))
+        db.commit()
+        feed = ChangeFeedService(db)
+
+        held_back = feed.get_changes("products")
+        assert held_back["changes"] == []
+
+        long_running.commit()
+        db.commit()  # Start a new snapshot
+        changes = feed.get_changes("products", held_back["watermark"])["changes"]
+        assert [change["data"]["product_name"] for change in changes] == ["Long transaction", "Short transaction"]
+    finally:
+        long_running.close()
+
+
+def test_orm_deletes_write_tombstones(db):
+    """
+    Test that a row deleted through the session, not the service, is reported as deleted.
+    """
+    product = Product(product_name="Deleted directly", product_amount=1)
+    db.add(product)
+    db.commit()
+    feed = ChangeFeedService(db)
+    watermark = feed.get_changes("products")["watermark"]
+
+    db.delete(product)
+    db.commit()
+
+    changes = feed.get_changes("products", watermark)["changes"]
+    assert [(change["op"], change["id"]) for change in changes] == [("delete", product.product_id)]
+
+
+def test_expired_watermark_is_rejected(db):
+    """
+    Test that a watermark older than its TTL asks the client to sync again.
+    """
+    state = decode_cursor(ChangeFeedService(db).get_changes("products")["watermark"])
+    issued_at = datetime.now(timezone.utc) - timedelta(seconds=config.CHANGE_FEED_WATERMARK_TTL_SECONDS + 1)
+    watermark = encode_cursor({**state, "issued_at": issued_at.isoformat()})
+
+    with pytest.raises(HTTPException) as exc_info:
+        ChangeFeedService(db).get_changes("products", watermark)
+    assert exc_info.value.status_code == 410
+
+
+def test_delete_expired_tombstones(db):
+    """
+    Test that only tombstones past their retention are deleted.
+    """
+    expired = datetime.now(timezone.utc) - timedelta(seconds=config.TOMBSTONE_RETENTION_SECONDS + 60)
+    db.add_all([
+        Tombstone(entity="products", entity_id=1, updated_at=expired),
+        Tombstone(entity="products", entity_id=2, updated_at=expired),
+        Tombstone(entity="products", entity_id=3),
+    ])
+    db.commit()
+
+    assert ChangeFeedService(db).delete_expired_tombstones(batch_size=1) == 2
+    assert [tombstone.entity_id for tombstone in db.query(Tombstone)] == [3]
+
+
+def test_watermark_of_another_entity_is_rejected(db):
+    """
+    Test that a watermark cannot be reused across entities.
+    """
+    feed = ChangeFeedService(db)
+    watermark = feed.get_changes("products")["watermark"]
+
+    with pytest.raises(HTTPException) as exc_info:
+        feed.get_changes("services", watermark)
+    assert exc_info.value.status_code == 400
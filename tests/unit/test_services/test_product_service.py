@@ -0,0 +1,71 @@
+import pytest
+from fastapi import HTTPException
+from app.schemas.product import ProductCreate, ProductUpdate
+from app.services.catalog_cache import catalog_cache, product_key
+from app.services.product_service import ProductService
+
+
+def test_get_product_by_id_is_read_through(db):
+    """
+    Test that a product lookup is served from the cache after the first read.
+    """
+    product_service = ProductService(db)
+    product = product_service.create_product(ProductCreate(product_name="Smartphone", product_amount=699.99))
+
+    first = product_service.get_product_by_id(product.product_id)
+    hits = catalog_cache.stats()["hits"]
+    second = product_service.get_product_by_id(product.product_id)
+
+    assert first["product_name"] == second["product_name"] == "Smartphone"
+    assert catalog_cache.stats()["hits"] == hits + 1
+
+
+def test_product_writes_invalidate_cache(db):
+    """
+    Test that updates and deletes drop the cached product.
+    """
+    product_service = ProductService(db)
+    product = product_service.create_product(ProductCreate(product_name="Laptop", product_amount=1199.99))
+    product_service.get_product_by_id(product.product_id)
+
+    product_service.update_product(product.product_id, ProductUpdate(product_amount=999.99))
+    assert product_service.get_product_by_id(product.product_id)["product_amount"] == 999.99
+
+    product_service.delete_product(product.product_id)
+    assert catalog_cache.get(product_key(product.product_id)) is None
+    with pytest.raises(HTTPException) as exc_info:
+        product_service.get_product_by_id(product.product_id)
+    assert exc_info.value.status_code == 404
+
+
+def test_product_cache_is_invalidated_after_commit(db):
+    """
+    Test that an update inside a transaction keeps the cached product until the commit,
+    so a read in between can't re-cache the row as it was before the commit.
+    """
+    product_service = ProductService(db)
+    product = product_service.create_product(ProductCreate(product_name="Tablet", product_amount=499.99))
+    product_service.get_product_by_id(product.product_id)
+
+    with product_service.transaction():
+        product_service.update_product(product.product_id, ProductUpdate(product_amount=449.99))
+        assert catalog_cache.get(product_key(product.product_id))["product_amount"] == 499.99
+
+    assert catalog_cache.get(product_key(product.product_id)) is None
+    assert product_service.get_product_by_id(product.product_id)["product_amount"] == 449.99
+
+
+def test_product_cache_is_kept_when_the_transaction_rolls_back(db):
+    """
+    Test that invalidations queued in a transaction are dropped when it rolls back.
+    """
+    product_service = ProductService(db)
+    product = product_service.create_product(ProductCreate(product_name="Monitor", product_amount=249.99))
+    product_service.get_product_by_id(product.product_id)
+
+    with pytest.raises(RuntimeError):
+        with product_service.transaction():
+            product_service.update_product(product.product_id, ProductUpdate(product_amount=199.99))
+            raise RuntimeError("abort")
+
+    assert catalog_cache.get(product_key(product.product_id))["product_amount"] == 249.99
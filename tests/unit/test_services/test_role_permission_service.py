@@ -0,0 +1,79 @@
+import pytest
+from app.models.permission import Permission
+from app.models.role import Role
+from app.models.role_permission import RolePermission
+from app.models.user import User
+from app.services.permission_cache import permission_cache, role_key, user_key
+from app.services.role_permission_service import RolePermissionService
+
+
+@pytest.fixture
+def role_setup(db):
+    """
+    Creates two roles sharing a user, with distinct permission sets.
+    """
+    user = User(email="perm_user@example.com", hashed_password="hashed123", first_name="Perm", last_name="User")
+    other_user = User(email="perm_other@example.com", hashed_password="hashed123", first_name="Other", last_name="User")
+    admin = Role(name="admin")
+    editor = Role(name="editor")
+    read = Permission(name="read_data")
+    write = Permission(name="write_data")
+    delete = Permission(name="delete_data")
+    db.add_all([user, other_user, admin, editor, read, write, delete])
+    db.commit()
+
+    db.add_all([
+        RolePermission(user_id=user.id, role_id=admin.id, permission_id=read.id),
+        RolePermission(user_id=user.id, role_id=admin.id, permission_id=write.id),
+        RolePermission(user_id=other_user.id, role_id=admin.id, permission_id=write.id),
+        RolePermission(user_id=user.id, role_id=editor.id, permission_id=delete.id),
+    ])
+    db.commit()
+    return admin, editor
+
+
+def test_get_permissions_for_role(db, role_setup):
+    """
+    Test that only the role's permissions are returned, without duplicates.
+    """
+    admin, editor = role_setup
+    service = RolePermissionService(db)
+
+    admin_permissions = service.get_permissions_for_role(admin.id)
+    editor_permissions = service.get_permissions_for_role(editor.id)
+
+    assert sorted(p.name for p in admin_permissions) == ["read_data", "write_data"]
+    assert [p.name for p in editor_permissions] == ["delete_data"]
+
+
+def test_get_permissions_for_unknown_role(db, role_setup):
+    """
+    Test that a role without mappings has no permissions.
+    """
+    service = RolePermissionService(db)
+
+    assert service.get_permissions_for_role(9999) == []
+
+
+def test_delete_role_permission_invalidates_cache(db, role_setup):
+    """
+    Test that deleting a mapping drops the cached role and user permissions.
+    """
+    admin, editor = role_setup
+    service = RolePermissionService(db)
+    user = db.query(User).filter_by(email="perm_other@example.com").first()
+    read = db.query(Permission).filter_by(name="read_data").first()
+
+    permission_cache.set(role_key(admin.id), ["stale"])
+    permission_cache.set(role_key(editor.id), ["editor"])
+    permission_cache.set(user_key(user.id, "permissions"), ["stale"])
+
+    role_permission = RolePermission(user_id=user.id, role_id=admin.id, permission_id=read.id)
+    db.add(role_permission)
+    db.commit()
+    service.delete_role_permission(role_permission.id)
+
+    assert permission_cache.get(role_key(admin.id)) is None
+    assert permission_cache.get(user_key(user.id, "permissions")) is None
+    assert permission_cache.get(role_key(editor.id)) == ["editor"]
+    permission_cache.clear()
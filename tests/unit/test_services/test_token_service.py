@@ -0,0 +1,119 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from fastapi import HTTPException
+from app.models.token import Token
+from app.models.user import User
+from app.services.token_service import TokenService, revocation_list, token_purge_stats
+
+
+@pytest.fixture
+def token_service(db):
+    """
+    Provides a TokenService with an empty revocation list.
+    """
+    revocation_list.reset()
+    yield TokenService(db)
+    revocation_list.reset()
+
+
+@pytest.fixture
+def sample_user(db):
+    user = User(email="token_user@example.com", hashed_password="hashed123", first_name="Token", last_name="User")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    return user
+
+
+def test_validate_access_token_skips_database_between_refreshes(db, token_service, sample_user, record_statements):
+    """
+    Test that validation only queries the database when the revocation list is refreshed.
+    """
+    token = token_service.create_token(user_id=sample_user.id, payload={"sub": "token_user@example.com"})
+    access_token = token.token
+
+    with record_statements() as statements:
+        assert token_service.validate_access_token(access_token)["sub"] == "token_user@example.com"
+        queries_after_first_check = len(statements)
+        token_service.validate_access_token(access_token)
+
+    assert queries_after_first_check == 1
+    assert len(statements) == queries_after_first_check
+
+
+def test_blacklisted_token_is_rejected(db, token_service, sample_user):
+    """
+    Test that a blacklisted token fails validation.
+    """
+    token = token_service.create_token(user_id=sample_user.id, payload={"sub": sample_user.email})
+    token_service.blacklist_token(token.token)
+
+    with pytest.raises(HTTPException, match="Token is blacklisted"):
+        token_service.validate_access_token(token.token)
+
+
+def test_revocations_are_loaded_from_database(db, token_service, sample_user):
+    """
+    Test that tokens blacklisted elsewhere are picked up on refresh.
+    """
+    token = token_service.create_token(user_id=sample_user.id, payload={"sub": sample_user.email})
+    token.is_blacklisted = True
+    db.commit()
+
+    with pytest.raises(HTTPException, match="Token is blacklisted"):
+        token_service.validate_access_token(token.token)
+
+
+def test_delete_expired_tokens_in_batches(db, token_service, sample_user):
+    """
+    Test that only tokens with an expired refresh token are purged, across several batches.
+    """
+    now = datetime.now(timezone.utc)
+    Token._skip_validation = True
+    try:
+        tokens = [
+            Token(
+                token=f"access{i}",
+                refresh_token=f"refresh{i}",
+                user_id=sample_user.id,
+                expires_at=now - timedelta(days=8),
+                refresh_expires_at=now - timedelta(days=1),
+            )
+            for i in range(5)
+        ]
+        tokens.append(Token(
+            token="access-live-refresh",
+            refresh_token="refresh-live",
+            user_id=sample_user.id,
+            expires_at=now - timedelta(minutes=5),
+            refresh_expires_at=now + timedelta(days=1),
+        ))
+        db.add_all(tokens)
+        db.commit()
+    finally:
+        Token._skip_validation = False
+
+    runs_before = token_purge_stats.snapshot()["runs"]
+    deleted = token_service.delete_expired_tokens(batch_size=2)
+
+    assert deleted == 5
+    assert [token.token for token in db.query(Token).all()] == ["access-live-refresh"]
+    stats = token_purge_stats.snapshot()
+    assert stats["runs"] == runs_before + 1
+    assert stats["last_rows_deleted"] == 5
+
+
+def test_refresh_revocation_list_is_incremental(db, token_service, sample_user, record_statements):
+    """
+    Test that reloads after the first only read tokens changed since the previous load.
+    """
+    token_service.refresh_revocation_list(force=True)
+    token = token_service.create_token(user_id=sample_user.id, payload={"sub": sample_user.email})
+    token.is_blacklisted = True
+    db.commit()
+
+    with record_statements() as statements:
+        token_service.refresh_revocation_list(force=True)
+
+    assert "updated_at >=" in statements[0]
+    assert revocation_list.contains(token.token)
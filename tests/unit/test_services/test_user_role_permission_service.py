@@ -0,0 +1,77 @@
+import pytest
+from fastapi import HTTPException
+from app.models.permission import Permission
+from app.models.role import Role
+from app.models.role_permission import RolePermission
+from app.models.user import User
+from app.services.permission_cache import permission_cache, user_key
+from app.services.role_permission_service import RolePermissionService
+from app.services.user_role_permission_service import UserRolePermissionService
+
+
+@pytest.fixture
+def service(db):
+    service = UserRolePermissionService(db, RolePermissionService(db))
+    yield service
+    permission_cache.clear()
+
+
+@pytest.fixture
+def user_with_roles(db):
+    """
+    Creates a user holding an admin role (read, write) and an editor role (write).
+    """
+    user = User(email="roles_user@example.com", hashed_password="hashed123", first_name="Roles", last_name="User")
+    admin = Role(name="admin")
+    editor = Role(name="editor")
+    viewer = Role(name="viewer")
+    read = Permission(name="read_data")
+    write = Permission(name="write_data")
+    db.add_all([user, admin, editor, viewer, read, write])
+    db.commit()
+    db.add_all([
+        RolePermission(user_id=user.id, role_id=admin.id, permission_id=read.id),
+        RolePermission(user_id=user.id, role_id=admin.id, permission_id=write.id),
+        RolePermission(user_id=user.id, role_id=editor.id, permission_id=write.id),
+    ])
+    db.commit()
+    return user, admin, editor, viewer
+
+
+def test_get_user_permissions_merges_roles_and_is_cached(db, service, user_with_roles):
+    """
+    Test that a user's permissions combine all their roles and a second call is served from the cache.
+    """
+    user, admin, editor, _ = user_with_roles
+
+    permissions = service.get_user_permissions(user.id)
+    assert sorted(p["name"] for p in permissions) == ["read_data", "write_data"]
+    assert service.get_user_role(user.id).id == admin.id
+    assert set(service.get_user_role_permissions(user.id)) == {"admin", "editor"}
+
+    # A change made behind the service's back is not seen until the entry is invalidated
+    db.query(RolePermission).filter_by(role_id=editor.id).delete()
+    db.commit()
+    assert set(service.get_user_role_permissions(user.id)) == {"admin", "editor"}
+    assert permission_cache.get(user_key(user.id, "permissions")) == permissions
+
+
+def test_assign_and_remove_role_invalidate_user_permissions(db, service, user_with_roles):
+    """
+    Test that assigning and removing roles drops the user's cached permissions.
+    """
+    user, admin, _, viewer = user_with_roles
+    service.get_user_role_permissions(user.id)
+
+    service.assign_role_to_user(user.id, viewer.id)
+    assert permission_cache.get(user_key(user.id, "role_permissions")) is None
+    assert set(service.get_user_role_permissions(user.id)) == {"admin", "editor", "viewer"}
+
+    with pytest.raises(HTTPException, match="already has role"):
+        service.assign_role_to_user(user.id, admin.id)
+
+    service.remove_role_from_user(user.id)
+    assert permission_cache.get(user_key(user.id, "role_permissions")) is None
+    assert service.get_user_role(user.id) is None
+    with pytest.raises(HTTPException, match="has no assigned role"):
+        service.get_user_permissions(user.id)
@@ -0,0 +1,25 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+from app.models.user import User
+from app.services.user_service import UserService
+
+
+def make_user(email: str, **fields) -> User:
+    return User(email=email, hashed_password="hashed", first_name="Unit", last_name="Test", **fields)
+
+
+def test_create_user_reraises_integrity_errors_other_than_duplicate_email(db):
+    """
+    Test that only email index violations become "Email already registered".
+    """
+    existing = make_user("existing@example.com")
+    db.add(existing)
+    db.commit()
+    existing_id = existing.id
+    db.expunge_all()
+
+    with pytest.raises(IntegrityError) as exc_info:
+        UserService(db)._create_user_with_token(make_user("new@example.com", id=existing_id))
+    assert exc_info.value.orig.diag.constraint_name == "users_pkey"
+    db.rollback()
+    assert db.query(User).count() == 1
@@ -0,0 +1,119 @@
+from app.utils.cache_utils import LocalSharedCache, TTLCache
+
+
+class FakeTimer:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_counts_hits_and_misses():
+    """
+    Test that lookups are counted as hits or misses.
+    """
+    cache = TTLCache(max_size=10, ttl=60)
+
+    assert cache.get("missing") is None
+    cache.set("key", [])
+    assert cache.get("key", "default") == []
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_entries_expire_after_ttl():
+    """
+    Test that entries are no longer returned once their TTL has passed.
+    """
+    timer = FakeTimer()
+    cache = TTLCache(max_size=10, ttl=30, timer=timer)
+    cache.set("key", "value")
+
+    timer.now = 29
+    assert cache.get("key") == "value"
+    timer.now = 31
+    assert cache.get("key") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    """
+    Test that the least recently used entry is evicted when the cache is full.
+    """
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_get_or_set_only_loads_on_miss():
+    """
+    Test that the loader is only called when the key is not cached.
+    """
+    cache = TTLCache(max_size=10, ttl=60)
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return "loaded"
+
+    assert cache.get_or_set("key", loader) == "loaded"
+    assert cache.get_or_set("key", loader) == "loaded"
+    assert len(calls) == 1
+
+
+def test_delete_where_removes_matching_keys():
+    """
+    Test that delete_where only removes keys matching the predicate.
+    """
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set(("user", 1), "a")
+    cache.set(("user", 2), "b")
+    cache.set(("role", 1), "c")
+
+    cache.delete_where(lambda key: key[0] == "user")
+
+    assert cache.get(("user", 1)) is None
+    assert cache.get(("user", 2)) is None
+    assert cache.get(("role", 1)) == "c"
+
+
+def test_local_shared_cache_returns_copies():
+    """
+    Test that the shared cache stand-in stores serialized copies of values.
+    """
+    cache = LocalSharedCache(max_size=10, ttl=60)
+    value = {"product_name": "Smartphone"}
+
+    cache.set("product:1", value)
+    value["product_name"] = "Changed"
+    cached = cache.get("product:1")
+
+    assert cached == {"product_name": "Smartphone"}
+    assert cached is not cache.get("product:1")
+    assert cache.stats()["hits"] == 2
+
+
+def test_local_shared_cache_expires_and_evicts():
+    """
+    Test that the shared cache stand-in honours its TTL and size limit.
+    """
+    timer = FakeTimer()
+    cache = LocalSharedCache(max_size=2, ttl=10, timer=timer)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+    assert cache.get("a") is None
+
+    timer.now = 11
+    assert cache.get_or_set("b", lambda: "reloaded") == "reloaded"
@@ -0,0 +1,35 @@
+from datetime import datetime
+from starlette.requests import Request
+from app.utils.conditional_utils import http_date, is_not_modified, make_etag
+
+
+def make_request(headers: dict) -> Request:
+    return Request({
+        "type": "http",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+    })
+
+
+def test_if_none_match_uses_weak_comparison():
+    """
+    Test that If-None-Match matches weak and strong forms of the ETag, or '*'.
+    """
+    etag = make_etag("product", 1, datetime(2024, 1, 1))
+    strong = etag.removeprefix("W/")
+
+    assert is_not_modified(make_request({"If-None-Match": f'"other", {strong}'}), etag, None)
+    assert is_not_modified(make_request({"If-None-Match": "*"}), etag, None)
+    assert not is_not_modified(make_request({"If-None-Match": '"other"'}), etag, None)
+
+
+def test_if_modified_since_compares_at_second_resolution():
+    """
+    Test that If-Modified-Since ignores sub-second differences and is overridden by If-None-Match.
+    """
+    last_modified = datetime(2024, 1, 1, 12, 0, 0, 500000)
+    since = http_date(datetime(2024, 1, 1, 12, 0, 0))
+
+    assert is_not_modified(make_request({"If-Modified-Since": since}), "etag", last_modified)
+    assert not is_not_modified(make_request({"If-Modified-Since": http_date(datetime(2023, 1, 1))}), "etag", last_modified)
+    assert not is_not_modified(make_request({"If-Modified-Since": since, "If-None-Match": '"x"'}), "etag", last_modified)
+    assert not is_not_modified(make_request({"If-Modified-Since": "garbage"}), "etag", last_modified)
@@ -1,6 +1,11 @@
+from datetime import datetime, timezone
 import pytest
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
 from fastapi import HTTPException
+from app.models.job_history import JobHistory
+from app.models.product import Product
 from app.models.user import User
 from app.utils.database_utils import DatabaseUtils
 
@@ -50,6 +55,50 @@ def test_commit_and_refresh(db):
     assert updated_user.first_name == "Updated"
 
 
+def test_add_and_commit_populates_generated_values_without_select(db, record_statements):
+    """
+    Test that add_and_commit fills the id and timestamps from RETURNING instead of a refresh.
+    """
+    db_utils = DatabaseUtils(db)
+    with record_statements() as statements:
+        product = db_utils.add_and_commit(Product(product_name="Returning product", product_amount=3))
+        values = (product.product_id, product.created_at, product.updated_at)
+
+    assert all(value is not None for value in values)
+    assert [s.split()[0] for s in statements] == ["INSERT"]
+    assert "RETURNING" in statements[0]
+
+
+def test_add_and_commit_refresh_reloads_row(db, record_statements):
+    """
+    Test that refresh=True keeps the previous commit-then-SELECT behaviour.
+    """
+    db_utils = DatabaseUtils(db)
+    with record_statements() as statements:
+        product = db_utils.add_and_commit(Product(product_name="Refreshed product", product_amount=3), refresh=True)
+
+    assert [s.split()[0] for s in statements] == ["INSERT", "SELECT"]
+    assert product.product_name == "Refreshed product"
+
+
+def test_commit_and_refresh_skips_select_by_default(db, record_statements):
+    """
+    Test that commit_and_refresh returns the updated instance without reloading it.
+    """
+    db_utils = DatabaseUtils(db)
+    product = db_utils.add_and_commit(Product(product_name="Updated product", product_amount=3))
+    created_updated_at = product.updated_at
+
+    with record_statements() as statements:
+        product.product_amount = 5
+        product = db_utils.commit_and_refresh(product)
+        values = (product.product_amount, product.updated_at)
+
+    assert [s.split()[0] for s in statements] == ["UPDATE"]
+    assert values[0] == 5
+    assert values[1] >= created_updated_at
+
+
 def test_get_by_id_success(db):
     """
     Test the get_by_id method with a valid ID.
@@ -177,3 +226,380 @@ def test_bulk_update(db):
     assert updated_users[0].first_name == "UpdatedFirst"
     assert updated_users[1].first_name == "UpdatedSecond"
     assert updated_users[1].is_active is True
+
+
+def test_bulk_update_rows_reports_failures_without_aborting(db):
+    """
+    Test that invalid rows are reported while valid rows are still updated.
+    """
+    db_utils = DatabaseUtils(db)
+
+    users = [
+        User(email=f"rows{i}@example.com", hashed_password="hashed_password", first_name="Row", last_name="User")
+        for i in range(3)
+    ]
+    db_utils.add_all_and_commit(users)
+    ids = [user.id for user in users]
+
+    result = db_utils.bulk_update_rows(User, [
+        {"id": ids[0], "first_name": "Updated"},
+        {"id": ids[1], "last_name": "Changed", "is_active": True},
+        {"id": 999999, "first_name": "Missing"},
+        {"first_name": "NoId"},
+        {"id": ids[2], "first_name": "Invalid1"},
+        {"id": ids[2], "nickname": "Unknown"},
+    ])
+
+    assert result["updated"] == [ids[0], ids[1]]
+    assert [failure["index"] for failure in result["failed"]] == [2, 3, 4, 5]
+    assert result["failed"][0]["error"] == "User with ID 999999 not found"
+    assert "alphabetic" in result["failed"][2]["error"]
+
+    db.expire_all()
+    assert db.get(User, ids[0]).first_name == "Updated"
+    assert db.get(User, ids[1]).last_name == "Changed"
+    assert db.get(User, ids[2]).first_name == "Row"
+
+
+def test_bulk_update_rows_reports_type_and_database_errors_per_row(db):
+    """
+    Test that wrongly typed values and rows rejected by the database fail alone.
+    """
+    db_utils = DatabaseUtils(db)
+    products = [Product(product_name=f"Typed {i}", product_amount=1) for i in range(3)]
+    db_utils.add_all_and_commit(products)
+    ids = [product.product_id for product in products]
+
+    result = db_utils.bulk_update_rows(Product, [
+        {"product_id": ids[0], "product_amount": "abc"},
+        {"product_id": ids[0], "product_name": 123},
+        {"product_id": "x", "product_amount": 2},
+        {"product_id": ids[1], "product_name": "Typed 2"},
+        {"product_id": ids[2], "product_amount": "7.5"},
+        {"product_id": ids[0], "product_name": "Renamed"},
+    ])
+
+    assert result["updated"] == [ids[2], ids[0]]
+    assert [failure["index"] for failure in result["failed"]] == [0, 1, 2, 3]
+    assert result["failed"][0]["error"].startswith("Invalid value for product_amount")
+    assert result["failed"][1]["error"].startswith("Invalid value for product_name")
+    assert result["failed"][2]["error"].startswith("Invalid value for product_id")
+    assert "duplicate key" in result["failed"][3]["error"]
+
+    db.expire_all()
+    assert db.get(Product, ids[2]).product_amount == 7.5
+    assert db.get(Product, ids[0]).product_name == "Renamed"
+    assert db.get(Product, ids[1]).product_name == "Typed 1"
+
+
+def test_bulk_update_rows_validates_against_stored_record(db):
+    """
+    Test that cross-field validators compare a partial update with the stored values.
+    """
+    db_utils = DatabaseUtils(db)
+    user = User(email="history_rows@example.com", hashed_password="hashed_password", first_name="Job", last_name="User")
+    db_utils.add_and_commit(user)
+    job = JobHistory(
+        user_id=user.id, location="Remote", description="Engineer", is_active=True,
+        start_date=datetime(2022, 1, 1, tzinfo=timezone.utc),
+    )
+    db_utils.add_and_commit(job)
+
+    result = db_utils.bulk_update_rows(JobHistory, [
+        {"id": job.id, "end_date": datetime(2021, 1, 1, tzinfo=timezone.utc)},
+        {"id": job.id, "is_active": False, "end_date": datetime(2023, 1, 1, tzinfo=timezone.utc)},
+    ])
+
+    assert result["updated"] == [job.id]
+    assert result["failed"][0]["error"] == "end_date must be after start_date"
+
+
+def test_bulk_update_rows_sends_one_statement_per_column_group(db, record_statements):
+    """
+    Test that rows setting the same columns are written by a single UPDATE ... FROM (VALUES ...),
+    and that a rejected row is isolated without retrying every row on its own.
+    """
+    db_utils = DatabaseUtils(db)
+    products = [Product(product_name=f"Grouped {i}", product_amount=1) for i in range(4)]
+    db_utils.add_all_and_commit(products)
+    ids = [product.product_id for product in products]
+
+    with record_statements() as statements:
+        result = db_utils.bulk_update_rows(Product, [
+            {"product_id": id, "product_amount": 10 + i} for i, id in enumerate(ids)
+        ])
+    assert result == {"updated": ids, "failed": []}
+    updates = [s for s in statements if s.startswith("UPDATE")]
+    assert len(updates) == 1
+    assert "FROM (VALUES" in updates[0]
+
+    with record_statements() as statements:
+        result = db_utils.bulk_update_rows(Product, [
+            {"product_id": ids[0], "product_name": "Renamed 0"},
+            {"product_id": ids[1], "product_name": "Renamed 1"},
+            {"product_id": ids[2], "product_name": "Grouped 3"},
+            {"product_id": ids[3], "product_name": "Renamed 3"},
+        ])
+    assert result["updated"] == [ids[0], ids[1], ids[3]]
+    assert [failure["index"] for failure in result["failed"]] == [2]
+    assert len([s for s in statements if s.startswith("UPDATE")]) == 5
+
+    db.expire_all()
+    assert [db.get(Product, id).product_amount for id in ids] == [10, 11, 12, 13]
+
+
+def test_bulk_update_rows_applies_repeated_ids_in_order(db):
+    """
+    Test that the last row for an ID wins, as if the rows were applied one by one.
+    """
+    db_utils = DatabaseUtils(db)
+    product = Product(product_name="Repeated", product_amount=1)
+    db_utils.add_and_commit(product)
+
+    result = db_utils.bulk_update_rows(Product, [
+        {"product_id": product.product_id, "product_amount": 2},
+        {"product_id": product.product_id, "product_amount": 3},
+    ])
+
+    assert result == {"updated": [product.product_id], "failed": []}
+    db.expire_all()
+    assert db.get(Product, product.product_id).product_amount == 3
+
+
+def test_bulk_update_rows_returning(db):
+    """
+    Test that updated instances are returned when requested.
+    """
+    db_utils = DatabaseUtils(db)
+
+    user = User(email="returning@example.com", hashed_password="hashed_password", first_name="Before", last_name="User")
+    db_utils.add_and_commit(user)
+
+    result = db_utils.bulk_update_rows(User, [{"id": user.id, "first_name": "After"}], returning=True)
+
+    assert [updated.first_name for updated in result["updated"]] == ["After"]
+    assert result["failed"] == []
+
+
+def test_get_page_walks_all_rows_with_cursor(db):
+    """
+    Test that following next_cursor visits every row exactly once, in order.
+    """
+    db_utils = DatabaseUtils(db)
+    db_utils.add_all_and_commit([
+        User(email=f"page{i}@example.com", hashed_password="hashed_password", first_name="Page", last_name="User")
+        for i in range(5)
+    ])
+
+    seen, cursor = [], None
+    while True:
+        users, cursor = db_utils.get_page(User, 2, cursor=cursor)
+        seen.extend(user.email for user in users)
+        if cursor is None:
+            break
+
+    assert seen == [f"page{i}@example.com" for i in range(5)]
+
+
+def test_get_page_descending_sort(db):
+    """
+    Test keyset pagination on a descending, non-unique sort field.
+    """
+    db_utils = DatabaseUtils(db)
+    db_utils.add_all_and_commit([
+        User(email=f"sort{i}@example.com", hashed_password="hashed_password", first_name="Sort", last_name=last_name)
+        for i, last_name in enumerate(["Alpha", "Bravo", "Bravo", "Charlie"])
+    ])
+
+    first, cursor = db_utils.get_page(User, 2, sort="-last_name", allowed_sorts=("last_name",))
+    second, cursor = db_utils.get_page(User, 2, cursor=cursor, sort="-last_name", allowed_sorts=("last_name",))
+
+    assert [user.last_name for user in first + second] == ["Charlie", "Bravo", "Bravo", "Alpha"]
+    assert len({user.id for user in first + second}) == 4
+    assert cursor is None
+
+
+def test_get_page_rejects_invalid_input(db):
+    """
+    Test that unknown sort fields and malformed or mismatched cursors raise 400.
+    """
+    db_utils = DatabaseUtils(db)
+    db_utils.add_all_and_commit([
+        User(email=f"bad{i}@example.com", hashed_password="hashed_password", first_name="Bad", last_name="Cursor")
+        for i in range(2)
+    ])
+    _, cursor = db_utils.get_page(User, 1)
+
+    for kwargs in ({"sort": "hashed_password"}, {"cursor": "not-a-cursor"}, {"cursor": cursor, "sort": "email"}):
+        with pytest.raises(HTTPException) as exc_info:
+            db_utils.get_page(User, 1, allowed_sorts=("email",), **kwargs)
+        assert exc_info.value.status_code == 400
+
+
+def test_stream_rows_yields_selected_columns(db):
+    """
+    Test that stream_rows yields dicts of the requested columns in primary key order.
+    """
+    db_utils = DatabaseUtils(db)
+    db_utils.add_all_and_commit([
+        User(email=f"stream{i}@example.com", hashed_password="hashed_password", first_name="Stream", last_name="User")
+        for i in range(3)
+    ])
+
+    rows = list(db_utils.stream_rows(User, ["id", "email"], batch_size=2))
+
+    assert [row["email"] for row in rows] == [f"stream{i}@example.com" for i in range(3)]
+    assert set(rows[0]) == {"id", "email"}
+
+
+def test_bulk_insert_rows_reports_failures_without_aborting(db):
+    """
+    Test that invalid, duplicate and existing rows are skipped while the rest are inserted.
+    """
+    db_utils = DatabaseUtils(db)
+    db_utils.add_and_commit(Product(product_name="Existing", product_amount=1))
+
+    result = db_utils.bulk_insert_rows(Product, [
+        {"product_name": "New One", "product_amount": 2},
+        {"product_name": "Existing", "product_amount": 3},
+        {"product_name": "  New Two ", "product_amount": 4},
+        {"product_name": "New One", "product_amount": 5},
+        {"product_name": "Bad", "product_amount": -1},
+        {"product_name": "Unknown", "product_amount": 1, "colour": "red"},
+    ], unique_column="product_name", chunk_size=1)
+
+    assert [created["index"] for created in result["created"]] == [0, 2]
+    assert [failure["index"] for failure in result["failed"]] == [1, 3, 4, 5]
+    assert "already exists" in result["failed"][0]["error"]
+    assert "Duplicate" in result["failed"][1]["error"]
+    names = {product.product_name for product in db.query(Product).all()}
+    assert names == {"Existing", "New One", "New Two"}
+
+
+def test_bulk_upsert_rows_creates_updates_and_skips_unchanged(db):
+    """
+    Test that rows are matched on the unique column and only changed rows are updated.
+    """
+    db_utils = DatabaseUtils(db)
+    db_utils.add_all_and_commit([
+        Product(product_name="Keep", product_amount=1),
+        Product(product_name="Change", product_amount=2),
+    ])
+    kept_updated_at = db.query(Product).filter_by(product_name="Keep").one().updated_at
+
+    result = db_utils.bulk_upsert_rows(Product, [
+        {"product_name": "Keep", "product_amount": 1},
+        {"product_name": "Change", "product_amount": 3},
+        {"product_name": "Fresh", "product_amount": 4},
+        {"product_name": "Fresh", "product_amount": 5},
+        {"product_name": "No", "product_amount": 1},
+    ], unique_column="product_name")
+
+    assert [(r["index"], r["status"]) for r in result["upserted"]] == [
+        (0, "unchanged"), (1, "updated"), (2, "created"), (3, "created"),
+    ]
+    assert result["upserted"][2]["id"] == result["upserted"][3]["id"]
+    assert [failure["index"] for failure in result["failed"]] == [4]
+
+    db.expire_all()
+    amounts = {product.product_name: product.product_amount for product in db.query(Product)}
+    assert amounts == {"Keep": 1, "Change": 3, "Fresh": 5}
+    assert db.query(Product).filter_by(product_name="Keep").one().updated_at == kept_updated_at
+
+
+def test_get_page_returns_only_selected_columns(db):
+    """
+    Test that column pages are plain dicts of the requested columns, not tracked instances.
+    """
+    db_utils = DatabaseUtils(db)
+    db_utils.add_all_and_commit([
+        User(email=f"project{i}@example.com", hashed_password="secret", first_name="Project", last_name=last_name)
+        for i, last_name in enumerate(["Bravo", "Alpha", "Charlie"])
+    ])
+    db.expunge_all()
+
+    rows, _ = db_utils.get_page(User, 10, filters={"last_name": "Alpha"}, columns=["id", "email"])
+    assert rows == [{"id": rows[0]["id"], "email": "project1@example.com"}]
+
+    first, cursor = db_utils.get_page(User, 2, sort="last_name", allowed_sorts=("last_name",), columns=["email"])
+    second, cursor = db_utils.get_page(User, 2, cursor=cursor, sort="last_name", allowed_sorts=("last_name",), columns=["email"])
+    assert [row["email"] for row in first + second] == [f"project{i}@example.com" for i in (1, 0, 2)]
+    assert "hashed_password" not in first[0]
+    assert cursor is None
+    assert len(db.identity_map) == 0
+
+
+def test_transaction_commits_once_for_all_writes(db):
+    """
+    Test that writes inside a transaction block share a single commit.
+    """
+    db_utils = DatabaseUtils(db)
+    commits = []
+    listener = lambda session: commits.append(session)
+    event.listen(db, "after_commit", listener)
+    try:
+        with db_utils.transaction():
+            first = db_utils.add_and_commit(Product(product_name="Unit of work 1", product_amount=1))
+            db_utils.add_and_commit(Product(product_name="Unit of work 2", product_amount=2))
+            assert first.product_id is not None
+            assert commits == []
+    finally:
+        event.remove(db, "after_commit", listener)
+
+    assert len(commits) == 1
+    assert db.query(Product).count() == 2
+
+
+def test_transaction_rolls_back_every_write_on_error(db):
+    """
+    Test that an error inside a transaction block undoes the writes already made in it.
+    """
+    db_utils = DatabaseUtils(db)
+
+    with pytest.raises(IntegrityError):
+        with db_utils.transaction():
+            db_utils.add_and_commit(Product(product_name="Rolled back", product_amount=1))
+            db_utils.add_and_commit(Product(product_name="Rolled back", product_amount=2))
+
+    assert not db_utils.in_transaction
+    assert db.query(Product).count() == 0
+
+
+def test_transaction_savepoint_keeps_outer_writes(db):
+    """
+    Test that a failed savepoint block only undoes its own writes.
+    """
+    db_utils = DatabaseUtils(db)
+
+    with db_utils.transaction():
+        db_utils.add_and_commit(Product(product_name="Outer", product_amount=1))
+        with pytest.raises(ValueError):
+            with db_utils.transaction(savepoint=True):
+                db_utils.add_and_commit(Product(product_name="Inner", product_amount=2))
+                raise ValueError("abort inner block")
+        db_utils.add_and_commit(Product(product_name="After", product_amount=3))
+
+    assert sorted(name for (name,) in db.query(Product.product_name)) == ["After", "Outer"]
+
+
+def test_get_version_changes_when_an_older_transaction_commits_late(db):
+    """
+    Test that a write stamped before the current version still changes it when it commits later.
+    """
+    db_utils = DatabaseUtils(db)
+    late = Session(db.get_bind())
+    try:
+        late.add(Product(product_name="Stamped first", product_amount=1))
+        late.flush()
+        db_utils.add_and_commit(Product(product_name="Committed first", product_amount=2))
+        db.commit()
+        last_modified, version = db_utils.get_version(Product)
+
+        late.commit()
+        db.commit()  # Start a new snapshot
+        late_modified, late_version = db_utils.get_version(Product)
+    finally:
+        late.close()
+
+    assert late_modified == last_modified
+    assert late_version != version
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta, timezone
+from app.utils.revocation_utils import RevocationList
+
+
+def test_add_and_contains():
+    """
+    Test that added tokens are reported as revoked.
+    """
+    revocations = RevocationList(refresh_interval=30)
+    revocations.add("token-a", datetime.now(timezone.utc) + timedelta(minutes=5))
+
+    assert revocations.contains("token-a")
+    assert not revocations.contains("token-b")
+
+
+def test_merge_drops_expired_entries():
+    """
+    Test that merging keeps unexpired tokens, including naive UTC datetimes from the database.
+    """
+    revocations = RevocationList(refresh_interval=30)
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    revocations.merge([
+        ("live", now + timedelta(minutes=5)),
+        ("expired", now - timedelta(minutes=5)),
+    ])
+
+    assert revocations.contains("live")
+    assert not revocations.contains("expired")
+    assert len(revocations) == 1
+
+
+def test_claim_refresh_once_per_interval():
+    """
+    Test that only one caller is allowed to refresh per interval.
+    """
+    clock = {"now": 100.0}
+    revocations = RevocationList(refresh_interval=30, timer=lambda: clock["now"])
+
+    assert revocations.claim_refresh() is True
+    assert revocations.claim_refresh() is False
+    clock["now"] = 131.0
+    assert revocations.claim_refresh() is True
+
+
+def test_merge_moves_watermark_back_by_overlap():
+    """
+    Test that the first load is a full load and later loads start at the previous load minus the overlap.
+    """
+    revocations = RevocationList(refresh_interval=30, overlap=60)
+    loaded_at = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+    assert revocations.since() is None
+    revocations.merge([], loaded_at=loaded_at)
+    assert revocations.since() == loaded_at - timedelta(seconds=60)
+
+    revocations.reset()
+    assert revocations.since() is None
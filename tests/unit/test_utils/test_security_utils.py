@@ -0,0 +1,61 @@
+import asyncio
+import threading
+import pytest
+from fastapi import HTTPException
+from app.utils import security_utils
+from app.utils.security_utils import hash_password_async, verify_password, verify_password_async
+
+
+@pytest.mark.asyncio
+async def test_hash_and_verify_password_async():
+    """
+    Test that passwords hashed on the worker pool verify correctly.
+    """
+    hashed = await hash_password_async("securepassword")
+
+    assert hashed != "securepassword"
+    assert verify_password("securepassword", hashed)
+    assert await verify_password_async("securepassword", hashed) is True
+    assert await verify_password_async("wrongpassword", hashed) is False
+
+
+@pytest.mark.asyncio
+async def test_hash_password_async_rejects_when_pool_is_full(monkeypatch):
+    """
+    Test that a full worker pool and queue produces a 503 instead of queueing forever.
+    """
+    monkeypatch.setattr(security_utils, "password_slots", threading.BoundedSemaphore(1))
+    security_utils.password_slots.acquire()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hash_password_async("securepassword")
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "1"}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_request_keeps_slot_until_job_finishes(monkeypatch):
+    """
+    Test that cancelling a caller does not free its slot while the hashing job is still running.
+    """
+    monkeypatch.setattr(security_utils, "password_slots", threading.BoundedSemaphore(1))
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash(password):
+        started.set()
+        release.wait(5)
+        return password
+
+    task = asyncio.create_task(security_utils._run_password_task(slow_hash, "securepassword"))
+    await asyncio.to_thread(started.wait, 5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    with pytest.raises(HTTPException) as exc_info:
+        await hash_password_async("securepassword")
+    assert exc_info.value.status_code == 503
+
+    release.set()
+    assert await asyncio.to_thread(security_utils.password_slots.acquire, timeout=5)
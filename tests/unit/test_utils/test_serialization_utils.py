@@ -0,0 +1,32 @@
+import json
+from datetime import datetime
+from app.models.product import Product
+from app.schemas.product import ProductResponse
+from app.schemas.user import UserResponse
+from app.utils.serialization_utils import dump_row, dump_rows, json_response
+
+
+def test_dump_row_matches_response_model():
+    """
+    Test that the fast path produces the same JSON as validating through the schema.
+    """
+    product = Product(product_id=1, product_name="Smartphone", product_amount=699.99)
+
+    fast = json.loads(json_response(dump_row(ProductResponse, product)).body)
+    validated = ProductResponse.model_validate(product).model_dump(mode="json")
+
+    assert fast == validated
+
+
+def test_dump_rows_accepts_mappings_and_drops_extra_fields():
+    """
+    Test that rows given as mappings only keep the schema's fields.
+    """
+    created = datetime(2024, 1, 1, 12, 0)
+    rows = dump_rows(UserResponse, [{
+        "id": 1, "email": "row@example.com", "first_name": "Row", "last_name": "User",
+        "created_at": created, "updated_at": created, "hashed_password": "secret",
+    }])
+
+    assert "hashed_password" not in rows[0]
+    assert json.loads(json_response(rows).body)[0]["created_at"] == "2024-01-01T12:00:00"